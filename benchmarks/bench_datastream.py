@@ -0,0 +1,70 @@
+"""Micro-benchmark for ISO 8211 delimiter scanning.
+
+Compares DataStream.seek (native bytes.find) against the previous per-byte Python loop, both on the raw
+variable-length subfield reads and on a full parse of a cell.
+
+    python benchmarks/bench_datastream.py [path/to/cell.000] [repeats]
+"""
+import pathlib
+import sys
+import timeit
+
+PROJECT_PATH = pathlib.Path(__file__).parent.parent
+sys.path.append(str(PROJECT_PATH / 'src'))
+
+from navchart.s57 import iso8211  # noqa: E402
+
+DEFAULT_CELL = PROJECT_PATH / "tests" / "s57s" / "US2AK5FM" / "US2AK5FM.000"
+
+
+class LinearScanStream(iso8211.DataStream):
+    """DataStream with the original one-index-at-a-time delimiter scan."""
+
+    def seek(self, byte, start_at=None, end_at=None):
+        if start_at is None:
+            start_at = self.index
+        if end_at is None or end_at > self.end:
+            end_at = self.end
+        for i in range(start_at, end_at):
+            if self.data[i] == byte:
+                return i
+        return None
+
+
+def scan_subfields(stream_cls, buffer):
+    stream = stream_cls(buffer)
+    count = 0
+    while not stream.empty():
+        stream.read(iso8211.DataStream.TO_FTUT)
+        count += 1
+    return count
+
+
+def parse_cell(stream_cls, buffer):
+    original = iso8211.DataStream
+    iso8211.DataStream = stream_cls
+    try:
+        return len(iso8211.DataFile.from_buffer(buffer))
+    finally:
+        iso8211.DataStream = original
+
+
+def main():
+    path = pathlib.Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CELL
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    buffer = path.read_bytes()
+    print("{} ({} bytes)".format(path.name, len(buffer)))
+    for label, func in (("subfield scan", scan_subfields), ("full parse", parse_cell)):
+        results = {}
+        for stream_cls in (LinearScanStream, iso8211.DataStream):
+            results[stream_cls.__name__] = min(timeit.repeat(lambda: func(stream_cls, buffer), number=1, repeat=repeats))
+        print("{:<14} linear: {:8.3f}s  find: {:8.3f}s  speedup: {:5.1f}x".format(
+            label,
+            results[LinearScanStream.__name__],
+            results[iso8211.DataStream.__name__],
+            results[LinearScanStream.__name__] / results[iso8211.DataStream.__name__]
+        ))
+
+
+if __name__ == "__main__":
+    main()
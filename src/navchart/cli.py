@@ -0,0 +1,250 @@
+"""Command line interface, run with ``python -m navchart``."""
+import argparse
+import concurrent.futures
+import logging
+import os
+import sys
+from pathlib import Path
+
+from .s57 import S57Cell, NumericMode
+from .s57.catalog import S57Catalog
+from .s57.discovery import ExchangeSet, CATALOG_FILE
+from .s57.iso8211 import DataFile
+from .s57.spatial import geometry_bounds
+
+
+# Output file suffix for each export format
+EXPORT_FORMATS = {
+    "ndjson": ".ndjson",
+    "geojsonseq": ".geojsons",
+    "wkb": ".wkb.tsv",
+    "wkt": ".wkt.tsv",
+    "parquet": "",
+}
+
+
+def find_cells(paths):
+    """Expand cell files, CATALOG.031 files and directories (ENC_ROOT or any folder of cells) into a list of
+    (base cell path, update paths) pairs.
+
+    Directories and catalogs are indexed with an ExchangeSet. The update paths are None for cell files given
+    directly, which find their own updates.
+    """
+    cells = {}
+    for path in paths:
+        path = Path(path)
+        if path.is_dir() or path.name.upper() == CATALOG_FILE:
+            exchange_set = ExchangeSet.scan(path if path.is_dir() else path.parent)
+            for name in exchange_set.cell_names():
+                cells[exchange_set.base_cells[name]] = exchange_set.update_paths(name)
+        else:
+            cells.setdefault(path, None)
+    return list(cells.items())
+
+
+def _catalog_paths(paths):
+    catalogs = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir() and (path / CATALOG_FILE).exists():
+            catalogs.append(path / CATALOG_FILE)
+        elif path.name.upper() == CATALOG_FILE:
+            catalogs.append(path)
+    return catalogs
+
+
+def run_tasks(task, arguments, workers=1):
+    """Call task on each tuple of arguments, in worker processes if workers is more than 1, and yield the results in
+    order."""
+    if workers is not None and workers <= 1:
+        for args in arguments:
+            yield task(*args)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(task, *zip(*arguments)) if arguments else ()
+
+
+def _open_cell(path, update_paths, numeric_mode, cache):
+    return S57Cell(Path(path), numeric_mode=numeric_mode, cache=cache, update_paths=update_paths)
+
+
+def dump_file(path, limit=None):
+    lines = ["# {}".format(path)]
+    with DataFile.from_file(path) as data_file:
+        for index, record in enumerate(data_file):
+            if limit is not None and index >= limit:
+                break
+            lines.append("Record {}".format(index))
+            for tag in record:
+                lines.append("  {}: {}".format(tag, record[tag].data))
+    return "\n".join(lines)
+
+
+def cell_info(path, update_paths, numeric_mode, cache):
+    cell = _open_cell(path, update_paths, numeric_mode, cache)
+    count = 0
+    extent = None
+    for feature in cell.features():
+        count += 1
+        bounds = geometry_bounds(feature.geometry)
+        if bounds is None:
+            continue
+        if extent is None:
+            extent = bounds
+        else:
+            extent = (
+                min(extent[0], bounds[0]), min(extent[1], bounds[1]),
+                max(extent[2], bounds[2]), max(extent[3], bounds[3])
+            )
+    lines = [
+        "# {}".format(path),
+        "Edition: {}".format(cell.edition_no),
+        "Update: {}".format(cell.metadata["DSID"]["UPDN"]),
+        "Issue date: {}".format(cell.metadata["DSID"]["ISDT"]),
+        "Update application date: {}".format(cell.metadata["DSID"]["UADT"]),
+        "Features: {}".format(count),
+        "Layers: {}".format(", ".join(sorted(cell.layers()))),
+    ]
+    if extent is not None:
+        if cell.numeric_mode is NumericMode.INT:
+            # Geometries hold the raw integers, the extent is shown in degrees
+            extent = tuple(b / float(cell.multiplication_factors[0]) for b in extent)
+        lines.append("Extent: {} {} {} {}".format(*extent))
+    return "\n".join(lines)
+
+
+def export_cell(path, update_paths, numeric_mode, cache, output_format, output_dir, layers):
+    cell = _open_cell(path, update_paths, numeric_mode, cache)
+    target = Path(output_dir) / (cell.path.stem + EXPORT_FORMATS[output_format])
+    if output_format == "parquet":
+        paths = cell.to_geoparquet(target, object_types=layers)
+        return "{}: {} layers".format(target, len(paths))
+    if output_format in ("ndjson", "geojsonseq"):
+        count = cell.export_geojson(target, output_format == "geojsonseq", layers)
+    else:
+        count = cell.export(target, output_format, layers)
+    return "{}: {} features".format(target, count)
+
+
+def validate_cell(path, update_paths, numeric_mode, cache):
+    """Load a cell and build every feature geometry, returning the problems found."""
+    problems = []
+    try:
+        cell = _open_cell(path, update_paths, numeric_mode, cache)
+        for feature in cell.features():
+            try:
+                feature.geometry
+            except (KeyError, ValueError) as ex:
+                problems.append("{}: {}: {}".format(feature.identifier, type(ex).__name__, ex))
+    except Exception as ex:
+        problems.append("Unable to load: {}: {}".format(type(ex).__name__, ex))
+    return str(path), problems
+
+
+def _print_results(results):
+    for result in results:
+        print(result)
+        print()
+
+
+def _dump(args):
+    paths = []
+    for path in args.paths:
+        if Path(path).is_dir():
+            paths.extend(cell_path for cell_path, _ in find_cells([path]))
+        else:
+            paths.append(Path(path))
+    _print_results(run_tasks(dump_file, [(path, args.limit) for path in paths], args.workers))
+    return 0
+
+
+def _info(args):
+    arguments = [(path, updates, args.numeric_mode, args.cache) for path, updates in find_cells(args.paths)]
+    _print_results(run_tasks(cell_info, arguments, args.workers))
+    return 0
+
+
+def _export(args):
+    os.makedirs(args.output, exist_ok=True)
+    layers = args.layers.split(",") if args.layers else None
+    arguments = [
+        (path, updates, args.numeric_mode, args.cache, args.format, args.output, layers)
+        for path, updates in find_cells(args.paths)
+    ]
+    for result in run_tasks(export_cell, arguments, args.workers):
+        print(result)
+    return 0
+
+
+def _validate(args):
+    failed = 0
+    for catalog_path in _catalog_paths(args.paths):
+        result = S57Catalog().from_file(catalog_path).verify(workers=args.workers)
+        for entry, expected, actual in result.mismatches:
+            print("{}: CRC mismatch (catalog {}, file {})".format(entry.path, expected, actual))
+        for entry in result.missing:
+            print("{}: missing".format(entry.path))
+        print("{}: {}".format(catalog_path, result))
+        failed += len(result.mismatches) + len(result.missing)
+    arguments = [(path, updates, args.numeric_mode, args.cache) for path, updates in find_cells(args.paths)]
+    for path, problems in run_tasks(validate_cell, arguments, args.workers):
+        if problems:
+            failed += 1
+            print("{}: {} problems".format(path, len(problems)))
+            for problem in problems:
+                print("  {}".format(problem))
+        else:
+            print("{}: OK".format(path))
+    return 1 if failed else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="navchart", description="Read, inspect and convert S-57 ENC cells.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log warnings from the parser")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs="+", help="cell files, CATALOG.031 files or directories to search for cells")
+    common.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes, 0 for one per CPU (default: 1)"
+    )
+    # Options for the commands that load cells, dump only reads the ISO 8211 records
+    loading = argparse.ArgumentParser(add_help=False, parents=[common])
+    loading.add_argument("--cache", default=None, help="directory for the cache of loaded cells")
+    loading.add_argument(
+        "--numeric-mode",
+        default=NumericMode.FLOAT.value,
+        choices=[mode.value for mode in NumericMode],
+        help="representation of coordinates while processing (default: float)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dump = commands.add_parser("dump", parents=[common], help="print the records and fields of ISO 8211 files")
+    dump.add_argument("--limit", type=int, default=None, help="maximum number of records per file")
+    dump.set_defaults(handler=_dump)
+
+    info = commands.add_parser("info", parents=[loading], help="print the edition, update and extent of cells")
+    info.set_defaults(handler=_info)
+
+    export = commands.add_parser("export", parents=[loading], help="export the features of cells")
+    export.add_argument("--format", default="ndjson", choices=list(EXPORT_FORMATS), help="output format")
+    export.add_argument("--output", required=True, help="output directory, one file (or folder) per cell")
+    export.add_argument("--layers", default=None, help="comma separated layers to export (default: all)")
+    export.set_defaults(handler=_export)
+
+    validate = commands.add_parser("validate", parents=[loading], help="check catalog CRCs and feature geometries")
+    validate.set_defaults(handler=_validate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.verbose else logging.ERROR)
+    if args.workers is not None and args.workers < 1:
+        args.workers = os.cpu_count()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1 @@
-from .s57 import S57Standard, S57Cell, S57Feature, S57Geometry
\ No newline at end of file
+from .s57 import S57Standard, S57Cell, S57Feature, S57Geometry, NumericMode, load_cells
\ No newline at end of file
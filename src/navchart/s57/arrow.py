@@ -0,0 +1,151 @@
+import json
+import os
+from pathlib import Path
+
+from .export import geometry_to_wkb
+
+
+GEOPARQUET_VERSION = "1.0.0"
+
+# Rows per record batch and per Parquet row group
+DEFAULT_BATCH_SIZE = 65536
+
+
+def _require_pyarrow():
+    # Imported on first use, pyarrow takes longer to import than the rest of the package
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow is required for Arrow and GeoParquet export")
+    return pyarrow
+
+
+def _to_int(value):
+    return int(value)
+
+
+def _to_float(value):
+    return float(value)
+
+
+def _to_int_list(value):
+    return [int(item) for item in value.split(",") if item]
+
+
+# Arrow type and converter for each attribute type code of s57attributes.csv
+_ATTRIBUTE_CONVERTERS = {
+    "E": ("int32", _to_int),
+    "I": ("int32", _to_int),
+    "F": ("float64", _to_float),
+    "L": ("list<int32>", _to_int_list),
+    "A": ("string", str),
+    "S": ("string", str),
+}
+
+
+def _arrow_type(pyarrow, name):
+    if name == "list<int32>":
+        return pyarrow.list_(pyarrow.int32())
+    return pyarrow.type_for_alias(name)
+
+
+def _convert(value, converter):
+    # Empty values mean the attribute is present but unknown, bad values are dropped rather than failing the export
+    if value is None or value == "":
+        return None
+    try:
+        return converter(value)
+    except ValueError:
+        return None
+
+
+def layer_schema(standard, attribute_names):
+    """Build the schema of a layer table: identifier, the typed attribute columns and a WKB geometry column."""
+    pyarrow = _require_pyarrow()
+    fields = [pyarrow.field("identifier", pyarrow.string(), nullable=False)]
+    for name in attribute_names:
+        type_name, _ = _ATTRIBUTE_CONVERTERS.get(standard.attribute_type(name), _ATTRIBUTE_CONVERTERS["S"])
+        fields.append(pyarrow.field(name, _arrow_type(pyarrow, type_name)))
+    fields.append(pyarrow.field("geometry", pyarrow.binary()))
+    geo = {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": "geometry",
+        # No crs member means OGC:CRS84, which is what S-57 coordinates are in
+        "columns": {"geometry": {"encoding": "WKB", "geometry_types": []}},
+    }
+    return pyarrow.schema(fields, metadata={b"geo": json.dumps(geo).encode("utf-8")})
+
+
+def layer_batches(features, schema, standard, factors=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield record batches of at most batch_size features following a schema from layer_schema()."""
+    pyarrow = _require_pyarrow()
+    attribute_names = schema.names[1:-1]
+    converters = [
+        _ATTRIBUTE_CONVERTERS.get(standard.attribute_type(name), _ATTRIBUTE_CONVERTERS["S"])[1]
+        for name in attribute_names
+    ]
+    columns = None
+    count = 0
+    for feature in features:
+        if columns is None:
+            columns = [[] for _ in schema.names]
+        columns[0].append(feature.identifier)
+        attributes = feature.attributes
+        for i, name in enumerate(attribute_names):
+            columns[i + 1].append(_convert(attributes.get(name), converters[i]))
+        columns[-1].append(geometry_to_wkb(feature.geometry, factors))
+        count += 1
+        if count >= batch_size:
+            yield pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+            columns = None
+            count = 0
+    if columns is not None:
+        yield pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _layer_attributes(features):
+    names = {}
+    for feature in features:
+        for name in feature.attributes:
+            names[name] = None
+    return sorted(names)
+
+
+def cell_layers(cell, factors=None, batch_size=DEFAULT_BATCH_SIZE, object_types=None):
+    """Yield (layer, schema, batches) for each layer of a cell (or only the given ones), with the batches as a
+    generator."""
+    _require_pyarrow()
+    for layer in sorted(cell.layers()):
+        if object_types is not None and layer not in object_types:
+            continue
+        schema = layer_schema(cell.standard, _layer_attributes(cell.features(layer)))
+        yield layer, schema, layer_batches(cell.features(layer), schema, cell.standard, factors, batch_size)
+
+
+def to_arrow(cell, factors=None, batch_size=DEFAULT_BATCH_SIZE, object_types=None):
+    """Return a dict of layer name to pyarrow.Table."""
+    pyarrow = _require_pyarrow()
+    return {
+        layer: pyarrow.Table.from_batches(list(batches), schema=schema)
+        for layer, schema, batches in cell_layers(cell, factors, batch_size, object_types)
+    }
+
+
+def write_geoparquet(cell, directory, factors=None, batch_size=DEFAULT_BATCH_SIZE, compression="zstd",
+                     object_types=None):
+    """Write one GeoParquet file per layer (named LAYER.parquet) into directory, one row group per batch.
+
+    Only one batch is held in memory at a time. Returns the paths written.
+    """
+    pyarrow = _require_pyarrow()
+    directory = Path(directory)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for layer, schema, batches in cell_layers(cell, factors, batch_size, object_types):
+        path = directory / "{}.parquet".format(layer)
+        with pyarrow.parquet.ParquetWriter(path, schema, compression=compression) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=batch_size)
+        paths.append(path)
+    return paths
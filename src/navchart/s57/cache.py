@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import os
+import pickle
+import zlib
+from pathlib import Path
+
+# Bump whenever the pickled cell state changes shape so old entries are ignored
+CACHE_FORMAT_VERSION = 3
+
+
+def file_crc32(path, chunk_size=1024 * 1024):
+    crc = 0
+    with open(path, "rb") as h:
+        chunk = h.read(chunk_size)
+        while chunk:
+            crc = zlib.crc32(chunk, crc)
+            chunk = h.read(chunk_size)
+    return crc & 0xffffffff
+
+
+def file_identity(path, check_crc=True):
+    stat = os.stat(path)
+    return (
+        str(Path(path).absolute()),
+        stat.st_size,
+        stat.st_mtime_ns,
+        file_crc32(path) if check_crc else None
+    )
+
+
+def lru_eviction(max_bytes):
+    """Eviction policy that removes the least recently used entries until the cache fits in max_bytes."""
+    def _select(entries):
+        total = sum(e[1] for e in entries)
+        for path, size, last_used in sorted(entries, key=lambda e: e[2]):
+            if total <= max_bytes:
+                break
+            total -= size
+            yield path
+    return _select
+
+
+class CellCache:
+    """Directory of pickled S57Cell states (see S57Cell.to_state()) keyed on the files they were built from.
+
+    Entries are keyed on the identity (path, size, modification time and CRC32) of the base cell and every update
+    file, plus the edition number and the numeric mode, so any change to the inputs misses the cache. The update
+    number is not part of the key since the update files already are.
+    eviction is a callable receiving (path, size, last_used) tuples for every entry and returning the paths to
+    remove, max_bytes is a shortcut for a size-bounded LRU policy. Only point this at a directory you trust, entries
+    are unpickled.
+    """
+
+    def __init__(self, directory, max_bytes=None, eviction=None, check_crc=True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.check_crc = check_crc
+        if eviction is None and max_bytes is not None:
+            eviction = lru_eviction(max_bytes)
+        self.eviction = eviction
+
+    @staticmethod
+    def _location(cell):
+        # Cells with the same name from different exchange sets or editions get entries of their own
+        return "{}-{}".format(
+            cell.path.stem, hashlib.sha256(str(cell.path.absolute()).encode("utf-8")).hexdigest()[:16]
+        )
+
+    def key(self, cell):
+        """Return the name of the cache entry for the current input files of a cell (reads every file for its CRC)."""
+        identity = [
+            CACHE_FORMAT_VERSION,
+            cell.numeric_mode.value,
+            cell.edition_no,
+            file_identity(cell.path, self.check_crc),
+        ]
+        for path in cell.update_file_paths():
+            identity.append(file_identity(path, self.check_crc))
+        return "{}-{}".format(self._location(cell), hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()[:32])
+
+    def _entry_path(self, key):
+        return self.directory / "{}.cellcache".format(key)
+
+    def load(self, cell, key=None):
+        """Return the cached state of a cell, or None. Pass the key from key() to reuse it for store()."""
+        path = self._entry_path(key if key is not None else self.key(cell))
+        try:
+            with open(path, "rb") as h:
+                state = pickle.load(h)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as ex:
+            logging.getLogger(__name__).warning("Discarding unreadable cache entry {}: {}".format(path, ex))
+            self._remove(path)
+            return None
+        # Touch the entry so the LRU policy sees it as recently used
+        os.utime(path)
+        return state
+
+    def store(self, cell, state, key=None):
+        if key is None:
+            key = self.key(cell)
+        path = self._entry_path(key)
+        temp_path = path.with_suffix(".tmp{}".format(os.getpid()))
+        with open(temp_path, "wb") as h:
+            pickle.dump(state, h, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        # Older entries for the same cell file can never be hit again
+        for stale in self.directory.glob("{}-*.cellcache".format(self._location(cell))):
+            if stale != path:
+                self._remove(stale)
+        self.evict()
+
+    def evict(self):
+        if self.eviction is None:
+            return
+        entries = []
+        for path in self.directory.glob("*.cellcache"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        for path in self.eviction(entries):
+            self._remove(path)
+
+    def clear(self):
+        for path in self.directory.glob("*.cellcache"):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
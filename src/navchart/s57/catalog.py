@@ -1,12 +1,17 @@
+import concurrent.futures
 import functools
-import zlib
 import logging
 from pathlib import Path
 import enum
 import decimal
 
-import s57
-from iso8211_scratch import ISO8211File, Record
+from .s57 import S57Cell
+from .iso8211 import DataFile, Record
+from .cache import file_crc32
+
+
+# Bytes read at a time when computing CRCs
+CRC_CHUNK_SIZE = 1024 * 1024
 
 
 class Implementation(enum.Enum):
@@ -30,7 +35,8 @@ class Entry:
 
     @functools.cached_property
     def relative_path(self):
-        return Path(self.metadata["FILE"])
+        # Catalogs are usually written on Windows, with backslashes between folders
+        return Path(str(self.metadata["FILE"]).replace("\\", "/"))
 
     @functools.cached_property
     def name(self):
@@ -70,14 +76,10 @@ class Entry:
 
     @functools.cached_property
     def real_crc(self):
-        with open(self.path, "rb") as h:
-            real_crc = hex((zlib.crc32(h.read()) & 0xffffffff)).upper()[2:]
-            while len(real_crc) < 8:
-                real_crc = "0" + real_crc
-            return real_crc
+        return format_crc(file_crc32(self.path, CRC_CHUNK_SIZE))
 
     def check_crc(self):
-        return self.real_crc == self.crc
+        return self.real_crc == self.crc.upper()
 
     @functools.cached_property
     def encoding(self):
@@ -98,7 +100,7 @@ class Entry:
 
     def to_cell(self):
         if self.name.endswith(".000"):
-            return s57.S57Cell(self.path)
+            return S57Cell(self.path)
         return None
 
     @functools.cached_property
@@ -115,23 +117,24 @@ class Entry:
 
     def from_iso8211(self, catalog_file, dataset: Record):
         self.enc_root = catalog_file.enc_root
-        self.identifier = dataset["ITEM0"]
-        self.metadata = dataset["CATD"]
+        self.metadata = dataset["CATD"].data
+        self.identifier = self.metadata["RCID"]
         return self
 
     def from_path(self, enc_root, path, long_file, south, west, north, east, volume=1, max_volume=1, comment=""):
         self.identifier = None
         self.enc_root = enc_root
-        rel_path = path
-        if rel_path.startswith(self.enc_root):
-            rel_path = path[len(self.enc_root):]
+        rel_path = str(path)
+        if rel_path.startswith(str(self.enc_root)):
+            rel_path = rel_path[len(str(self.enc_root)):].lstrip("/\\")
+        path = str(path)
         self.metadata = {
             "FILE": rel_path,
             "COMT": comment,
             "ELON": decimal.Decimal(east),
             "NLAT": decimal.Decimal(north),
             "SLAT": decimal.Decimal(south),
-            "WLONG": decimal.Decimal(west),
+            "WLON": decimal.Decimal(west),
             "LFIL": long_file,
             "VOLM": "V{:02d}X{:02d}".format(volume, max_volume)
         }
@@ -159,6 +162,37 @@ class Entry:
         return self
 
 
+def format_crc(crc):
+    """Format a CRC-32 the way CATALOG.031 does, as eight upper case hex digits."""
+    return "{:08X}".format(crc)
+
+
+class VerificationResult:
+    """Summary of S57Catalog.verify()."""
+
+    def __init__(self):
+        # Number of files whose CRC was computed
+        self.checked = 0
+        # (entry, catalog CRC, file CRC) for each file that does not match
+        self.mismatches = []
+        # Entries whose file does not exist
+        self.missing = []
+        # Entries without a CRC in the catalog
+        self.unchecked = []
+
+    @property
+    def ok(self):
+        return not (self.mismatches or self.missing)
+
+    def __str__(self):
+        return "{} files checked, {} CRC mismatches, {} missing, {} without a CRC".format(
+            self.checked,
+            len(self.mismatches),
+            len(self.missing),
+            len(self.unchecked)
+        )
+
+
 class S57Catalog:
 
     def __init__(self):
@@ -170,9 +204,10 @@ class S57Catalog:
     def from_file(self, path):
         self.path = Path(path)
         self.files = {}
-        self._raw = ISO8211File()
-        self._raw.from_file(path)
-        for dataset in self._raw.datasets():
+        self._raw = DataFile.from_file(self.path)
+        for dataset in self._raw:
+            if "CATD" not in dataset:
+                continue
             entry = Entry().from_iso8211(self, dataset)
             if entry.name in self.files:
                 logging.getLogger(__name__).warning(
@@ -208,6 +243,36 @@ class S57Catalog:
             if skip_duplicates or entry.name not in self.files:
                 self.append(entry)
 
+    def verify(self, workers=None, chunk_size=CRC_CHUNK_SIZE):
+        """Check the CRC of every file of the catalog and return a VerificationResult.
+
+        Files are read in chunks of chunk_size bytes and hashed on a pool of workers threads (zlib releases the
+        GIL while hashing), with workers=1 they are hashed one at a time in this thread. The computed CRCs are kept
+        on the entries as real_crc.
+        """
+        result = VerificationResult()
+        entries = []
+        for entry in self:
+            if not entry.crc:
+                result.unchecked.append(entry)
+            elif not entry.path.is_file():
+                result.missing.append(entry)
+            else:
+                entries.append(entry)
+        paths = [entry.path for entry in entries]
+        sizes = [chunk_size] * len(paths)
+        if workers is not None and workers <= 1:
+            crcs = list(map(file_crc32, paths, sizes))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                crcs = list(executor.map(file_crc32, paths, sizes))
+        for entry, crc in zip(entries, crcs):
+            entry.real_crc = format_crc(crc)
+            result.checked += 1
+            if not entry.check_crc():
+                result.mismatches.append((entry, entry.crc, entry.real_crc))
+        return result
+
     def __iter__(self):
         self._iter_keys = [x for x in self.files]
         self._iter_keys.sort(key=_catalog_file_sort_index, reverse=True)
@@ -215,10 +280,9 @@ class S57Catalog:
 
     def __next__(self):
         if self._iter_keys:
-            yield self.files[self._iter_keys.pop()]
+            return self.files[self._iter_keys.pop()]
         raise StopIteration()
 
-
     @functools.cached_property
     def enc_root(self):
         return self.path.parent
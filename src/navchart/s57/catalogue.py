@@ -0,0 +1,2574 @@
+"""S-57 catalogue tables: record names, agencies, object classes and attributes.
+
+Each name table maps a code (as an int and as a string) and the name itself to the name, and each code table maps the
+same keys to the code, so S57Standard can use them as they are.
+
+Generated from the CSV files next to this module by compile_catalogue.py, do not edit by hand.
+"""
+
+
+RECORD_NAMES = {
+    10: 'DS',
+    '10': 'DS',
+    20: 'DP',
+    '20': 'DP',
+    30: 'DH',
+    '30': 'DH',
+    40: 'CD',
+    '40': 'CD',
+    60: 'CR',
+    '60': 'CR',
+    70: 'ID',
+    '70': 'ID',
+    80: 'IO',
+    '80': 'IO',
+    90: 'IS',
+    '90': 'IS',
+    100: 'FE',
+    '100': 'FE',
+    110: 'VI',
+    '110': 'VI',
+    120: 'VC',
+    '120': 'VC',
+    130: 'VE',
+    '130': 'VE',
+    140: 'VF',
+    '140': 'VF',
+    'DS': 'DS',
+    'DP': 'DP',
+    'DH': 'DH',
+    'CD': 'CD',
+    'CR': 'CR',
+    'ID': 'ID',
+    'IO': 'IO',
+    'IS': 'IS',
+    'FE': 'FE',
+    'VI': 'VI',
+    'VC': 'VC',
+    'VE': 'VE',
+    'VF': 'VF',
+}
+
+
+RECORD_NAME_CODES = {
+    10: 10,
+    '10': 10,
+    20: 20,
+    '20': 20,
+    30: 30,
+    '30': 30,
+    40: 40,
+    '40': 40,
+    60: 60,
+    '60': 60,
+    70: 70,
+    '70': 70,
+    80: 80,
+    '80': 80,
+    90: 90,
+    '90': 90,
+    100: 100,
+    '100': 100,
+    110: 110,
+    '110': 110,
+    120: 120,
+    '120': 120,
+    130: 130,
+    '130': 130,
+    140: 140,
+    '140': 140,
+    'DS': 10,
+    'DP': 20,
+    'DH': 30,
+    'CD': 40,
+    'CR': 60,
+    'ID': 70,
+    'IO': 80,
+    'IS': 90,
+    'FE': 100,
+    'VI': 110,
+    'VC': 120,
+    'VE': 130,
+    'VF': 140,
+}
+
+
+AGENCIES = {
+    50: 'CA',
+    '50': 'CA',
+    550: 'US',
+    '550': 'US',
+    0: '1B',
+    '0': '1B',
+    'CA': 'CA',
+    'US': 'US',
+    '1B': '1B',
+}
+
+
+AGENCY_CODES = {
+    50: 50,
+    '50': 50,
+    550: 550,
+    '550': 550,
+    0: 0,
+    '0': 0,
+    'CA': 50,
+    'US': 550,
+    '1B': 0,
+}
+
+
+OBJECT_CLASSES = {
+    1: 'ADMARE',
+    '1': 'ADMARE',
+    2: 'AIRARE',
+    '2': 'AIRARE',
+    3: 'ACHBRT',
+    '3': 'ACHBRT',
+    4: 'ACHARE',
+    '4': 'ACHARE',
+    5: 'BCNCAR',
+    '5': 'BCNCAR',
+    6: 'BCNISD',
+    '6': 'BCNISD',
+    7: 'BCNLAT',
+    '7': 'BCNLAT',
+    8: 'BCNSAW',
+    '8': 'BCNSAW',
+    9: 'BCNSPP',
+    '9': 'BCNSPP',
+    10: 'BERTHS',
+    '10': 'BERTHS',
+    11: 'BRIDGE',
+    '11': 'BRIDGE',
+    12: 'BUISGL',
+    '12': 'BUISGL',
+    13: 'BUAARE',
+    '13': 'BUAARE',
+    14: 'BOYCAR',
+    '14': 'BOYCAR',
+    15: 'BOYINB',
+    '15': 'BOYINB',
+    16: 'BOYISD',
+    '16': 'BOYISD',
+    17: 'BOYLAT',
+    '17': 'BOYLAT',
+    18: 'BOYSAW',
+    '18': 'BOYSAW',
+    19: 'BOYSPP',
+    '19': 'BOYSPP',
+    20: 'CBLARE',
+    '20': 'CBLARE',
+    21: 'CBLOHD',
+    '21': 'CBLOHD',
+    22: 'CBLSUB',
+    '22': 'CBLSUB',
+    23: 'CANALS',
+    '23': 'CANALS',
+    25: 'CTSARE',
+    '25': 'CTSARE',
+    26: 'CAUSWY',
+    '26': 'CAUSWY',
+    27: 'CTNARE',
+    '27': 'CTNARE',
+    28: 'CHKPNT',
+    '28': 'CHKPNT',
+    29: 'CGUSTA',
+    '29': 'CGUSTA',
+    30: 'COALNE',
+    '30': 'COALNE',
+    31: 'CONZNE',
+    '31': 'CONZNE',
+    32: 'COSARE',
+    '32': 'COSARE',
+    33: 'CTRPNT',
+    '33': 'CTRPNT',
+    34: 'CONVYR',
+    '34': 'CONVYR',
+    35: 'CRANES',
+    '35': 'CRANES',
+    36: 'CURENT',
+    '36': 'CURENT',
+    37: 'CUSZNE',
+    '37': 'CUSZNE',
+    38: 'DAMCON',
+    '38': 'DAMCON',
+    39: 'DAYMAR',
+    '39': 'DAYMAR',
+    40: 'DWRTCL',
+    '40': 'DWRTCL',
+    41: 'DWRTPT',
+    '41': 'DWRTPT',
+    42: 'DEPARE',
+    '42': 'DEPARE',
+    43: 'DEPCNT',
+    '43': 'DEPCNT',
+    44: 'DISMAR',
+    '44': 'DISMAR',
+    45: 'DOCARE',
+    '45': 'DOCARE',
+    46: 'DRGARE',
+    '46': 'DRGARE',
+    47: 'DRYDOC',
+    '47': 'DRYDOC',
+    48: 'DMPGRD',
+    '48': 'DMPGRD',
+    49: 'DYKCON',
+    '49': 'DYKCON',
+    50: 'EXEZNE',
+    '50': 'EXEZNE',
+    51: 'FAIRWY',
+    '51': 'FAIRWY',
+    52: 'FNCLNE',
+    '52': 'FNCLNE',
+    53: 'FERYRT',
+    '53': 'FERYRT',
+    54: 'FSHZNE',
+    '54': 'FSHZNE',
+    55: 'FSHFAC',
+    '55': 'FSHFAC',
+    56: 'FSHGRD',
+    '56': 'FSHGRD',
+    57: 'FLODOC',
+    '57': 'FLODOC',
+    58: 'FOGSIG',
+    '58': 'FOGSIG',
+    59: 'FORSTC',
+    '59': 'FORSTC',
+    60: 'FRPARE',
+    '60': 'FRPARE',
+    61: 'GATCON',
+    '61': 'GATCON',
+    62: 'GRIDRN',
+    '62': 'GRIDRN',
+    63: 'HRBARE',
+    '63': 'HRBARE',
+    64: 'HRBFAC',
+    '64': 'HRBFAC',
+    65: 'HULKES',
+    '65': 'HULKES',
+    66: 'ICEARE',
+    '66': 'ICEARE',
+    67: 'ICNARE',
+    '67': 'ICNARE',
+    68: 'ISTZNE',
+    '68': 'ISTZNE',
+    69: 'LAKARE',
+    '69': 'LAKARE',
+    71: 'LNDARE',
+    '71': 'LNDARE',
+    72: 'LNDELV',
+    '72': 'LNDELV',
+    73: 'LNDRGN',
+    '73': 'LNDRGN',
+    74: 'LNDMRK',
+    '74': 'LNDMRK',
+    75: 'LIGHTS',
+    '75': 'LIGHTS',
+    76: 'LITFLT',
+    '76': 'LITFLT',
+    77: 'LITVES',
+    '77': 'LITVES',
+    78: 'LOCMAG',
+    '78': 'LOCMAG',
+    79: 'LOKBSN',
+    '79': 'LOKBSN',
+    80: 'LOGPON',
+    '80': 'LOGPON',
+    81: 'MAGVAR',
+    '81': 'MAGVAR',
+    82: 'MARCUL',
+    '82': 'MARCUL',
+    83: 'MIPARE',
+    '83': 'MIPARE',
+    84: 'MORFAC',
+    '84': 'MORFAC',
+    85: 'NAVLNE',
+    '85': 'NAVLNE',
+    86: 'OBSTRN',
+    '86': 'OBSTRN',
+    87: 'OFSPLF',
+    '87': 'OFSPLF',
+    88: 'OSPARE',
+    '88': 'OSPARE',
+    89: 'OILBAR',
+    '89': 'OILBAR',
+    90: 'PILPNT',
+    '90': 'PILPNT',
+    91: 'PILBOP',
+    '91': 'PILBOP',
+    92: 'PIPARE',
+    '92': 'PIPARE',
+    93: 'PIPOHD',
+    '93': 'PIPOHD',
+    94: 'PIPSOL',
+    '94': 'PIPSOL',
+    95: 'PONTON',
+    '95': 'PONTON',
+    96: 'PRCARE',
+    '96': 'PRCARE',
+    97: 'PRDARE',
+    '97': 'PRDARE',
+    98: 'PYLONS',
+    '98': 'PYLONS',
+    99: 'RADLNE',
+    '99': 'RADLNE',
+    100: 'RADRNG',
+    '100': 'RADRNG',
+    101: 'RADRFL',
+    '101': 'RADRFL',
+    102: 'RADSTA',
+    '102': 'RADSTA',
+    103: 'RTPBCN',
+    '103': 'RTPBCN',
+    104: 'RDOCAL',
+    '104': 'RDOCAL',
+    105: 'RDOSTA',
+    '105': 'RDOSTA',
+    106: 'RAILWY',
+    '106': 'RAILWY',
+    107: 'RAPIDS',
+    '107': 'RAPIDS',
+    108: 'RCRTCL',
+    '108': 'RCRTCL',
+    109: 'RECTRC',
+    '109': 'RECTRC',
+    110: 'RCTLPT',
+    '110': 'RCTLPT',
+    111: 'RSCSTA',
+    '111': 'RSCSTA',
+    112: 'RESARE',
+    '112': 'RESARE',
+    113: 'RETRFL',
+    '113': 'RETRFL',
+    114: 'RIVERS',
+    '114': 'RIVERS',
+    116: 'ROADWY',
+    '116': 'ROADWY',
+    117: 'RUNWAY',
+    '117': 'RUNWAY',
+    118: 'SNDWAV',
+    '118': 'SNDWAV',
+    119: 'SEAARE',
+    '119': 'SEAARE',
+    120: 'SPLARE',
+    '120': 'SPLARE',
+    121: 'SBDARE',
+    '121': 'SBDARE',
+    122: 'SLCONS',
+    '122': 'SLCONS',
+    123: 'SISTAT',
+    '123': 'SISTAT',
+    124: 'SISTAW',
+    '124': 'SISTAW',
+    125: 'SILTNK',
+    '125': 'SILTNK',
+    126: 'SLOTOP',
+    '126': 'SLOTOP',
+    127: 'SLOGRD',
+    '127': 'SLOGRD',
+    128: 'SMCFAC',
+    '128': 'SMCFAC',
+    129: 'SOUNDG',
+    '129': 'SOUNDG',
+    130: 'SPRING',
+    '130': 'SPRING',
+    132: 'STSLNE',
+    '132': 'STSLNE',
+    133: 'SUBTLN',
+    '133': 'SUBTLN',
+    134: 'SWPARE',
+    '134': 'SWPARE',
+    135: 'TESARE',
+    '135': 'TESARE',
+    136: 'TS_PRH',
+    '136': 'TS_PRH',
+    137: 'TS_PNH',
+    '137': 'TS_PNH',
+    138: 'TS_PAD',
+    '138': 'TS_PAD',
+    139: 'TS_TIS',
+    '139': 'TS_TIS',
+    140: 'T_HMON',
+    '140': 'T_HMON',
+    141: 'T_NHMN',
+    '141': 'T_NHMN',
+    142: 'T_TIMS',
+    '142': 'T_TIMS',
+    143: 'TIDEWY',
+    '143': 'TIDEWY',
+    144: 'TOPMAR',
+    '144': 'TOPMAR',
+    145: 'TSELNE',
+    '145': 'TSELNE',
+    146: 'TSSBND',
+    '146': 'TSSBND',
+    147: 'TSSCRS',
+    '147': 'TSSCRS',
+    148: 'TSSLPT',
+    '148': 'TSSLPT',
+    149: 'TSSRON',
+    '149': 'TSSRON',
+    150: 'TSEZNE',
+    '150': 'TSEZNE',
+    151: 'TUNNEL',
+    '151': 'TUNNEL',
+    152: 'TWRTPT',
+    '152': 'TWRTPT',
+    153: 'UWTROC',
+    '153': 'UWTROC',
+    154: 'UNSARE',
+    '154': 'UNSARE',
+    155: 'VEGATN',
+    '155': 'VEGATN',
+    156: 'WATTUR',
+    '156': 'WATTUR',
+    157: 'WATFAL',
+    '157': 'WATFAL',
+    158: 'WEDKLP',
+    '158': 'WEDKLP',
+    159: 'WRECKS',
+    '159': 'WRECKS',
+    300: 'M_ACCY',
+    '300': 'M_ACCY',
+    301: 'M_CSCL',
+    '301': 'M_CSCL',
+    302: 'M_COVR',
+    '302': 'M_COVR',
+    303: 'M_HDAT',
+    '303': 'M_HDAT',
+    304: 'M_HOPA',
+    '304': 'M_HOPA',
+    305: 'M_NPUB',
+    '305': 'M_NPUB',
+    306: 'M_NSYS',
+    '306': 'M_NSYS',
+    307: 'M_PROD',
+    '307': 'M_PROD',
+    308: 'M_QUAL',
+    '308': 'M_QUAL',
+    309: 'M_SDAT',
+    '309': 'M_SDAT',
+    310: 'M_SREL',
+    '310': 'M_SREL',
+    311: 'M_UNIT',
+    '311': 'M_UNIT',
+    312: 'M_VDAT',
+    '312': 'M_VDAT',
+    400: 'C_AGGR',
+    '400': 'C_AGGR',
+    401: 'C_ASSO',
+    '401': 'C_ASSO',
+    402: 'C_STAC',
+    '402': 'C_STAC',
+    500: '$AREAS',
+    '500': '$AREAS',
+    501: '$LINES',
+    '501': '$LINES',
+    502: '$CSYMB',
+    '502': '$CSYMB',
+    503: '$COMPS',
+    '503': '$COMPS',
+    504: '$TEXTS',
+    '504': '$TEXTS',
+    'ADMARE': 'ADMARE',
+    'AIRARE': 'AIRARE',
+    'ACHBRT': 'ACHBRT',
+    'ACHARE': 'ACHARE',
+    'BCNCAR': 'BCNCAR',
+    'BCNISD': 'BCNISD',
+    'BCNLAT': 'BCNLAT',
+    'BCNSAW': 'BCNSAW',
+    'BCNSPP': 'BCNSPP',
+    'BERTHS': 'BERTHS',
+    'BRIDGE': 'BRIDGE',
+    'BUISGL': 'BUISGL',
+    'BUAARE': 'BUAARE',
+    'BOYCAR': 'BOYCAR',
+    'BOYINB': 'BOYINB',
+    'BOYISD': 'BOYISD',
+    'BOYLAT': 'BOYLAT',
+    'BOYSAW': 'BOYSAW',
+    'BOYSPP': 'BOYSPP',
+    'CBLARE': 'CBLARE',
+    'CBLOHD': 'CBLOHD',
+    'CBLSUB': 'CBLSUB',
+    'CANALS': 'CANALS',
+    'CTSARE': 'CTSARE',
+    'CAUSWY': 'CAUSWY',
+    'CTNARE': 'CTNARE',
+    'CHKPNT': 'CHKPNT',
+    'CGUSTA': 'CGUSTA',
+    'COALNE': 'COALNE',
+    'CONZNE': 'CONZNE',
+    'COSARE': 'COSARE',
+    'CTRPNT': 'CTRPNT',
+    'CONVYR': 'CONVYR',
+    'CRANES': 'CRANES',
+    'CURENT': 'CURENT',
+    'CUSZNE': 'CUSZNE',
+    'DAMCON': 'DAMCON',
+    'DAYMAR': 'DAYMAR',
+    'DWRTCL': 'DWRTCL',
+    'DWRTPT': 'DWRTPT',
+    'DEPARE': 'DEPARE',
+    'DEPCNT': 'DEPCNT',
+    'DISMAR': 'DISMAR',
+    'DOCARE': 'DOCARE',
+    'DRGARE': 'DRGARE',
+    'DRYDOC': 'DRYDOC',
+    'DMPGRD': 'DMPGRD',
+    'DYKCON': 'DYKCON',
+    'EXEZNE': 'EXEZNE',
+    'FAIRWY': 'FAIRWY',
+    'FNCLNE': 'FNCLNE',
+    'FERYRT': 'FERYRT',
+    'FSHZNE': 'FSHZNE',
+    'FSHFAC': 'FSHFAC',
+    'FSHGRD': 'FSHGRD',
+    'FLODOC': 'FLODOC',
+    'FOGSIG': 'FOGSIG',
+    'FORSTC': 'FORSTC',
+    'FRPARE': 'FRPARE',
+    'GATCON': 'GATCON',
+    'GRIDRN': 'GRIDRN',
+    'HRBARE': 'HRBARE',
+    'HRBFAC': 'HRBFAC',
+    'HULKES': 'HULKES',
+    'ICEARE': 'ICEARE',
+    'ICNARE': 'ICNARE',
+    'ISTZNE': 'ISTZNE',
+    'LAKARE': 'LAKARE',
+    'LNDARE': 'LNDARE',
+    'LNDELV': 'LNDELV',
+    'LNDRGN': 'LNDRGN',
+    'LNDMRK': 'LNDMRK',
+    'LIGHTS': 'LIGHTS',
+    'LITFLT': 'LITFLT',
+    'LITVES': 'LITVES',
+    'LOCMAG': 'LOCMAG',
+    'LOKBSN': 'LOKBSN',
+    'LOGPON': 'LOGPON',
+    'MAGVAR': 'MAGVAR',
+    'MARCUL': 'MARCUL',
+    'MIPARE': 'MIPARE',
+    'MORFAC': 'MORFAC',
+    'NAVLNE': 'NAVLNE',
+    'OBSTRN': 'OBSTRN',
+    'OFSPLF': 'OFSPLF',
+    'OSPARE': 'OSPARE',
+    'OILBAR': 'OILBAR',
+    'PILPNT': 'PILPNT',
+    'PILBOP': 'PILBOP',
+    'PIPARE': 'PIPARE',
+    'PIPOHD': 'PIPOHD',
+    'PIPSOL': 'PIPSOL',
+    'PONTON': 'PONTON',
+    'PRCARE': 'PRCARE',
+    'PRDARE': 'PRDARE',
+    'PYLONS': 'PYLONS',
+    'RADLNE': 'RADLNE',
+    'RADRNG': 'RADRNG',
+    'RADRFL': 'RADRFL',
+    'RADSTA': 'RADSTA',
+    'RTPBCN': 'RTPBCN',
+    'RDOCAL': 'RDOCAL',
+    'RDOSTA': 'RDOSTA',
+    'RAILWY': 'RAILWY',
+    'RAPIDS': 'RAPIDS',
+    'RCRTCL': 'RCRTCL',
+    'RECTRC': 'RECTRC',
+    'RCTLPT': 'RCTLPT',
+    'RSCSTA': 'RSCSTA',
+    'RESARE': 'RESARE',
+    'RETRFL': 'RETRFL',
+    'RIVERS': 'RIVERS',
+    'ROADWY': 'ROADWY',
+    'RUNWAY': 'RUNWAY',
+    'SNDWAV': 'SNDWAV',
+    'SEAARE': 'SEAARE',
+    'SPLARE': 'SPLARE',
+    'SBDARE': 'SBDARE',
+    'SLCONS': 'SLCONS',
+    'SISTAT': 'SISTAT',
+    'SISTAW': 'SISTAW',
+    'SILTNK': 'SILTNK',
+    'SLOTOP': 'SLOTOP',
+    'SLOGRD': 'SLOGRD',
+    'SMCFAC': 'SMCFAC',
+    'SOUNDG': 'SOUNDG',
+    'SPRING': 'SPRING',
+    'STSLNE': 'STSLNE',
+    'SUBTLN': 'SUBTLN',
+    'SWPARE': 'SWPARE',
+    'TESARE': 'TESARE',
+    'TS_PRH': 'TS_PRH',
+    'TS_PNH': 'TS_PNH',
+    'TS_PAD': 'TS_PAD',
+    'TS_TIS': 'TS_TIS',
+    'T_HMON': 'T_HMON',
+    'T_NHMN': 'T_NHMN',
+    'T_TIMS': 'T_TIMS',
+    'TIDEWY': 'TIDEWY',
+    'TOPMAR': 'TOPMAR',
+    'TSELNE': 'TSELNE',
+    'TSSBND': 'TSSBND',
+    'TSSCRS': 'TSSCRS',
+    'TSSLPT': 'TSSLPT',
+    'TSSRON': 'TSSRON',
+    'TSEZNE': 'TSEZNE',
+    'TUNNEL': 'TUNNEL',
+    'TWRTPT': 'TWRTPT',
+    'UWTROC': 'UWTROC',
+    'UNSARE': 'UNSARE',
+    'VEGATN': 'VEGATN',
+    'WATTUR': 'WATTUR',
+    'WATFAL': 'WATFAL',
+    'WEDKLP': 'WEDKLP',
+    'WRECKS': 'WRECKS',
+    'M_ACCY': 'M_ACCY',
+    'M_CSCL': 'M_CSCL',
+    'M_COVR': 'M_COVR',
+    'M_HDAT': 'M_HDAT',
+    'M_HOPA': 'M_HOPA',
+    'M_NPUB': 'M_NPUB',
+    'M_NSYS': 'M_NSYS',
+    'M_PROD': 'M_PROD',
+    'M_QUAL': 'M_QUAL',
+    'M_SDAT': 'M_SDAT',
+    'M_SREL': 'M_SREL',
+    'M_UNIT': 'M_UNIT',
+    'M_VDAT': 'M_VDAT',
+    'C_AGGR': 'C_AGGR',
+    'C_ASSO': 'C_ASSO',
+    'C_STAC': 'C_STAC',
+    '$AREAS': '$AREAS',
+    '$LINES': '$LINES',
+    '$CSYMB': '$CSYMB',
+    '$COMPS': '$COMPS',
+    '$TEXTS': '$TEXTS',
+}
+
+
+OBJECT_CLASS_CODES = {
+    1: 1,
+    '1': 1,
+    2: 2,
+    '2': 2,
+    3: 3,
+    '3': 3,
+    4: 4,
+    '4': 4,
+    5: 5,
+    '5': 5,
+    6: 6,
+    '6': 6,
+    7: 7,
+    '7': 7,
+    8: 8,
+    '8': 8,
+    9: 9,
+    '9': 9,
+    10: 10,
+    '10': 10,
+    11: 11,
+    '11': 11,
+    12: 12,
+    '12': 12,
+    13: 13,
+    '13': 13,
+    14: 14,
+    '14': 14,
+    15: 15,
+    '15': 15,
+    16: 16,
+    '16': 16,
+    17: 17,
+    '17': 17,
+    18: 18,
+    '18': 18,
+    19: 19,
+    '19': 19,
+    20: 20,
+    '20': 20,
+    21: 21,
+    '21': 21,
+    22: 22,
+    '22': 22,
+    23: 23,
+    '23': 23,
+    25: 25,
+    '25': 25,
+    26: 26,
+    '26': 26,
+    27: 27,
+    '27': 27,
+    28: 28,
+    '28': 28,
+    29: 29,
+    '29': 29,
+    30: 30,
+    '30': 30,
+    31: 31,
+    '31': 31,
+    32: 32,
+    '32': 32,
+    33: 33,
+    '33': 33,
+    34: 34,
+    '34': 34,
+    35: 35,
+    '35': 35,
+    36: 36,
+    '36': 36,
+    37: 37,
+    '37': 37,
+    38: 38,
+    '38': 38,
+    39: 39,
+    '39': 39,
+    40: 40,
+    '40': 40,
+    41: 41,
+    '41': 41,
+    42: 42,
+    '42': 42,
+    43: 43,
+    '43': 43,
+    44: 44,
+    '44': 44,
+    45: 45,
+    '45': 45,
+    46: 46,
+    '46': 46,
+    47: 47,
+    '47': 47,
+    48: 48,
+    '48': 48,
+    49: 49,
+    '49': 49,
+    50: 50,
+    '50': 50,
+    51: 51,
+    '51': 51,
+    52: 52,
+    '52': 52,
+    53: 53,
+    '53': 53,
+    54: 54,
+    '54': 54,
+    55: 55,
+    '55': 55,
+    56: 56,
+    '56': 56,
+    57: 57,
+    '57': 57,
+    58: 58,
+    '58': 58,
+    59: 59,
+    '59': 59,
+    60: 60,
+    '60': 60,
+    61: 61,
+    '61': 61,
+    62: 62,
+    '62': 62,
+    63: 63,
+    '63': 63,
+    64: 64,
+    '64': 64,
+    65: 65,
+    '65': 65,
+    66: 66,
+    '66': 66,
+    67: 67,
+    '67': 67,
+    68: 68,
+    '68': 68,
+    69: 69,
+    '69': 69,
+    71: 71,
+    '71': 71,
+    72: 72,
+    '72': 72,
+    73: 73,
+    '73': 73,
+    74: 74,
+    '74': 74,
+    75: 75,
+    '75': 75,
+    76: 76,
+    '76': 76,
+    77: 77,
+    '77': 77,
+    78: 78,
+    '78': 78,
+    79: 79,
+    '79': 79,
+    80: 80,
+    '80': 80,
+    81: 81,
+    '81': 81,
+    82: 82,
+    '82': 82,
+    83: 83,
+    '83': 83,
+    84: 84,
+    '84': 84,
+    85: 85,
+    '85': 85,
+    86: 86,
+    '86': 86,
+    87: 87,
+    '87': 87,
+    88: 88,
+    '88': 88,
+    89: 89,
+    '89': 89,
+    90: 90,
+    '90': 90,
+    91: 91,
+    '91': 91,
+    92: 92,
+    '92': 92,
+    93: 93,
+    '93': 93,
+    94: 94,
+    '94': 94,
+    95: 95,
+    '95': 95,
+    96: 96,
+    '96': 96,
+    97: 97,
+    '97': 97,
+    98: 98,
+    '98': 98,
+    99: 99,
+    '99': 99,
+    100: 100,
+    '100': 100,
+    101: 101,
+    '101': 101,
+    102: 102,
+    '102': 102,
+    103: 103,
+    '103': 103,
+    104: 104,
+    '104': 104,
+    105: 105,
+    '105': 105,
+    106: 106,
+    '106': 106,
+    107: 107,
+    '107': 107,
+    108: 108,
+    '108': 108,
+    109: 109,
+    '109': 109,
+    110: 110,
+    '110': 110,
+    111: 111,
+    '111': 111,
+    112: 112,
+    '112': 112,
+    113: 113,
+    '113': 113,
+    114: 114,
+    '114': 114,
+    116: 116,
+    '116': 116,
+    117: 117,
+    '117': 117,
+    118: 118,
+    '118': 118,
+    119: 119,
+    '119': 119,
+    120: 120,
+    '120': 120,
+    121: 121,
+    '121': 121,
+    122: 122,
+    '122': 122,
+    123: 123,
+    '123': 123,
+    124: 124,
+    '124': 124,
+    125: 125,
+    '125': 125,
+    126: 126,
+    '126': 126,
+    127: 127,
+    '127': 127,
+    128: 128,
+    '128': 128,
+    129: 129,
+    '129': 129,
+    130: 130,
+    '130': 130,
+    132: 132,
+    '132': 132,
+    133: 133,
+    '133': 133,
+    134: 134,
+    '134': 134,
+    135: 135,
+    '135': 135,
+    136: 136,
+    '136': 136,
+    137: 137,
+    '137': 137,
+    138: 138,
+    '138': 138,
+    139: 139,
+    '139': 139,
+    140: 140,
+    '140': 140,
+    141: 141,
+    '141': 141,
+    142: 142,
+    '142': 142,
+    143: 143,
+    '143': 143,
+    144: 144,
+    '144': 144,
+    145: 145,
+    '145': 145,
+    146: 146,
+    '146': 146,
+    147: 147,
+    '147': 147,
+    148: 148,
+    '148': 148,
+    149: 149,
+    '149': 149,
+    150: 150,
+    '150': 150,
+    151: 151,
+    '151': 151,
+    152: 152,
+    '152': 152,
+    153: 153,
+    '153': 153,
+    154: 154,
+    '154': 154,
+    155: 155,
+    '155': 155,
+    156: 156,
+    '156': 156,
+    157: 157,
+    '157': 157,
+    158: 158,
+    '158': 158,
+    159: 159,
+    '159': 159,
+    300: 300,
+    '300': 300,
+    301: 301,
+    '301': 301,
+    302: 302,
+    '302': 302,
+    303: 303,
+    '303': 303,
+    304: 304,
+    '304': 304,
+    305: 305,
+    '305': 305,
+    306: 306,
+    '306': 306,
+    307: 307,
+    '307': 307,
+    308: 308,
+    '308': 308,
+    309: 309,
+    '309': 309,
+    310: 310,
+    '310': 310,
+    311: 311,
+    '311': 311,
+    312: 312,
+    '312': 312,
+    400: 400,
+    '400': 400,
+    401: 401,
+    '401': 401,
+    402: 402,
+    '402': 402,
+    500: 500,
+    '500': 500,
+    501: 501,
+    '501': 501,
+    502: 502,
+    '502': 502,
+    503: 503,
+    '503': 503,
+    504: 504,
+    '504': 504,
+    'ADMARE': 1,
+    'AIRARE': 2,
+    'ACHBRT': 3,
+    'ACHARE': 4,
+    'BCNCAR': 5,
+    'BCNISD': 6,
+    'BCNLAT': 7,
+    'BCNSAW': 8,
+    'BCNSPP': 9,
+    'BERTHS': 10,
+    'BRIDGE': 11,
+    'BUISGL': 12,
+    'BUAARE': 13,
+    'BOYCAR': 14,
+    'BOYINB': 15,
+    'BOYISD': 16,
+    'BOYLAT': 17,
+    'BOYSAW': 18,
+    'BOYSPP': 19,
+    'CBLARE': 20,
+    'CBLOHD': 21,
+    'CBLSUB': 22,
+    'CANALS': 23,
+    'CTSARE': 25,
+    'CAUSWY': 26,
+    'CTNARE': 27,
+    'CHKPNT': 28,
+    'CGUSTA': 29,
+    'COALNE': 30,
+    'CONZNE': 31,
+    'COSARE': 32,
+    'CTRPNT': 33,
+    'CONVYR': 34,
+    'CRANES': 35,
+    'CURENT': 36,
+    'CUSZNE': 37,
+    'DAMCON': 38,
+    'DAYMAR': 39,
+    'DWRTCL': 40,
+    'DWRTPT': 41,
+    'DEPARE': 42,
+    'DEPCNT': 43,
+    'DISMAR': 44,
+    'DOCARE': 45,
+    'DRGARE': 46,
+    'DRYDOC': 47,
+    'DMPGRD': 48,
+    'DYKCON': 49,
+    'EXEZNE': 50,
+    'FAIRWY': 51,
+    'FNCLNE': 52,
+    'FERYRT': 53,
+    'FSHZNE': 54,
+    'FSHFAC': 55,
+    'FSHGRD': 56,
+    'FLODOC': 57,
+    'FOGSIG': 58,
+    'FORSTC': 59,
+    'FRPARE': 60,
+    'GATCON': 61,
+    'GRIDRN': 62,
+    'HRBARE': 63,
+    'HRBFAC': 64,
+    'HULKES': 65,
+    'ICEARE': 66,
+    'ICNARE': 67,
+    'ISTZNE': 68,
+    'LAKARE': 69,
+    'LNDARE': 71,
+    'LNDELV': 72,
+    'LNDRGN': 73,
+    'LNDMRK': 74,
+    'LIGHTS': 75,
+    'LITFLT': 76,
+    'LITVES': 77,
+    'LOCMAG': 78,
+    'LOKBSN': 79,
+    'LOGPON': 80,
+    'MAGVAR': 81,
+    'MARCUL': 82,
+    'MIPARE': 83,
+    'MORFAC': 84,
+    'NAVLNE': 85,
+    'OBSTRN': 86,
+    'OFSPLF': 87,
+    'OSPARE': 88,
+    'OILBAR': 89,
+    'PILPNT': 90,
+    'PILBOP': 91,
+    'PIPARE': 92,
+    'PIPOHD': 93,
+    'PIPSOL': 94,
+    'PONTON': 95,
+    'PRCARE': 96,
+    'PRDARE': 97,
+    'PYLONS': 98,
+    'RADLNE': 99,
+    'RADRNG': 100,
+    'RADRFL': 101,
+    'RADSTA': 102,
+    'RTPBCN': 103,
+    'RDOCAL': 104,
+    'RDOSTA': 105,
+    'RAILWY': 106,
+    'RAPIDS': 107,
+    'RCRTCL': 108,
+    'RECTRC': 109,
+    'RCTLPT': 110,
+    'RSCSTA': 111,
+    'RESARE': 112,
+    'RETRFL': 113,
+    'RIVERS': 114,
+    'ROADWY': 116,
+    'RUNWAY': 117,
+    'SNDWAV': 118,
+    'SEAARE': 119,
+    'SPLARE': 120,
+    'SBDARE': 121,
+    'SLCONS': 122,
+    'SISTAT': 123,
+    'SISTAW': 124,
+    'SILTNK': 125,
+    'SLOTOP': 126,
+    'SLOGRD': 127,
+    'SMCFAC': 128,
+    'SOUNDG': 129,
+    'SPRING': 130,
+    'STSLNE': 132,
+    'SUBTLN': 133,
+    'SWPARE': 134,
+    'TESARE': 135,
+    'TS_PRH': 136,
+    'TS_PNH': 137,
+    'TS_PAD': 138,
+    'TS_TIS': 139,
+    'T_HMON': 140,
+    'T_NHMN': 141,
+    'T_TIMS': 142,
+    'TIDEWY': 143,
+    'TOPMAR': 144,
+    'TSELNE': 145,
+    'TSSBND': 146,
+    'TSSCRS': 147,
+    'TSSLPT': 148,
+    'TSSRON': 149,
+    'TSEZNE': 150,
+    'TUNNEL': 151,
+    'TWRTPT': 152,
+    'UWTROC': 153,
+    'UNSARE': 154,
+    'VEGATN': 155,
+    'WATTUR': 156,
+    'WATFAL': 157,
+    'WEDKLP': 158,
+    'WRECKS': 159,
+    'M_ACCY': 300,
+    'M_CSCL': 301,
+    'M_COVR': 302,
+    'M_HDAT': 303,
+    'M_HOPA': 304,
+    'M_NPUB': 305,
+    'M_NSYS': 306,
+    'M_PROD': 307,
+    'M_QUAL': 308,
+    'M_SDAT': 309,
+    'M_SREL': 310,
+    'M_UNIT': 311,
+    'M_VDAT': 312,
+    'C_AGGR': 400,
+    'C_ASSO': 401,
+    'C_STAC': 402,
+    '$AREAS': 500,
+    '$LINES': 501,
+    '$CSYMB': 502,
+    '$COMPS': 503,
+    '$TEXTS': 504,
+}
+
+
+ATTRIBUTES = {
+    1: 'AGENCY',
+    '1': 'AGENCY',
+    2: 'BCNSHP',
+    '2': 'BCNSHP',
+    3: 'BUISHP',
+    '3': 'BUISHP',
+    4: 'BOYSHP',
+    '4': 'BOYSHP',
+    5: 'BURDEP',
+    '5': 'BURDEP',
+    6: 'CALSGN',
+    '6': 'CALSGN',
+    7: 'CATAIR',
+    '7': 'CATAIR',
+    8: 'CATACH',
+    '8': 'CATACH',
+    9: 'CATBRG',
+    '9': 'CATBRG',
+    10: 'CATBUA',
+    '10': 'CATBUA',
+    11: 'CATCBL',
+    '11': 'CATCBL',
+    12: 'CATCAN',
+    '12': 'CATCAN',
+    13: 'CATCAM',
+    '13': 'CATCAM',
+    14: 'CATCHP',
+    '14': 'CATCHP',
+    15: 'CATCOA',
+    '15': 'CATCOA',
+    16: 'CATCTR',
+    '16': 'CATCTR',
+    17: 'CATCON',
+    '17': 'CATCON',
+    18: 'CATCOV',
+    '18': 'CATCOV',
+    19: 'CATCRN',
+    '19': 'CATCRN',
+    20: 'CATDAM',
+    '20': 'CATDAM',
+    21: 'CATDIS',
+    '21': 'CATDIS',
+    22: 'CATDOC',
+    '22': 'CATDOC',
+    23: 'CATDPG',
+    '23': 'CATDPG',
+    24: 'CATFNC',
+    '24': 'CATFNC',
+    25: 'CATFRY',
+    '25': 'CATFRY',
+    26: 'CATFIF',
+    '26': 'CATFIF',
+    27: 'CATFOG',
+    '27': 'CATFOG',
+    28: 'CATFOR',
+    '28': 'CATFOR',
+    29: 'CATGAT',
+    '29': 'CATGAT',
+    30: 'CATHAF',
+    '30': 'CATHAF',
+    31: 'CATHLK',
+    '31': 'CATHLK',
+    32: 'CATICE',
+    '32': 'CATICE',
+    33: 'CATINB',
+    '33': 'CATINB',
+    34: 'CATLND',
+    '34': 'CATLND',
+    35: 'CATLMK',
+    '35': 'CATLMK',
+    36: 'CATLAM',
+    '36': 'CATLAM',
+    37: 'CATLIT',
+    '37': 'CATLIT',
+    38: 'CATMFA',
+    '38': 'CATMFA',
+    39: 'CATMPA',
+    '39': 'CATMPA',
+    40: 'CATMOR',
+    '40': 'CATMOR',
+    41: 'CATNAV',
+    '41': 'CATNAV',
+    42: 'CATOBS',
+    '42': 'CATOBS',
+    43: 'CATOFP',
+    '43': 'CATOFP',
+    44: 'CATOLB',
+    '44': 'CATOLB',
+    45: 'CATPLE',
+    '45': 'CATPLE',
+    46: 'CATPIL',
+    '46': 'CATPIL',
+    47: 'CATPIP',
+    '47': 'CATPIP',
+    48: 'CATPRA',
+    '48': 'CATPRA',
+    49: 'CATPYL',
+    '49': 'CATPYL',
+    50: 'CATQUA',
+    '50': 'CATQUA',
+    51: 'CATRAS',
+    '51': 'CATRAS',
+    52: 'CATRTB',
+    '52': 'CATRTB',
+    53: 'CATROS',
+    '53': 'CATROS',
+    54: 'CATTRK',
+    '54': 'CATTRK',
+    55: 'CATRSC',
+    '55': 'CATRSC',
+    56: 'CATREA',
+    '56': 'CATREA',
+    57: 'CATROD',
+    '57': 'CATROD',
+    58: 'CATRUN',
+    '58': 'CATRUN',
+    59: 'CATSEA',
+    '59': 'CATSEA',
+    60: 'CATSLC',
+    '60': 'CATSLC',
+    61: 'CATSIT',
+    '61': 'CATSIT',
+    62: 'CATSIW',
+    '62': 'CATSIW',
+    63: 'CATSIL',
+    '63': 'CATSIL',
+    64: 'CATSLO',
+    '64': 'CATSLO',
+    65: 'CATSCF',
+    '65': 'CATSCF',
+    66: 'CATSPM',
+    '66': 'CATSPM',
+    67: 'CATTSS',
+    '67': 'CATTSS',
+    68: 'CATVEG',
+    '68': 'CATVEG',
+    69: 'CATWAT',
+    '69': 'CATWAT',
+    70: 'CATWED',
+    '70': 'CATWED',
+    71: 'CATWRK',
+    '71': 'CATWRK',
+    72: 'CATZOC',
+    '72': 'CATZOC',
+    73: '$SPACE',
+    '73': '$SPACE',
+    74: '$CHARS',
+    '74': '$CHARS',
+    75: 'COLOUR',
+    '75': 'COLOUR',
+    76: 'COLPAT',
+    '76': 'COLPAT',
+    77: 'COMCHA',
+    '77': 'COMCHA',
+    78: '$CSIZE',
+    '78': '$CSIZE',
+    79: 'CPDATE',
+    '79': 'CPDATE',
+    80: 'CSCALE',
+    '80': 'CSCALE',
+    81: 'CONDTN',
+    '81': 'CONDTN',
+    82: 'CONRAD',
+    '82': 'CONRAD',
+    83: 'CONVIS',
+    '83': 'CONVIS',
+    84: 'CURVEL',
+    '84': 'CURVEL',
+    85: 'DATEND',
+    '85': 'DATEND',
+    86: 'DATSTA',
+    '86': 'DATSTA',
+    87: 'DRVAL1',
+    '87': 'DRVAL1',
+    88: 'DRVAL2',
+    '88': 'DRVAL2',
+    89: 'DUNITS',
+    '89': 'DUNITS',
+    90: 'ELEVAT',
+    '90': 'ELEVAT',
+    91: 'ESTRNG',
+    '91': 'ESTRNG',
+    92: 'EXCLIT',
+    '92': 'EXCLIT',
+    93: 'EXPSOU',
+    '93': 'EXPSOU',
+    94: 'FUNCTN',
+    '94': 'FUNCTN',
+    95: 'HEIGHT',
+    '95': 'HEIGHT',
+    96: 'HUNITS',
+    '96': 'HUNITS',
+    97: 'HORACC',
+    '97': 'HORACC',
+    98: 'HORCLR',
+    '98': 'HORCLR',
+    99: 'HORLEN',
+    '99': 'HORLEN',
+    100: 'HORWID',
+    '100': 'HORWID',
+    101: 'ICEFAC',
+    '101': 'ICEFAC',
+    102: 'INFORM',
+    '102': 'INFORM',
+    103: 'JRSDTN',
+    '103': 'JRSDTN',
+    104: '$JUSTH',
+    '104': '$JUSTH',
+    105: '$JUSTV',
+    '105': '$JUSTV',
+    106: 'LIFCAP',
+    '106': 'LIFCAP',
+    107: 'LITCHR',
+    '107': 'LITCHR',
+    108: 'LITVIS',
+    '108': 'LITVIS',
+    109: 'MARSYS',
+    '109': 'MARSYS',
+    110: 'MLTYLT',
+    '110': 'MLTYLT',
+    111: 'NATION',
+    '111': 'NATION',
+    112: 'NATCON',
+    '112': 'NATCON',
+    113: 'NATSUR',
+    '113': 'NATSUR',
+    114: 'NATQUA',
+    '114': 'NATQUA',
+    115: 'NMDATE',
+    '115': 'NMDATE',
+    116: 'OBJNAM',
+    '116': 'OBJNAM',
+    117: 'ORIENT',
+    '117': 'ORIENT',
+    118: 'PEREND',
+    '118': 'PEREND',
+    119: 'PERSTA',
+    '119': 'PERSTA',
+    120: 'PICREP',
+    '120': 'PICREP',
+    121: 'PILDST',
+    '121': 'PILDST',
+    122: 'PRCTRY',
+    '122': 'PRCTRY',
+    123: 'PRODCT',
+    '123': 'PRODCT',
+    124: 'PUBREF',
+    '124': 'PUBREF',
+    125: 'QUASOU',
+    '125': 'QUASOU',
+    126: 'RADWAL',
+    '126': 'RADWAL',
+    127: 'RADIUS',
+    '127': 'RADIUS',
+    128: 'RECDAT',
+    '128': 'RECDAT',
+    129: 'RECIND',
+    '129': 'RECIND',
+    130: 'RYRMGV',
+    '130': 'RYRMGV',
+    131: 'RESTRN',
+    '131': 'RESTRN',
+    132: 'SCAMAX',
+    '132': 'SCAMAX',
+    133: 'SCAMIN',
+    '133': 'SCAMIN',
+    134: 'SCVAL1',
+    '134': 'SCVAL1',
+    135: 'SCVAL2',
+    '135': 'SCVAL2',
+    136: 'SECTR1',
+    '136': 'SECTR1',
+    137: 'SECTR2',
+    '137': 'SECTR2',
+    138: 'SHIPAM',
+    '138': 'SHIPAM',
+    139: 'SIGFRQ',
+    '139': 'SIGFRQ',
+    140: 'SIGGEN',
+    '140': 'SIGGEN',
+    141: 'SIGGRP',
+    '141': 'SIGGRP',
+    142: 'SIGPER',
+    '142': 'SIGPER',
+    143: 'SIGSEQ',
+    '143': 'SIGSEQ',
+    144: 'SOUACC',
+    '144': 'SOUACC',
+    145: 'SDISMX',
+    '145': 'SDISMX',
+    146: 'SDISMN',
+    '146': 'SDISMN',
+    147: 'SORDAT',
+    '147': 'SORDAT',
+    148: 'SORIND',
+    '148': 'SORIND',
+    149: 'STATUS',
+    '149': 'STATUS',
+    150: 'SURATH',
+    '150': 'SURATH',
+    151: 'SUREND',
+    '151': 'SUREND',
+    152: 'SURSTA',
+    '152': 'SURSTA',
+    153: 'SURTYP',
+    '153': 'SURTYP',
+    154: '$SCALE',
+    '154': '$SCALE',
+    155: '$SCODE',
+    '155': '$SCODE',
+    156: 'TECSOU',
+    '156': 'TECSOU',
+    157: '$TXSTR',
+    '157': '$TXSTR',
+    158: 'TXTDSC',
+    '158': 'TXTDSC',
+    159: 'TS_TSP',
+    '159': 'TS_TSP',
+    160: 'TS_TSV',
+    '160': 'TS_TSV',
+    161: 'T_ACWL',
+    '161': 'T_ACWL',
+    162: 'T_HWLW',
+    '162': 'T_HWLW',
+    163: 'T_MTOD',
+    '163': 'T_MTOD',
+    164: 'T_THDF',
+    '164': 'T_THDF',
+    165: 'T_TINT',
+    '165': 'T_TINT',
+    166: 'T_TSVL',
+    '166': 'T_TSVL',
+    167: 'T_VAHC',
+    '167': 'T_VAHC',
+    168: 'TIMEND',
+    '168': 'TIMEND',
+    169: 'TIMSTA',
+    '169': 'TIMSTA',
+    170: '$TINTS',
+    '170': '$TINTS',
+    171: 'TOPSHP',
+    '171': 'TOPSHP',
+    172: 'TRAFIC',
+    '172': 'TRAFIC',
+    173: 'VALACM',
+    '173': 'VALACM',
+    174: 'VALDCO',
+    '174': 'VALDCO',
+    175: 'VALLMA',
+    '175': 'VALLMA',
+    176: 'VALMAG',
+    '176': 'VALMAG',
+    177: 'VALMXR',
+    '177': 'VALMXR',
+    178: 'VALNMR',
+    '178': 'VALNMR',
+    179: 'VALSOU',
+    '179': 'VALSOU',
+    180: 'VERACC',
+    '180': 'VERACC',
+    181: 'VERCLR',
+    '181': 'VERCLR',
+    182: 'VERCCL',
+    '182': 'VERCCL',
+    183: 'VERCOP',
+    '183': 'VERCOP',
+    184: 'VERCSA',
+    '184': 'VERCSA',
+    185: 'VERDAT',
+    '185': 'VERDAT',
+    186: 'VERLEN',
+    '186': 'VERLEN',
+    187: 'WATLEV',
+    '187': 'WATLEV',
+    188: 'CAT_TS',
+    '188': 'CAT_TS',
+    189: 'PUNITS',
+    '189': 'PUNITS',
+    300: 'NINFOM',
+    '300': 'NINFOM',
+    301: 'NOBJNM',
+    '301': 'NOBJNM',
+    302: 'NPLDST',
+    '302': 'NPLDST',
+    303: '$NTXST',
+    '303': '$NTXST',
+    304: 'NTXTDS',
+    '304': 'NTXTDS',
+    400: 'HORDAT',
+    '400': 'HORDAT',
+    401: 'POSACC',
+    '401': 'POSACC',
+    402: 'QUAPOS',
+    '402': 'QUAPOS',
+    'AGENCY': 'AGENCY',
+    'BCNSHP': 'BCNSHP',
+    'BUISHP': 'BUISHP',
+    'BOYSHP': 'BOYSHP',
+    'BURDEP': 'BURDEP',
+    'CALSGN': 'CALSGN',
+    'CATAIR': 'CATAIR',
+    'CATACH': 'CATACH',
+    'CATBRG': 'CATBRG',
+    'CATBUA': 'CATBUA',
+    'CATCBL': 'CATCBL',
+    'CATCAN': 'CATCAN',
+    'CATCAM': 'CATCAM',
+    'CATCHP': 'CATCHP',
+    'CATCOA': 'CATCOA',
+    'CATCTR': 'CATCTR',
+    'CATCON': 'CATCON',
+    'CATCOV': 'CATCOV',
+    'CATCRN': 'CATCRN',
+    'CATDAM': 'CATDAM',
+    'CATDIS': 'CATDIS',
+    'CATDOC': 'CATDOC',
+    'CATDPG': 'CATDPG',
+    'CATFNC': 'CATFNC',
+    'CATFRY': 'CATFRY',
+    'CATFIF': 'CATFIF',
+    'CATFOG': 'CATFOG',
+    'CATFOR': 'CATFOR',
+    'CATGAT': 'CATGAT',
+    'CATHAF': 'CATHAF',
+    'CATHLK': 'CATHLK',
+    'CATICE': 'CATICE',
+    'CATINB': 'CATINB',
+    'CATLND': 'CATLND',
+    'CATLMK': 'CATLMK',
+    'CATLAM': 'CATLAM',
+    'CATLIT': 'CATLIT',
+    'CATMFA': 'CATMFA',
+    'CATMPA': 'CATMPA',
+    'CATMOR': 'CATMOR',
+    'CATNAV': 'CATNAV',
+    'CATOBS': 'CATOBS',
+    'CATOFP': 'CATOFP',
+    'CATOLB': 'CATOLB',
+    'CATPLE': 'CATPLE',
+    'CATPIL': 'CATPIL',
+    'CATPIP': 'CATPIP',
+    'CATPRA': 'CATPRA',
+    'CATPYL': 'CATPYL',
+    'CATQUA': 'CATQUA',
+    'CATRAS': 'CATRAS',
+    'CATRTB': 'CATRTB',
+    'CATROS': 'CATROS',
+    'CATTRK': 'CATTRK',
+    'CATRSC': 'CATRSC',
+    'CATREA': 'CATREA',
+    'CATROD': 'CATROD',
+    'CATRUN': 'CATRUN',
+    'CATSEA': 'CATSEA',
+    'CATSLC': 'CATSLC',
+    'CATSIT': 'CATSIT',
+    'CATSIW': 'CATSIW',
+    'CATSIL': 'CATSIL',
+    'CATSLO': 'CATSLO',
+    'CATSCF': 'CATSCF',
+    'CATSPM': 'CATSPM',
+    'CATTSS': 'CATTSS',
+    'CATVEG': 'CATVEG',
+    'CATWAT': 'CATWAT',
+    'CATWED': 'CATWED',
+    'CATWRK': 'CATWRK',
+    'CATZOC': 'CATZOC',
+    '$SPACE': '$SPACE',
+    '$CHARS': '$CHARS',
+    'COLOUR': 'COLOUR',
+    'COLPAT': 'COLPAT',
+    'COMCHA': 'COMCHA',
+    '$CSIZE': '$CSIZE',
+    'CPDATE': 'CPDATE',
+    'CSCALE': 'CSCALE',
+    'CONDTN': 'CONDTN',
+    'CONRAD': 'CONRAD',
+    'CONVIS': 'CONVIS',
+    'CURVEL': 'CURVEL',
+    'DATEND': 'DATEND',
+    'DATSTA': 'DATSTA',
+    'DRVAL1': 'DRVAL1',
+    'DRVAL2': 'DRVAL2',
+    'DUNITS': 'DUNITS',
+    'ELEVAT': 'ELEVAT',
+    'ESTRNG': 'ESTRNG',
+    'EXCLIT': 'EXCLIT',
+    'EXPSOU': 'EXPSOU',
+    'FUNCTN': 'FUNCTN',
+    'HEIGHT': 'HEIGHT',
+    'HUNITS': 'HUNITS',
+    'HORACC': 'HORACC',
+    'HORCLR': 'HORCLR',
+    'HORLEN': 'HORLEN',
+    'HORWID': 'HORWID',
+    'ICEFAC': 'ICEFAC',
+    'INFORM': 'INFORM',
+    'JRSDTN': 'JRSDTN',
+    '$JUSTH': '$JUSTH',
+    '$JUSTV': '$JUSTV',
+    'LIFCAP': 'LIFCAP',
+    'LITCHR': 'LITCHR',
+    'LITVIS': 'LITVIS',
+    'MARSYS': 'MARSYS',
+    'MLTYLT': 'MLTYLT',
+    'NATION': 'NATION',
+    'NATCON': 'NATCON',
+    'NATSUR': 'NATSUR',
+    'NATQUA': 'NATQUA',
+    'NMDATE': 'NMDATE',
+    'OBJNAM': 'OBJNAM',
+    'ORIENT': 'ORIENT',
+    'PEREND': 'PEREND',
+    'PERSTA': 'PERSTA',
+    'PICREP': 'PICREP',
+    'PILDST': 'PILDST',
+    'PRCTRY': 'PRCTRY',
+    'PRODCT': 'PRODCT',
+    'PUBREF': 'PUBREF',
+    'QUASOU': 'QUASOU',
+    'RADWAL': 'RADWAL',
+    'RADIUS': 'RADIUS',
+    'RECDAT': 'RECDAT',
+    'RECIND': 'RECIND',
+    'RYRMGV': 'RYRMGV',
+    'RESTRN': 'RESTRN',
+    'SCAMAX': 'SCAMAX',
+    'SCAMIN': 'SCAMIN',
+    'SCVAL1': 'SCVAL1',
+    'SCVAL2': 'SCVAL2',
+    'SECTR1': 'SECTR1',
+    'SECTR2': 'SECTR2',
+    'SHIPAM': 'SHIPAM',
+    'SIGFRQ': 'SIGFRQ',
+    'SIGGEN': 'SIGGEN',
+    'SIGGRP': 'SIGGRP',
+    'SIGPER': 'SIGPER',
+    'SIGSEQ': 'SIGSEQ',
+    'SOUACC': 'SOUACC',
+    'SDISMX': 'SDISMX',
+    'SDISMN': 'SDISMN',
+    'SORDAT': 'SORDAT',
+    'SORIND': 'SORIND',
+    'STATUS': 'STATUS',
+    'SURATH': 'SURATH',
+    'SUREND': 'SUREND',
+    'SURSTA': 'SURSTA',
+    'SURTYP': 'SURTYP',
+    '$SCALE': '$SCALE',
+    '$SCODE': '$SCODE',
+    'TECSOU': 'TECSOU',
+    '$TXSTR': '$TXSTR',
+    'TXTDSC': 'TXTDSC',
+    'TS_TSP': 'TS_TSP',
+    'TS_TSV': 'TS_TSV',
+    'T_ACWL': 'T_ACWL',
+    'T_HWLW': 'T_HWLW',
+    'T_MTOD': 'T_MTOD',
+    'T_THDF': 'T_THDF',
+    'T_TINT': 'T_TINT',
+    'T_TSVL': 'T_TSVL',
+    'T_VAHC': 'T_VAHC',
+    'TIMEND': 'TIMEND',
+    'TIMSTA': 'TIMSTA',
+    '$TINTS': '$TINTS',
+    'TOPSHP': 'TOPSHP',
+    'TRAFIC': 'TRAFIC',
+    'VALACM': 'VALACM',
+    'VALDCO': 'VALDCO',
+    'VALLMA': 'VALLMA',
+    'VALMAG': 'VALMAG',
+    'VALMXR': 'VALMXR',
+    'VALNMR': 'VALNMR',
+    'VALSOU': 'VALSOU',
+    'VERACC': 'VERACC',
+    'VERCLR': 'VERCLR',
+    'VERCCL': 'VERCCL',
+    'VERCOP': 'VERCOP',
+    'VERCSA': 'VERCSA',
+    'VERDAT': 'VERDAT',
+    'VERLEN': 'VERLEN',
+    'WATLEV': 'WATLEV',
+    'CAT_TS': 'CAT_TS',
+    'PUNITS': 'PUNITS',
+    'NINFOM': 'NINFOM',
+    'NOBJNM': 'NOBJNM',
+    'NPLDST': 'NPLDST',
+    '$NTXST': '$NTXST',
+    'NTXTDS': 'NTXTDS',
+    'HORDAT': 'HORDAT',
+    'POSACC': 'POSACC',
+    'QUAPOS': 'QUAPOS',
+}
+
+
+ATTRIBUTE_CODES = {
+    1: 1,
+    '1': 1,
+    2: 2,
+    '2': 2,
+    3: 3,
+    '3': 3,
+    4: 4,
+    '4': 4,
+    5: 5,
+    '5': 5,
+    6: 6,
+    '6': 6,
+    7: 7,
+    '7': 7,
+    8: 8,
+    '8': 8,
+    9: 9,
+    '9': 9,
+    10: 10,
+    '10': 10,
+    11: 11,
+    '11': 11,
+    12: 12,
+    '12': 12,
+    13: 13,
+    '13': 13,
+    14: 14,
+    '14': 14,
+    15: 15,
+    '15': 15,
+    16: 16,
+    '16': 16,
+    17: 17,
+    '17': 17,
+    18: 18,
+    '18': 18,
+    19: 19,
+    '19': 19,
+    20: 20,
+    '20': 20,
+    21: 21,
+    '21': 21,
+    22: 22,
+    '22': 22,
+    23: 23,
+    '23': 23,
+    24: 24,
+    '24': 24,
+    25: 25,
+    '25': 25,
+    26: 26,
+    '26': 26,
+    27: 27,
+    '27': 27,
+    28: 28,
+    '28': 28,
+    29: 29,
+    '29': 29,
+    30: 30,
+    '30': 30,
+    31: 31,
+    '31': 31,
+    32: 32,
+    '32': 32,
+    33: 33,
+    '33': 33,
+    34: 34,
+    '34': 34,
+    35: 35,
+    '35': 35,
+    36: 36,
+    '36': 36,
+    37: 37,
+    '37': 37,
+    38: 38,
+    '38': 38,
+    39: 39,
+    '39': 39,
+    40: 40,
+    '40': 40,
+    41: 41,
+    '41': 41,
+    42: 42,
+    '42': 42,
+    43: 43,
+    '43': 43,
+    44: 44,
+    '44': 44,
+    45: 45,
+    '45': 45,
+    46: 46,
+    '46': 46,
+    47: 47,
+    '47': 47,
+    48: 48,
+    '48': 48,
+    49: 49,
+    '49': 49,
+    50: 50,
+    '50': 50,
+    51: 51,
+    '51': 51,
+    52: 52,
+    '52': 52,
+    53: 53,
+    '53': 53,
+    54: 54,
+    '54': 54,
+    55: 55,
+    '55': 55,
+    56: 56,
+    '56': 56,
+    57: 57,
+    '57': 57,
+    58: 58,
+    '58': 58,
+    59: 59,
+    '59': 59,
+    60: 60,
+    '60': 60,
+    61: 61,
+    '61': 61,
+    62: 62,
+    '62': 62,
+    63: 63,
+    '63': 63,
+    64: 64,
+    '64': 64,
+    65: 65,
+    '65': 65,
+    66: 66,
+    '66': 66,
+    67: 67,
+    '67': 67,
+    68: 68,
+    '68': 68,
+    69: 69,
+    '69': 69,
+    70: 70,
+    '70': 70,
+    71: 71,
+    '71': 71,
+    72: 72,
+    '72': 72,
+    73: 73,
+    '73': 73,
+    74: 74,
+    '74': 74,
+    75: 75,
+    '75': 75,
+    76: 76,
+    '76': 76,
+    77: 77,
+    '77': 77,
+    78: 78,
+    '78': 78,
+    79: 79,
+    '79': 79,
+    80: 80,
+    '80': 80,
+    81: 81,
+    '81': 81,
+    82: 82,
+    '82': 82,
+    83: 83,
+    '83': 83,
+    84: 84,
+    '84': 84,
+    85: 85,
+    '85': 85,
+    86: 86,
+    '86': 86,
+    87: 87,
+    '87': 87,
+    88: 88,
+    '88': 88,
+    89: 89,
+    '89': 89,
+    90: 90,
+    '90': 90,
+    91: 91,
+    '91': 91,
+    92: 92,
+    '92': 92,
+    93: 93,
+    '93': 93,
+    94: 94,
+    '94': 94,
+    95: 95,
+    '95': 95,
+    96: 96,
+    '96': 96,
+    97: 97,
+    '97': 97,
+    98: 98,
+    '98': 98,
+    99: 99,
+    '99': 99,
+    100: 100,
+    '100': 100,
+    101: 101,
+    '101': 101,
+    102: 102,
+    '102': 102,
+    103: 103,
+    '103': 103,
+    104: 104,
+    '104': 104,
+    105: 105,
+    '105': 105,
+    106: 106,
+    '106': 106,
+    107: 107,
+    '107': 107,
+    108: 108,
+    '108': 108,
+    109: 109,
+    '109': 109,
+    110: 110,
+    '110': 110,
+    111: 111,
+    '111': 111,
+    112: 112,
+    '112': 112,
+    113: 113,
+    '113': 113,
+    114: 114,
+    '114': 114,
+    115: 115,
+    '115': 115,
+    116: 116,
+    '116': 116,
+    117: 117,
+    '117': 117,
+    118: 118,
+    '118': 118,
+    119: 119,
+    '119': 119,
+    120: 120,
+    '120': 120,
+    121: 121,
+    '121': 121,
+    122: 122,
+    '122': 122,
+    123: 123,
+    '123': 123,
+    124: 124,
+    '124': 124,
+    125: 125,
+    '125': 125,
+    126: 126,
+    '126': 126,
+    127: 127,
+    '127': 127,
+    128: 128,
+    '128': 128,
+    129: 129,
+    '129': 129,
+    130: 130,
+    '130': 130,
+    131: 131,
+    '131': 131,
+    132: 132,
+    '132': 132,
+    133: 133,
+    '133': 133,
+    134: 134,
+    '134': 134,
+    135: 135,
+    '135': 135,
+    136: 136,
+    '136': 136,
+    137: 137,
+    '137': 137,
+    138: 138,
+    '138': 138,
+    139: 139,
+    '139': 139,
+    140: 140,
+    '140': 140,
+    141: 141,
+    '141': 141,
+    142: 142,
+    '142': 142,
+    143: 143,
+    '143': 143,
+    144: 144,
+    '144': 144,
+    145: 145,
+    '145': 145,
+    146: 146,
+    '146': 146,
+    147: 147,
+    '147': 147,
+    148: 148,
+    '148': 148,
+    149: 149,
+    '149': 149,
+    150: 150,
+    '150': 150,
+    151: 151,
+    '151': 151,
+    152: 152,
+    '152': 152,
+    153: 153,
+    '153': 153,
+    154: 154,
+    '154': 154,
+    155: 155,
+    '155': 155,
+    156: 156,
+    '156': 156,
+    157: 157,
+    '157': 157,
+    158: 158,
+    '158': 158,
+    159: 159,
+    '159': 159,
+    160: 160,
+    '160': 160,
+    161: 161,
+    '161': 161,
+    162: 162,
+    '162': 162,
+    163: 163,
+    '163': 163,
+    164: 164,
+    '164': 164,
+    165: 165,
+    '165': 165,
+    166: 166,
+    '166': 166,
+    167: 167,
+    '167': 167,
+    168: 168,
+    '168': 168,
+    169: 169,
+    '169': 169,
+    170: 170,
+    '170': 170,
+    171: 171,
+    '171': 171,
+    172: 172,
+    '172': 172,
+    173: 173,
+    '173': 173,
+    174: 174,
+    '174': 174,
+    175: 175,
+    '175': 175,
+    176: 176,
+    '176': 176,
+    177: 177,
+    '177': 177,
+    178: 178,
+    '178': 178,
+    179: 179,
+    '179': 179,
+    180: 180,
+    '180': 180,
+    181: 181,
+    '181': 181,
+    182: 182,
+    '182': 182,
+    183: 183,
+    '183': 183,
+    184: 184,
+    '184': 184,
+    185: 185,
+    '185': 185,
+    186: 186,
+    '186': 186,
+    187: 187,
+    '187': 187,
+    188: 188,
+    '188': 188,
+    189: 189,
+    '189': 189,
+    300: 300,
+    '300': 300,
+    301: 301,
+    '301': 301,
+    302: 302,
+    '302': 302,
+    303: 303,
+    '303': 303,
+    304: 304,
+    '304': 304,
+    400: 400,
+    '400': 400,
+    401: 401,
+    '401': 401,
+    402: 402,
+    '402': 402,
+    'AGENCY': 1,
+    'BCNSHP': 2,
+    'BUISHP': 3,
+    'BOYSHP': 4,
+    'BURDEP': 5,
+    'CALSGN': 6,
+    'CATAIR': 7,
+    'CATACH': 8,
+    'CATBRG': 9,
+    'CATBUA': 10,
+    'CATCBL': 11,
+    'CATCAN': 12,
+    'CATCAM': 13,
+    'CATCHP': 14,
+    'CATCOA': 15,
+    'CATCTR': 16,
+    'CATCON': 17,
+    'CATCOV': 18,
+    'CATCRN': 19,
+    'CATDAM': 20,
+    'CATDIS': 21,
+    'CATDOC': 22,
+    'CATDPG': 23,
+    'CATFNC': 24,
+    'CATFRY': 25,
+    'CATFIF': 26,
+    'CATFOG': 27,
+    'CATFOR': 28,
+    'CATGAT': 29,
+    'CATHAF': 30,
+    'CATHLK': 31,
+    'CATICE': 32,
+    'CATINB': 33,
+    'CATLND': 34,
+    'CATLMK': 35,
+    'CATLAM': 36,
+    'CATLIT': 37,
+    'CATMFA': 38,
+    'CATMPA': 39,
+    'CATMOR': 40,
+    'CATNAV': 41,
+    'CATOBS': 42,
+    'CATOFP': 43,
+    'CATOLB': 44,
+    'CATPLE': 45,
+    'CATPIL': 46,
+    'CATPIP': 47,
+    'CATPRA': 48,
+    'CATPYL': 49,
+    'CATQUA': 50,
+    'CATRAS': 51,
+    'CATRTB': 52,
+    'CATROS': 53,
+    'CATTRK': 54,
+    'CATRSC': 55,
+    'CATREA': 56,
+    'CATROD': 57,
+    'CATRUN': 58,
+    'CATSEA': 59,
+    'CATSLC': 60,
+    'CATSIT': 61,
+    'CATSIW': 62,
+    'CATSIL': 63,
+    'CATSLO': 64,
+    'CATSCF': 65,
+    'CATSPM': 66,
+    'CATTSS': 67,
+    'CATVEG': 68,
+    'CATWAT': 69,
+    'CATWED': 70,
+    'CATWRK': 71,
+    'CATZOC': 72,
+    '$SPACE': 73,
+    '$CHARS': 74,
+    'COLOUR': 75,
+    'COLPAT': 76,
+    'COMCHA': 77,
+    '$CSIZE': 78,
+    'CPDATE': 79,
+    'CSCALE': 80,
+    'CONDTN': 81,
+    'CONRAD': 82,
+    'CONVIS': 83,
+    'CURVEL': 84,
+    'DATEND': 85,
+    'DATSTA': 86,
+    'DRVAL1': 87,
+    'DRVAL2': 88,
+    'DUNITS': 89,
+    'ELEVAT': 90,
+    'ESTRNG': 91,
+    'EXCLIT': 92,
+    'EXPSOU': 93,
+    'FUNCTN': 94,
+    'HEIGHT': 95,
+    'HUNITS': 96,
+    'HORACC': 97,
+    'HORCLR': 98,
+    'HORLEN': 99,
+    'HORWID': 100,
+    'ICEFAC': 101,
+    'INFORM': 102,
+    'JRSDTN': 103,
+    '$JUSTH': 104,
+    '$JUSTV': 105,
+    'LIFCAP': 106,
+    'LITCHR': 107,
+    'LITVIS': 108,
+    'MARSYS': 109,
+    'MLTYLT': 110,
+    'NATION': 111,
+    'NATCON': 112,
+    'NATSUR': 113,
+    'NATQUA': 114,
+    'NMDATE': 115,
+    'OBJNAM': 116,
+    'ORIENT': 117,
+    'PEREND': 118,
+    'PERSTA': 119,
+    'PICREP': 120,
+    'PILDST': 121,
+    'PRCTRY': 122,
+    'PRODCT': 123,
+    'PUBREF': 124,
+    'QUASOU': 125,
+    'RADWAL': 126,
+    'RADIUS': 127,
+    'RECDAT': 128,
+    'RECIND': 129,
+    'RYRMGV': 130,
+    'RESTRN': 131,
+    'SCAMAX': 132,
+    'SCAMIN': 133,
+    'SCVAL1': 134,
+    'SCVAL2': 135,
+    'SECTR1': 136,
+    'SECTR2': 137,
+    'SHIPAM': 138,
+    'SIGFRQ': 139,
+    'SIGGEN': 140,
+    'SIGGRP': 141,
+    'SIGPER': 142,
+    'SIGSEQ': 143,
+    'SOUACC': 144,
+    'SDISMX': 145,
+    'SDISMN': 146,
+    'SORDAT': 147,
+    'SORIND': 148,
+    'STATUS': 149,
+    'SURATH': 150,
+    'SUREND': 151,
+    'SURSTA': 152,
+    'SURTYP': 153,
+    '$SCALE': 154,
+    '$SCODE': 155,
+    'TECSOU': 156,
+    '$TXSTR': 157,
+    'TXTDSC': 158,
+    'TS_TSP': 159,
+    'TS_TSV': 160,
+    'T_ACWL': 161,
+    'T_HWLW': 162,
+    'T_MTOD': 163,
+    'T_THDF': 164,
+    'T_TINT': 165,
+    'T_TSVL': 166,
+    'T_VAHC': 167,
+    'TIMEND': 168,
+    'TIMSTA': 169,
+    '$TINTS': 170,
+    'TOPSHP': 171,
+    'TRAFIC': 172,
+    'VALACM': 173,
+    'VALDCO': 174,
+    'VALLMA': 175,
+    'VALMAG': 176,
+    'VALMXR': 177,
+    'VALNMR': 178,
+    'VALSOU': 179,
+    'VERACC': 180,
+    'VERCLR': 181,
+    'VERCCL': 182,
+    'VERCOP': 183,
+    'VERCSA': 184,
+    'VERDAT': 185,
+    'VERLEN': 186,
+    'WATLEV': 187,
+    'CAT_TS': 188,
+    'PUNITS': 189,
+    'NINFOM': 300,
+    'NOBJNM': 301,
+    'NPLDST': 302,
+    '$NTXST': 303,
+    'NTXTDS': 304,
+    'HORDAT': 400,
+    'POSACC': 401,
+    'QUAPOS': 402,
+}
+
+
+ATTRIBUTE_TYPES = {
+    'AGENCY': 'A',
+    'BCNSHP': 'E',
+    'BUISHP': 'E',
+    'BOYSHP': 'E',
+    'BURDEP': 'F',
+    'CALSGN': 'S',
+    'CATAIR': 'L',
+    'CATACH': 'L',
+    'CATBRG': 'L',
+    'CATBUA': 'E',
+    'CATCBL': 'E',
+    'CATCAN': 'E',
+    'CATCAM': 'E',
+    'CATCHP': 'E',
+    'CATCOA': 'E',
+    'CATCTR': 'E',
+    'CATCON': 'E',
+    'CATCOV': 'E',
+    'CATCRN': 'E',
+    'CATDAM': 'E',
+    'CATDIS': 'E',
+    'CATDOC': 'E',
+    'CATDPG': 'L',
+    'CATFNC': 'E',
+    'CATFRY': 'E',
+    'CATFIF': 'E',
+    'CATFOG': 'E',
+    'CATFOR': 'E',
+    'CATGAT': 'E',
+    'CATHAF': 'L',
+    'CATHLK': 'L',
+    'CATICE': 'E',
+    'CATINB': 'E',
+    'CATLND': 'L',
+    'CATLMK': 'L',
+    'CATLAM': 'E',
+    'CATLIT': 'L',
+    'CATMFA': 'E',
+    'CATMPA': 'L',
+    'CATMOR': 'E',
+    'CATNAV': 'E',
+    'CATOBS': 'E',
+    'CATOFP': 'L',
+    'CATOLB': 'E',
+    'CATPLE': 'E',
+    'CATPIL': 'E',
+    'CATPIP': 'L',
+    'CATPRA': 'E',
+    'CATPYL': 'E',
+    'CATQUA': 'E',
+    'CATRAS': 'E',
+    'CATRTB': 'E',
+    'CATROS': 'L',
+    'CATTRK': 'E',
+    'CATRSC': 'L',
+    'CATREA': 'L',
+    'CATROD': 'E',
+    'CATRUN': 'E',
+    'CATSEA': 'E',
+    'CATSLC': 'E',
+    'CATSIT': 'L',
+    'CATSIW': 'L',
+    'CATSIL': 'E',
+    'CATSLO': 'E',
+    'CATSCF': 'L',
+    'CATSPM': 'L',
+    'CATTSS': 'E',
+    'CATVEG': 'L',
+    'CATWAT': 'E',
+    'CATWED': 'E',
+    'CATWRK': 'E',
+    'CATZOC': 'E',
+    '$SPACE': 'E',
+    '$CHARS': 'A',
+    'COLOUR': 'L',
+    'COLPAT': 'L',
+    'COMCHA': 'A',
+    '$CSIZE': 'F',
+    'CPDATE': 'A',
+    'CSCALE': 'I',
+    'CONDTN': 'E',
+    'CONRAD': 'E',
+    'CONVIS': 'E',
+    'CURVEL': 'F',
+    'DATEND': 'A',
+    'DATSTA': 'A',
+    'DRVAL1': 'F',
+    'DRVAL2': 'F',
+    'DUNITS': 'E',
+    'ELEVAT': 'F',
+    'ESTRNG': 'F',
+    'EXCLIT': 'E',
+    'EXPSOU': 'E',
+    'FUNCTN': 'L',
+    'HEIGHT': 'F',
+    'HUNITS': 'E',
+    'HORACC': 'F',
+    'HORCLR': 'F',
+    'HORLEN': 'F',
+    'HORWID': 'F',
+    'ICEFAC': 'F',
+    'INFORM': 'S',
+    'JRSDTN': 'E',
+    '$JUSTH': 'E',
+    '$JUSTV': 'E',
+    'LIFCAP': 'F',
+    'LITCHR': 'E',
+    'LITVIS': 'L',
+    'MARSYS': 'E',
+    'MLTYLT': 'I',
+    'NATION': 'A',
+    'NATCON': 'L',
+    'NATSUR': 'L',
+    'NATQUA': 'L',
+    'NMDATE': 'A',
+    'OBJNAM': 'S',
+    'ORIENT': 'F',
+    'PEREND': 'A',
+    'PERSTA': 'A',
+    'PICREP': 'S',
+    'PILDST': 'S',
+    'PRCTRY': 'A',
+    'PRODCT': 'L',
+    'PUBREF': 'S',
+    'QUASOU': 'L',
+    'RADWAL': 'A',
+    'RADIUS': 'F',
+    'RECDAT': 'A',
+    'RECIND': 'A',
+    'RYRMGV': 'A',
+    'RESTRN': 'L',
+    'SCAMAX': 'I',
+    'SCAMIN': 'I',
+    'SCVAL1': 'I',
+    'SCVAL2': 'I',
+    'SECTR1': 'F',
+    'SECTR2': 'F',
+    'SHIPAM': 'A',
+    'SIGFRQ': 'I',
+    'SIGGEN': 'E',
+    'SIGGRP': 'A',
+    'SIGPER': 'F',
+    'SIGSEQ': 'A',
+    'SOUACC': 'F',
+    'SDISMX': 'I',
+    'SDISMN': 'I',
+    'SORDAT': 'A',
+    'SORIND': 'A',
+    'STATUS': 'L',
+    'SURATH': 'S',
+    'SUREND': 'A',
+    'SURSTA': 'A',
+    'SURTYP': 'L',
+    '$SCALE': 'F',
+    '$SCODE': 'A',
+    'TECSOU': 'L',
+    '$TXSTR': 'S',
+    'TXTDSC': 'S',
+    'TS_TSP': 'A',
+    'TS_TSV': 'A',
+    'T_ACWL': 'E',
+    'T_HWLW': 'A',
+    'T_MTOD': 'E',
+    'T_THDF': 'A',
+    'T_TINT': 'I',
+    'T_TSVL': 'A',
+    'T_VAHC': 'A',
+    'TIMEND': 'A',
+    'TIMSTA': 'A',
+    '$TINTS': 'E',
+    'TOPSHP': 'E',
+    'TRAFIC': 'E',
+    'VALACM': 'F',
+    'VALDCO': 'F',
+    'VALLMA': 'F',
+    'VALMAG': 'F',
+    'VALMXR': 'F',
+    'VALNMR': 'F',
+    'VALSOU': 'F',
+    'VERACC': 'F',
+    'VERCLR': 'F',
+    'VERCCL': 'F',
+    'VERCOP': 'F',
+    'VERCSA': 'F',
+    'VERDAT': 'E',
+    'VERLEN': 'F',
+    'WATLEV': 'E',
+    'CAT_TS': 'E',
+    'PUNITS': 'E',
+    'NINFOM': 'S',
+    'NOBJNM': 'S',
+    'NPLDST': 'S',
+    '$NTXST': 'S',
+    'NTXTDS': 'S',
+    'HORDAT': 'E',
+    'POSACC': 'F',
+    'QUAPOS': 'E',
+}
@@ -0,0 +1,115 @@
+"""S-57 enumerated attribute values: attribute name to the meaning of each of its values.
+
+Kept apart from the catalogue module since only decoding attribute values needs it.
+
+Generated from the CSV files next to this module by compile_catalogue.py, do not edit by hand.
+"""
+
+
+EXPECTED_INPUT = {
+    'BCNSHP': {1: 'stake, pole, perch, post', 2: 'whity', 3: 'beacon tower', 4: 'lattice beacon', 5: 'pile beacon', 6: 'cairn', 7: 'buoyant beacon'},
+    'BUISHP': {5: 'high-rise building', 6: 'pyramid', 7: 'cylindrical', 8: 'spherical', 9: 'cubic'},
+    'BOYSHP': {1: 'conical (nun, ogival)', 2: 'can (cylindrical)', 3: 'spherical', 4: 'pillar', 5: 'spar (spindle)', 6: 'barrel (tun)', 7: 'super-buoy', 8: 'ice buoy'},
+    'CATAIR': {1: 'military aeroplane airport', 2: 'civil aeroplane airport', 3: 'military heliport', 4: 'civil heliport', 5: 'glider airfield', 6: 'small planes airfield', 8: 'emergency airfield'},
+    'CATACH': {1: 'unrestricted anchorage', 2: 'deep water anchorage', 3: 'tanker anchorage', 4: 'explosives anchorage', 5: 'quarantine anchorage', 6: 'sea-plane anchorage', 7: 'small craft anchorage', 8: 'small craft mooring area', 9: 'anchorage for periods up to 24 hours'},
+    'CATBRG': {1: 'fixed bridge', 2: 'opening bridge', 3: 'swing bridge', 4: 'lifting bridge', 5: 'bascule bridge', 6: 'pontoon bridge', 7: 'draw bridge', 8: 'transporter bridge', 9: 'footbridge', 10: 'viaduct', 11: 'aqueduct', 12: 'suspension bridge'},
+    'CATBUA': {1: 'urban area', 2: 'settlement', 3: 'village', 4: 'town', 5: 'city', 6: 'holiday village'},
+    'CATCBL': {1: 'power line', 3: 'transmission line', 4: 'telephone', 5: 'telegraph', 6: 'mooring cable/chain'},
+    'CATCAN': {1: 'transportation', 2: 'drainage', 3: 'irrigation'},
+    'CATCAM': {1: 'north cardinal mark', 2: 'east cardinal mark', 3: 'south cardinal mark', 4: 'west cardinal mark'},
+    'CATCHP': {1: 'custom'},
+    'CATCOA': {1: 'steep coast', 2: 'flat coast', 3: 'sandy shore', 4: 'stony shore', 5: 'shingly shore', 6: 'glacier (seaward end)', 7: 'mangrove', 8: 'marshy shore', 9: 'coral reef', 10: 'ice coast'},
+    'CATCTR': {1: 'triangulation point', 2: 'observation spot', 3: 'fixed point', 4: 'bench-mark', 5: 'boundary mark', 6: 'horizontal control, main station', 7: 'horizontal control, secondary station'},
+    'CATCON': {1: 'aerial cableway (telepheric)', 2: 'belt conveyor'},
+    'CATCOV': {1: 'coverage available', 2: 'no coverage available'},
+    'CATCRN': {2: 'container crane/gantry', 3: 'sheerlegs', 4: 'travelling crane', 5: 'A-frame'},
+    'CATDAM': {1: 'weir', 2: 'dam', 3: 'flood barrage'},
+    'CATDIS': {1: 'distance mark not physically installed', 2: 'visible mark, pole', 3: 'visible mark, board', 4: 'visible mark, unknown shape'},
+    'CATDOC': {1: 'tidal', 2: 'non-tidal (wet dock)'},
+    'CATDPG': {2: 'chemical waste dumping ground', 3: 'nuclear waste dumping ground', 4: 'explosives dumping ground', 5: 'spoil ground', 6: 'vessel dumping ground'},
+    'CATFNC': {1: 'fence', 3: 'hedge', 4: 'wall'},
+    'CATFRY': {1: "'free-moving' ferry", 2: 'cable ferry', 3: 'ice ferry'},
+    'CATFIF': {1: 'fishing stake', 2: 'fish trap', 3: 'fish weir', 4: 'tunny net'},
+    'CATFOG': {1: 'explosive', 2: 'diaphone', 3: 'siren', 4: 'nautophone', 5: 'reed', 6: 'tyfon', 7: 'bell', 8: 'whistle', 9: 'gong', 10: 'horn'},
+    'CATFOR': {1: 'castle', 2: 'fort', 3: 'battery', 4: 'blockhouse', 5: 'Martello tower'},
+    'CATGAT': {2: 'flood barrage gate', 3: 'caisson', 4: 'lock gate', 5: 'dyke gate'},
+    'CATHAF': {1: 'RoRo-terminal', 3: 'ferry terminal', 4: 'fishing harbour', 5: 'yacht harbour/marina', 6: 'naval base', 7: 'tanker terminal', 8: 'passenger terminal', 9: 'shipyard', 10: 'container terminal', 11: 'bulk terminal'},
+    'CATHLK': {1: 'floating restaurant', 2: 'historic ship', 3: 'museum', 4: 'accomodation', 5: 'floating breakwater'},
+    'CATICE': {1: 'fast ice', 5: 'glacier', 8: 'polar ice'},
+    'CATINB': {1: 'catenary anchor leg mooring (CALM)', 2: 'single buoy mooring (SBM or SPM)'},
+    'CATLND': {1: 'fen', 2: 'marsh', 3: 'moor/bog', 4: 'heathland', 5: 'mountain range', 6: 'lowlands', 7: 'canyon lands', 8: 'paddy field', 9: 'agricultural land', 10: 'savanna/grassland', 11: 'parkland', 12: 'swamp', 13: 'landslide', 14: 'lava flow', 15: 'salt pan', 16: 'moraine', 17: 'crater', 18: 'cave', 19: 'rock column or pinnacle'},
+    'CATLMK': {1: 'cairn', 2: 'cemetery', 3: 'chimney', 4: 'dish aerial', 5: 'flagstaff (flagpole)', 6: 'flare stack', 7: 'mast', 8: 'windsock', 9: 'monument', 10: 'column (pillar)', 11: 'memorial plaque', 12: 'obelisk', 13: 'statue', 14: 'cross', 15: 'dome', 16: 'radar scanner', 17: 'tower', 18: 'windmill', 19: 'windmotor', 20: 'spire/minaret'},
+    'CATLAM': {1: 'port-hand lateral mark', 2: 'starboard-hand lateral mark', 3: 'preferred channel to starboard lateral mark', 4: 'preferred channel to port lateral mark'},
+    'CATLIT': {1: 'directional function', 4: 'leading light', 5: 'aero light', 6: 'air obstruction light', 7: 'fog detector light', 8: 'flood light', 9: 'strip light', 10: 'subsidiary light', 11: 'spotlight', 12: 'front', 13: 'rear', 14: 'lower', 15: 'upper', 16: 'moir� effect', 17: 'emergency', 18: 'bearing light', 19: 'horizontally disposed', 20: 'vertically disposed'},
+    'CATMFA': {1: 'crustaceans', 2: 'oyster/mussels', 3: 'fish', 4: 'seaweed'},
+    'CATMPA': {2: 'torpedo exercise area', 3: 'submarine exercise area', 4: 'firing danger area', 5: 'mine-laying practice area', 6: 'small arms firing range'},
+    'CATMOR': {1: 'dolphin', 2: 'deviation dolphin', 3: 'bollard', 4: 'tie-up wall', 5: 'post or pile', 6: 'chain/wire/cable', 7: 'mooring buoy'},
+    'CATNAV': {1: 'clearing line', 2: 'transit line', 3: 'leading line bearing a recommended track'},
+    'CATOBS': {1: 'snag / stump', 2: 'wellhead', 3: 'diffuser', 4: 'crib', 5: 'fish haven', 6: 'foul area', 7: 'foul ground', 8: 'ice boom', 9: 'ground tackle'},
+    'CATOFP': {1: 'oil derrick / rig', 2: 'production platform', 3: 'observation / research platform', 4: 'articulated loading platform (ALP)', 5: 'single anchor leg mooring (SALM)', 6: 'mooring tower', 7: 'artificial island', 8: 'floating production, storage and off-loading vessel (FPSO)', 9: 'accomodation platform', 10: 'navigation, communication and control buoy (NCCB)'},
+    'CATOLB': {1: 'oil retention (high pressure pipe)', 2: 'floating oil barrier'},
+    'CATPLE': {1: 'stake', 3: 'post', 4: 'tripodal'},
+    'CATPIL': {1: 'boarding by pilot-cruising vessel', 2: 'boarding by helicopter', 3: 'pilot comes out from shore'},
+    'CATPIP': {2: 'outfall pipe', 3: 'intake pipe', 4: 'sewer', 5: 'bubbler system', 6: 'supply pipe'},
+    'CATPRA': {1: 'quarry', 2: 'mine', 3: 'stockpile', 4: 'power station area', 5: 'refinery area', 6: 'timber yard', 7: 'factory area', 8: 'tank farm', 9: 'wind farm'},
+    'CATPYL': {1: 'power transmission pylon/pole', 2: 'telephone/telegraph pylon/pole', 3: 'aerial cableway/sky pylon', 4: 'bridge pylon/tower', 5: 'bridge pier'},
+    'CATQUA': {1: 'data quality A', 2: 'data quality B', 3: 'data quality C', 4: 'data quality D', 5: 'data quality E', 6: 'quality not evaluated'},
+    'CATRAS': {1: 'radar surveillance station', 2: 'coast radar station'},
+    'CATRTB': {1: 'ramark, radar beacon transmitting continuously', 2: 'racon, radar transponder beacon', 3: 'leading racon/radar transponder beacon'},
+    'CATROS': {1: 'circular (non-directional) marine or aero-marine radiobeacon', 2: 'directional radiobeacon', 3: 'rotating-pattern radiobeacon', 4: 'Consol beacon', 5: 'radio direction-finding station', 6: 'coast radio station providing QTG service', 7: 'aeronautical radiobeacon', 8: 'Decca', 9: 'Loran C', 10: 'Differential GPS', 11: 'Toran', 12: 'Omega', 13: 'Syledis', 14: 'Chaika (Chayka)'},
+    'CATTRK': {1: 'based on a system of fixed marks', 2: 'not based on a system of fixed marks'},
+    'CATRSC': {1: 'rescue station with lifeboat', 2: 'rescue station with rocket', 4: 'refuge for shipwrecked mariners', 5: 'refuge for intertidal area walkers', 6: 'lifeboat lying at a mooring'},
+    'CATREA': {1: 'offshore safety zone', 4: 'nature reserve', 5: 'bird sanctuary', 6: 'game preserve', 7: 'seal sanctuary', 8: 'degaussing range', 9: 'military area', 10: 'historic wreck area', 12: 'navigational aid safety zone', 14: 'minefield', 18: 'swimming area', 19: 'waiting area', 20: 'research area', 21: 'dredging area', 22: 'fish sanctuary', 23: 'ecological reserve', 24: 'no wake area', 25: 'swinging area'},
+    'CATROD': {1: 'motorway', 2: 'major road', 3: 'minor road', 4: 'track / path', 5: 'major street', 6: 'minor street', 7: 'crossing'},
+    'CATRUN': {1: 'aeroplane', 2: 'helicopter landing pad'},
+    'CATSEA': {2: 'gat', 3: 'bank', 4: 'deep', 5: 'bay', 6: 'trench', 7: 'basin', 8: 'mud flats', 9: 'reef', 10: 'ledge', 11: 'canyon', 12: 'narrows', 13: 'shoal', 14: 'knoll', 15: 'ridge', 16: 'seamount', 17: 'pinnacle', 18: 'abyssal plain', 19: 'plateau', 20: 'spur', 21: 'shelf', 22: 'trough', 23: 'saddle', 24: 'abyssal hills', 25: 'apron', 26: 'archipelagic apron', 27: 'borderland', 28: 'continental margin', 29: 'continental rise', 30: 'escarpment', 31: 'fan', 32: 'fracture zone', 33: 'gap', 34: 'guyot', 35: 'hill', 36: 'hole', 37: 'levee', 38: 'median valley', 39: 'moat', 40: 'mountains', 41: 'peak', 42: 'province', 43: 'rise', 44: 'seachannel', 45: 'seamount chain', 46: 'shelf edge', 47: 'sill', 48: 'slope', 49: 'terrace', 50: 'valley', 51: 'canal', 52: 'lake', 53: 'river'},
+    'CATSLC': {1: 'breakwater', 2: 'groyne (groin)', 3: 'mole', 4: 'pier ( jetty)', 5: 'promenadepier', 6: 'wharf (quay)', 7: 'training wall', 8: 'rip rap', 9: 'revetment', 10: 'sea wall', 11: 'landing steps', 12: 'ramp', 13: 'slipway', 14: 'fender', 15: 'solid face wharf', 16: 'open face wharf'},
+    'CATSIT': {1: 'port control', 2: 'port entry and departure', 3: 'International Port Traffic', 4: 'berthing', 5: 'dock', 6: 'lock', 7: 'flood barrage', 8: 'bridge passage', 9: 'dredging'},
+    'CATSIW': {1: 'danger', 2: 'maritime obstruction', 3: 'cable', 4: 'military practice', 5: 'distress', 6: 'weather', 7: 'storm', 8: 'ice', 9: 'time', 10: 'tide', 11: 'tidal stream', 12: 'tide gauge', 13: 'tide scale', 14: 'diving'},
+    'CATSIL': {1: 'silo in general', 2: 'tank in general', 3: 'grain elevator', 4: 'water tower'},
+    'CATSLO': {1: 'cutting', 2: 'embankment', 3: 'dune', 4: 'hill', 5: 'pingo', 6: 'cliff', 7: 'scree'},
+    'CATSCF': {1: 'visitor`s berth', 2: 'nautical club', 3: 'boat hoist', 4: 'sailmaker', 5: 'boatyard', 6: 'public inn', 7: 'restaurant', 8: 'chandler', 9: 'provisions', 10: 'doctor', 11: 'pharmacy', 12: 'water tap', 13: 'fuel station', 14: 'electricity', 15: 'bottle gas', 16: 'showers', 17: 'launderette', 18: 'public toilets', 19: 'post box', 20: 'public telephone', 21: 'refuse bin', 22: 'car park', 23: 'parking for boats and trailers', 24: 'caravan site', 25: 'camping site', 26: 'sewerage pump-out station', 27: 'emergency telephone', 28: 'landing / launching place for boats', 29: 'visitors mooring', 30: 'scrubbing berth', 31: 'picnic area'},
+    'CATSPM': {1: 'firing danger area mark', 2: 'target mark', 3: 'marker ship mark', 4: 'degaussing range mark', 5: 'barge mark', 6: 'cable mark', 7: 'spoil ground mark', 8: 'outfall mark', 9: 'ODAS (Ocean-Data-Acquisition-System)', 10: 'recording mark', 11: 'seaplane anchorage mark', 12: 'recreation zone mark', 13: 'private mark', 14: 'mooring mark', 15: 'LANBY (Large Automatic Navigational Buoy)', 16: 'leading mark', 17: 'measured distance mark', 18: 'notice mark', 19: 'TSS mark (Traffic Separation Scheme)', 20: 'anchoring prohibited mark', 21: 'berthing prohibited mark', 22: 'overtaking prohibited mark', 23: 'two-way traffic prohibited mark', 24: "'reduced wake' mark", 25: 'speed limit mark', 26: 'stop mark', 27: 'general warning mark', 28: "'sound ship's siren' mark", 29: 'restricted vertical clearence mark', 30: "maximum vessel's draught mark", 31: 'restricted horizontal clearance mark', 32: 'strong current warning mark', 33: 'berthing permitted mark', 34: 'overhead power cable mark', 35: "'channel edge gradient' mark", 36: 'telephone mark', 37: 'ferry crossing mark', 39: 'pipline mark', 40: 'anchorage mark', 41: 'clearing mark', 42: 'control mark', 43: 'diving mark', 44: 'refuge beacon', 45: 'foul ground mark', 46: 'yachting mark', 47: 'heliport mark', 48: 'GPS mark', 49: 'seaplane landing mark', 50: 'entry prohibited mark', 51: 'work in progress mark', 52: 'mark with unknown purpose'},
+    'CATTSS': {1: 'IMO - adopted', 2: 'not IMO - adopted'},
+    'CATVEG': {1: 'grassland', 3: 'bush', 4: 'deciduous wood', 5: 'coniferous  wood', 6: 'wood in general (inc mixed wood)', 7: 'mangroves', 10: 'mixed crops', 11: 'reed', 12: 'moos', 13: 'tree in general', 14: 'evergreen tree', 15: 'coniferous tree', 16: 'palm tree', 17: 'nipa palm tree', 18: 'casuarina tree', 19: 'eucalypt tree', 20: 'deciduous tree', 21: 'mangrove tree', 22: 'filao tree'},
+    'CATWAT': {1: 'breakers', 2: 'eddies', 3: 'overfalls', 4: 'tide rips', 5: 'bombora'},
+    'CATWED': {1: 'kelp', 2: 'sea weed', 3: 'sea grass', 4: 'saragasso'},
+    'CATWRK': {1: 'non-dangerous wreck', 2: 'dangerous wreck', 3: 'distributed remains of wreck', 4: 'wreck showing mast/masts', 5: 'wreck showing any portion of hull or superstructure'},
+    'CATZOC': {1: 'zone of confidence A1', 2: 'zone of confidence A2', 3: 'zone of confidence B', 4: 'zone of confidence C', 5: 'zone of confidence D', 6: 'zone of confidence U (data not assessed)'},
+    '$SPACE': {1: 'expanded/condensed', 2: 'standard'},
+    'COLOUR': {1: 'white', 2: 'black', 3: 'red', 4: 'green', 5: 'blue', 6: 'yellow', 7: 'grey', 8: 'brown', 9: 'amber', 10: 'violet', 11: 'orange', 12: 'magenta', 13: 'pink'},
+    'COLPAT': {1: 'horizontal stripes', 2: 'vertical stripes', 3: 'diagonal stripes', 4: 'squared', 5: 'stripes (direction unknown)', 6: 'border stripes'},
+    'CONDTN': {1: 'under construction', 2: 'ruined', 3: 'under reclamation', 4: 'wingless', 5: 'planned construction'},
+    'CONRAD': {1: 'radar conspicuous', 2: 'not radar conspicuous', 3: 'radar conspicuous (has radar reflector)'},
+    'CONVIS': {1: 'visual conspicuous', 2: 'not visual conspicuous'},
+    'DUNITS': {1: 'metres', 2: 'fathoms and feet', 3: 'feet', 4: 'fathoms and fractions'},
+    'EXCLIT': {1: 'light shown without change of character', 2: 'daytime light', 3: 'fog light', 4: 'night light'},
+    'EXPSOU': {1: 'within the range of depth of the surrounding depth area', 2: 'shoaler than range of depth of the surrounding depth area', 3: 'deeper than range of depth of the surrounding depth area'},
+    'FUNCTN': {2: "harbour-master's office", 3: 'custom office', 4: 'health office', 5: 'hospital', 6: 'post office', 7: 'hotel', 8: 'railway station', 9: 'police station', 10: 'water-police station', 11: 'pilot office', 12: 'pilot lookout', 13: 'bank office', 14: 'headquarters for district control', 15: 'transit shed/warehouse', 16: 'factory', 17: 'power station', 18: 'administrative', 19: 'educational facility', 20: 'church', 21: 'chapel', 22: 'temple', 23: 'pagoda', 24: 'shinto shrine', 25: 'buddhist temple', 26: 'mosque', 27: 'marabout', 28: 'lookout', 29: 'communication', 30: 'television', 31: 'radio', 32: 'radar', 33: 'light support', 34: 'microwave', 35: 'cooling', 36: 'observation', 37: 'timeball', 38: 'clock', 39: 'control', 40: 'airship mooring', 41: 'stadium', 42: 'bus station'},
+    'HUNITS': {1: 'metres', 2: 'feet'},
+    'JRSDTN': {1: 'international', 2: 'national', 3: 'national sub-division'},
+    '$JUSTH': {1: 'centre justified', 2: 'right justified', 3: 'left justified'},
+    '$JUSTV': {1: 'bottom justified', 2: 'centre justified', 3: 'top justified'},
+    'LITCHR': {1: 'fixed', 2: 'flashing', 3: 'long-flashing', 4: 'quick-flashing', 5: 'very quick-flashing', 6: 'ultra quick-flashing', 7: 'isophased', 8: 'occulting', 9: 'interrupted quick-flashing', 10: 'interrupted very quick-flashing', 11: 'interrupted ultra quick-flashing', 12: 'morse', 13: 'fixed / flash', 14: 'flash / long-flash', 15: 'occulting / flash', 16: 'fixed / long-flash', 17: 'occulting alternating', 18: 'long-flash alternating', 19: 'flash alternating', 20: 'group alternating', 25: 'quick-flash plus long-flash', 26: 'very quick-flash plus long-flash', 27: 'ultra quick-flash plus long-flash', 28: 'alternating', 29: 'fixed and alternating flashing'},
+    'LITVIS': {1: 'high intensity', 2: 'low intensity', 3: 'faint', 4: 'intensified', 5: 'unintensified', 6: 'visibility deliberately restricted', 7: 'obscured', 8: 'partially obscured'},
+    'MARSYS': {1: 'IALA A', 2: 'IALA B', 9: 'no system', 10: 'other sytem'},
+    'NATCON': {1: 'masonry', 2: 'concreted', 3: 'loose boulders', 4: 'hard surfaced', 5: 'unsurfaced', 6: 'wooden', 7: 'metal', 8: 'glass reinforced plastic (GRP)', 9: 'painted'},
+    'NATSUR': {1: 'mud', 2: 'clay', 3: 'silt', 4: 'sand', 5: 'stone', 6: 'gravel', 7: 'pebbles', 8: 'cobbles', 9: 'rock', 11: 'lava', 14: 'coral', 17: 'shells', 18: 'boulder'},
+    'NATQUA': {1: 'fine', 2: 'medium', 3: 'coarse', 4: 'broken', 5: 'sticky', 6: 'soft', 7: 'stiff', 8: 'volcanic', 9: 'calcareous', 10: 'hard'},
+    'PRODCT': {1: 'oil', 2: 'gas', 3: 'water', 4: 'stone', 5: 'coal', 6: 'ore', 7: 'chemicals', 8: 'drinking water', 9: 'milk', 10: 'bauxite', 11: 'coke', 12: 'iron ingots', 13: 'salt', 14: 'sand', 15: 'timber', 16: 'sawdust / wood chips', 17: 'scrap metal', 18: 'liquified natural gas (LNG)', 19: 'liquified petroleum gas (LPG)', 20: 'wine', 21: 'cement', 22: 'grain'},
+    'QUASOU': {1: 'depth known', 2: 'depth unknown', 3: 'doubtful sounding', 4: 'unreliable sounding', 5: 'no bottom found at value shown', 6: 'least depth known', 7: 'least depth unknown, safe clearance at value shown', 8: 'value reported (not surveyed)', 9: 'value reported (not confirmed)', 10: 'maintained depth', 11: 'not reguraly maintained'},
+    'RESTRN': {1: 'anchoring prohibited', 2: 'anchoring restricted', 3: 'fishing prohibited', 4: 'fishing restricted', 5: 'trawling prohibited', 6: 'trawling restricted', 7: 'entry prohibited', 8: 'entry restricted', 9: 'dredging prohibited', 10: 'dredging restricted', 11: 'diving prohibited', 12: 'diving restricted', 13: 'no wake', 14: 'area to be avoided', 15: 'construction prohibited'},
+    'SIGGEN': {1: 'automatically', 2: 'by wave action', 3: 'by hand', 4: 'by wind'},
+    'STATUS': {1: 'permanent', 2: 'occasional', 3: 'recommended', 4: 'disused', 5: 'periodically/intermittent', 6: 'reserved', 7: 'temporary', 8: 'private', 9: 'mandatory', 11: 'extinguished', 12: 'illuminated', 13: 'historic', 14: 'public', 15: 'synchronized', 16: 'watched', 17: 'un-watched', 18: 'existence doubtful'},
+    'SURTYP': {1: 'reconnaissance/sketch survey', 2: 'controlled survey', 4: 'examintion survey', 5: 'passage survey', 6: 'remotely sensed'},
+    'TECSOU': {1: 'found by echo-sounder', 2: 'found by side scan sonar', 3: 'found by multi-beam', 4: 'found by diver', 5: 'found by lead-line', 6: 'swept by wire-drag', 7: 'found by laser', 8: 'swept by vertical acoustic system', 9: 'found by electromagnetic sensor', 10: 'photogrammetry', 11: 'satelite imagery', 12: 'found by levelling', 13: 'swept by side-scan sonar', 14: 'computer generated'},
+    'T_ACWL': {1: 'better than 0.1m and 10 minutes', 2: 'worse than 0.1m or 10 minutes'},
+    'T_MTOD': {1: 'simplified harmonic method of tidal prediction', 2: 'full harmonic method of tidal prediction', 3: 'height and time difference non-harmonic method'},
+    '$TINTS': {1: 'darkest blue', 2: 'medium blue', 3: 'lightest blue'},
+    'TOPSHP': {1: 'cone, point up', 2: 'cone, point down', 3: 'sphere', 4: '2 sphere', 5: 'cylinder (can)', 6: 'board', 7: "x-shape (St. Andrew's cross)", 8: 'upright cross (St. George cross)', 9: 'cube, point up', 10: '2 cones, point to point', 11: '2 cones, base to base', 12: 'rhombus (diamond)', 13: '2 cones (points upward)', 14: '2 cones (points downward)', 15: 'besom, point up (broom or perch)', 16: 'besom, point down (broom or perch)', 17: 'flag', 18: 'sphere over rhombus', 19: 'square', 20: 'rectangle, horizontal', 21: 'rectangle, vertical', 22: 'trapezium, up', 23: 'trapezium, down', 24: 'triangle, point up', 25: 'triangle, point down', 26: 'circle', 27: 'two upright crosses (one over the other)', 28: 'T-shape', 29: 'triangle pointing up over a circle', 30: 'upright cross over a circle', 31: 'rhombus over a circle', 32: 'circle over a triangle pointing up', 33: 'other shape (see INFORM)'},
+    'TRAFIC': {1: 'inbound', 2: 'outbound', 3: 'one-way', 4: 'two-way'},
+    'VERDAT': {1: 'Mean low water springs', 2: 'Mean lower low water springs', 3: 'Mean sea level', 4: 'Lowest low water', 5: 'Mean low water', 6: 'Lowest low water springs', 7: 'Approximate mean low water springs', 8: 'Indian spring low water', 9: 'Low water springs', 10: 'Approximate lowest astronomical tide', 11: 'Nearly lowest low water', 12: 'Mean lower low water', 13: 'Low water', 14: 'Approximate mean low water', 15: 'Approximate mean lower low water', 16: 'Mean high water', 17: 'Mean high water springs', 18: 'High water', 19: 'Approximate mean sea level', 20: 'High water springs', 21: 'Mean higher high water', 22: 'Equinoctial spring low water', 23: 'Lowest astronomical tide', 24: 'Local datum', 25: 'International Great Lakes Datum 1985', 26: 'Mean water level', 27: 'Lower low water large tide', 28: 'Higher high water lage tide', 29: 'Nearly highest high water'},
+    'WATLEV': {1: 'partly submerged at high water', 2: 'always dry', 3: 'always under water/submerged', 4: 'covers and uncovers', 5: 'awash', 6: 'subject to inundation or flooding'},
+    'HORDAT': {1: 'WGS 72', 2: 'WGS 84', 3: 'European 1950', 4: 'Potsdam Datum', 5: 'Adindan', 6: 'Afgooye', 7: 'Ain el Abd 1970', 8: 'Anna 1 Astro 1965', 9: 'Antigua Island Astro 1943', 10: 'Arc 1950', 11: 'Arc 1960', 12: 'Ascension Island 1958', 13: 'Astro beacon \\E\\" 1945"', 14: 'Astro DOS 71/4', 15: 'Astro Tern Island (FRIG) 1961', 16: 'Astronimical Station 1952', 17: 'Australian Geodetic 1966', 18: 'Australian Geodetic 1984', 19: 'Ayabelle Lighthouse', 20: 'Bellevue (IGN)', 21: 'Bermuda 1957', 22: 'Bissau', 23: 'Bogota Observatory', 24: 'Bukit Rimpah', 25: 'Camp Area Astro', 26: 'Campo Inchauspe 1969', 27: 'Canton Astro 1966', 28: 'Cape', 29: 'Cape Canaveral', 30: 'Carthage', 31: 'Chatam Island Astro 1971', 32: 'Chua Astro', 33: 'Corrego Alegre', 34: 'Dabola', 35: 'Djakarta (Batavia)', 36: 'DOS 1968', 37: 'Easter Island 1967', 38: 'European 1979', 39: 'Fort Thomas 1955', 40: 'Gan 1970', 41: 'Geodetic Datum 1949', 42: 'Graciosa Base SW 1948', 43: 'Guam 1963', 44: 'Ganung Segara', 45: 'GUX 1 Astro', 46: 'Herat North', 47: 'Hjorsey 1955', 48: 'Hong Kong 1963', 49: 'Hu-Tzu-Shan', 50: 'Indian', 51: 'Indian 1954', 52: 'Indian 1975', 53: 'Ireland 1965', 54: 'ISTS 061 Astro 1968', 55: 'ISTS 073 Astro 1969', 56: 'Johnston Island 1961', 57: 'Kandawala', 58: 'Kerguelen Island 1949', 59: 'Kertau 1948', 60: 'Kusaie Astro 1951', 61: '', 62: '', 63: '', 64: '', 65: '', 66: '', 67: '', 68: '', 69: '', 70: '', 71: '', 72: '', 73: '', 74: '', 75: '', 76: '', 77: '', 78: '', 79: '', 80: '', 81: '', 82: '', 83: '', 84: '', 85: '', 86: '', 87: '', 88: '', 89: '', 90: '', 91: '', 92: '', 93: '', 94: '', 95: '', 96: '', 97: '', 98: '', 99: 'South Asia', 100: 'Tananarive Observatory 1925'},
+    'QUAPOS': {1: 'surveyed', 2: 'unsurveyed', 3: 'inadequately surveyed', 4: 'approximated', 5: 'position doubtful', 6: 'unreliable', 7: 'reported (not surveyed)', 8: 'reported (not confirmed)', 9: 'estimated', 10: 'precisely known', 11: 'calculated'},
+}
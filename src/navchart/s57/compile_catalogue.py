@@ -0,0 +1,119 @@
+"""Compile the S-57 catalogue CSV files into the catalogue and catalogue_values modules.
+
+Run ``python -m navchart.s57.compile_catalogue`` after changing any of the CSV files.
+"""
+import csv
+import sys
+from pathlib import Path
+
+
+SOURCE_DIRECTORY = Path(__file__).parent
+TARGET = "catalogue.py"
+VALUES_TARGET = "catalogue_values.py"
+
+HEADER = '''"""S-57 catalogue tables: record names, agencies, object classes and attributes.
+
+Each name table maps a code (as an int and as a string) and the name itself to the name, and each code table maps the
+same keys to the code, so S57Standard can use them as they are.
+
+Generated from the CSV files next to this module by compile_catalogue.py, do not edit by hand.
+"""
+'''
+
+VALUES_HEADER = '''"""S-57 enumerated attribute values: attribute name to the meaning of each of its values.
+
+Kept apart from the catalogue module since only decoding attribute values needs it.
+
+Generated from the CSV files next to this module by compile_catalogue.py, do not edit by hand.
+"""
+'''
+
+
+def _rows(path, header):
+    with open(path, "r", newline="") as h:
+        for line in csv.reader(h):
+            if line and line[0] != header:
+                yield line
+
+
+def _lookups(table):
+    # Names and codes are found from either, the first code listed for a name wins
+    names = {}
+    codes = {}
+    for code, name in table.items():
+        names[code] = name
+        names[str(code)] = name
+        codes[code] = code
+        codes[str(code)] = code
+    for code, name in table.items():
+        names.setdefault(name, name)
+        codes.setdefault(name, code)
+    return names, codes
+
+
+def _format_table(name, table):
+    lines = ["{} = {{".format(name)]
+    for key, value in table.items():
+        lines.append("    {!r}: {!r},".format(key, value))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def _format_module(header, tables):
+    return header + "".join("\n\n{}\n".format(_format_table(name, tables[name])) for name in tables)
+
+
+def _attributes(directory):
+    return {int(line[0]): line[2] for line in _rows(Path(directory) / "s57attributes.csv", "Code")}
+
+
+def build_tables(directory=SOURCE_DIRECTORY):
+    """Read the CSV files in directory into the dicts of the catalogue module, in the order written."""
+    directory = Path(directory)
+    tables = {}
+    for prefix, codes_name, path, header, column in (
+        ("RECORD_NAMES", "RECORD_NAME_CODES", "s57recordnames.csv", "Number", 1),
+        ("AGENCIES", "AGENCY_CODES", "s57agencies.csv", "Number", 1),
+        ("OBJECT_CLASSES", "OBJECT_CLASS_CODES", "s57objectclasses.csv", "Code", 2),
+    ):
+        names = {int(line[0]): line[column] for line in _rows(directory / path, header)}
+        tables[prefix], tables[codes_name] = _lookups(names)
+    tables["ATTRIBUTES"], tables["ATTRIBUTE_CODES"] = _lookups(_attributes(directory))
+    tables["ATTRIBUTE_TYPES"] = {
+        line[2]: line[3] for line in _rows(directory / "s57attributes.csv", "Code") if len(line) > 3
+    }
+    return tables
+
+
+def build_value_tables(directory=SOURCE_DIRECTORY):
+    """Read the enumerated attribute values in directory into the dicts of the catalogue_values module."""
+    directory = Path(directory)
+    attributes = _attributes(directory)
+    expected_input = {}
+    for line in _rows(directory / "s57expectedinput.csv", "Code"):
+        name = attributes.get(int(line[0]), line[0])
+        expected_input.setdefault(name, {})[int(line[1])] = line[2]
+    return {"EXPECTED_INPUT": expected_input}
+
+
+def compile_catalogue(directory=SOURCE_DIRECTORY):
+    """Return the source of the catalogue module built from the CSV files in directory."""
+    return _format_module(HEADER, build_tables(directory))
+
+
+def compile_catalogue_values(directory=SOURCE_DIRECTORY):
+    """Return the source of the catalogue_values module built from the CSV files in directory."""
+    return _format_module(VALUES_HEADER, build_value_tables(directory))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = Path(argv[0]) if argv else SOURCE_DIRECTORY
+    for name, source in ((TARGET, compile_catalogue()), (VALUES_TARGET, compile_catalogue_values())):
+        with open(target / name, "w", newline="\n") as h:
+            h.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
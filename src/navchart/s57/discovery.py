@@ -0,0 +1,158 @@
+import logging
+import os
+from pathlib import Path
+
+from .catalog import S57Catalog
+from .iso8211 import DataFile
+from .s57 import S57Cell, update_sequence
+
+
+CATALOG_FILE = "CATALOG.031"
+
+
+def edition_directory(path):
+    """Return the folder that holds every file of one edition of a cell.
+
+    In the ENC_ROOT/CELL/EDITION/UPDATE layout each file is in a folder named after its update number (0 for the base
+    cell), so the edition folder is the one above it. Otherwise the files of an edition sit side by side.
+    """
+    path = Path(path)
+    return path.parent.parent if path.parent.name.isdigit() else path.parent
+
+
+def read_edition(path):
+    """Return the edition number (DSID EDTN) of a base cell or update file, from its first record."""
+    for record in DataFile.stream(path, lazy=True):
+        if "DSID" in record:
+            return int(record["DSID"]["EDTN"])
+        break
+    return None
+
+
+class ExchangeSet:
+    """Index of the base cells, update files and support files under an ENC_ROOT (or any folder of cells).
+
+    The index is built from CATALOG.031 when the root has one, otherwise with a single walk of the directory tree.
+    Update files are matched to the base cell of the same name in the same edition folder (see edition_directory()),
+    so the usual CELL/EDITION/UPDATE folder layout works and editions kept side by side do not mix. When a cell name
+    has several base cells, the one with the highest edition is used. Update files with no base cell in their edition
+    folder are checked against the edition of the base cell they would be applied to. Files are only read to break
+    these ties.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.catalog = None
+        # Cell name (e.g. US4AK3SB) to the path of its .000 file
+        self.base_cells = {}
+        # Cell name to a dict of update number to path, for the edition of the base cell
+        self.updates = {}
+        # Upper case file name to path
+        self.support_files = {}
+        # Cell name to edition folder to the base cell paths and the update numbers and paths found in it
+        self._editions = {}
+
+    @staticmethod
+    def scan(root, use_catalog=True):
+        """Index root, from its CATALOG.031 if there is one (and use_catalog is set), otherwise by walking it."""
+        exchange_set = ExchangeSet(root)
+        catalog_path = exchange_set.root / CATALOG_FILE
+        if use_catalog and catalog_path.is_file():
+            exchange_set._index_catalog(catalog_path)
+        else:
+            exchange_set._index_tree()
+        exchange_set._resolve_editions()
+        return exchange_set
+
+    def _index_catalog(self, catalog_path):
+        self.catalog = S57Catalog().from_file(catalog_path)
+        for entry in self.catalog:
+            if entry.name.upper() != CATALOG_FILE:
+                self._add_file(entry.name, entry.path)
+
+    def _index_tree(self):
+        search_dirs = [self.root]
+        while search_dirs:
+            with os.scandir(search_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        search_dirs.append(entry.path)
+                    else:
+                        self._add_file(entry.name, Path(entry.path))
+
+    def _add_file(self, name, path):
+        stem, _, extension = name.rpartition(".")
+        if len(extension) == 3 and extension.isdigit():
+            bases, updates = self._editions.setdefault(stem, {}).setdefault(edition_directory(path), ([], []))
+            if extension == "000":
+                bases.append(path)
+            else:
+                updates.append((int(extension), path))
+        elif name.upper() != CATALOG_FILE:
+            self.support_files[name.upper()] = path
+
+    def _resolve_editions(self):
+        for stem, editions in self._editions.items():
+            bases = [(directory, path) for directory in editions for path in editions[directory][0]]
+            if not bases:
+                continue
+            directory, base_path = self._latest_base(stem, bases)
+            self.base_cells[stem] = base_path
+            updates = {}
+            edition = None
+            for update_directory, (update_bases, update_paths) in sorted(editions.items()):
+                if update_directory != directory:
+                    if update_bases or not update_paths:
+                        continue
+                    # Updates without a base cell of their own are only used if they are for the same edition
+                    if edition is None:
+                        edition = read_edition(base_path)
+                    update_paths = [(n, path) for n, path in update_paths if read_edition(path) == edition]
+                for number, path in sorted(update_paths):
+                    if number in updates:
+                        logging.getLogger(__name__).warning(
+                            "Duplicate update {} of {} ({} and {}), keeping {}".format(
+                                number, stem, updates[number], path, updates[number]
+                            )
+                        )
+                        continue
+                    updates[number] = path
+            if updates:
+                self.updates[stem] = updates
+        self._editions = {}
+
+    @staticmethod
+    def _latest_base(stem, bases):
+        if len(bases) == 1:
+            return bases[0]
+        bases = sorted(bases, key=lambda base: (-(read_edition(base[1]) or 0), str(base[1])))
+        logging.getLogger(__name__).warning("Several base cells for {} ({}), keeping {}".format(
+            stem, ", ".join(str(path) for _, path in bases), bases[0][1]
+        ))
+        return bases[0]
+
+    def __len__(self):
+        return len(self.base_cells)
+
+    def cell_names(self):
+        return sorted(self.base_cells)
+
+    def update_paths(self, name):
+        """Return the update files of a cell in order of their update number, up to the first missing one."""
+        return update_sequence(name, self.updates.get(name, {}))
+
+    def support_path(self, filename):
+        return self.support_files.get(filename.upper())
+
+    def cells(self, **kwargs):
+        """Yield an S57Cell for each base cell, in name order, with its update and support files resolved.
+
+        Keyword arguments are passed on to S57Cell (e.g. numeric_mode or cache).
+        """
+        for name in self.cell_names():
+            yield S57Cell(
+                self.base_cells[name],
+                update_paths=self.update_paths(name),
+                support_paths=self.support_files,
+                **kwargs
+            )
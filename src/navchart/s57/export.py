@@ -0,0 +1,231 @@
+import json
+import os
+import struct
+import sys
+
+from .iso8211 import import_numpy
+
+
+# ISO WKB geometry type codes, 1000 is added for geometries with a Z coordinate
+WKB_TYPES = {
+    "POINT": 1,
+    "LINESTRING": 2,
+    "POLYGON": 3,
+    "MULTIPOINT": 4,
+}
+
+GEOMETRY_FORMATS = ("wkb", "wkt")
+
+GEOJSON_TYPES = {
+    "POINT": "Point",
+    "LINESTRING": "LineString",
+    "POLYGON": "Polygon",
+    "MULTIPOINT": "MultiPoint",
+}
+
+# RFC 8142 record separator that starts each GeoJSON text of a sequence
+RECORD_SEPARATOR = "\x1e"
+
+_HEADER = struct.Struct("<BI")
+_COUNT = struct.Struct("<I")
+
+
+def _is_array(points):
+    # Only the NUMPY numeric mode makes arrays, so numpy has been imported if points is one
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(points, numpy.ndarray)
+
+
+def _dimensions(points):
+    if _is_array(points):
+        return points.shape[1]
+    return len(points[0]) if len(points) else 2
+
+
+def _scaled_array(points, dimensions, factors):
+    numpy = import_numpy()
+    values = numpy.asarray(points)[:, :dimensions].astype("<f8")
+    if factors is not None:
+        values /= numpy.asarray(factors[:dimensions], dtype="<f8")
+    return values
+
+
+def _coordinate_bytes(points, dimensions, factors=None):
+    if _is_array(points):
+        return _scaled_array(points, dimensions, factors).tobytes()
+    if factors is None:
+        values = [float(point[i]) for point in points for i in range(0, dimensions)]
+    else:
+        values = [float(point[i]) / float(factors[i]) for point in points for i in range(0, dimensions)]
+    return struct.pack("<{}d".format(len(values)), *values)
+
+
+def _wkb_type(geometry_type, dimensions):
+    return WKB_TYPES[geometry_type] + (1000 if dimensions > 2 else 0)
+
+
+def geometry_to_wkb(geometry, factors=None):
+    """Encode a (type, points) feature geometry as little-endian ISO WKB.
+
+    Each coordinate column is divided by the matching entry of factors when given (used for raw integer
+    coordinates). Returns None for features without a geometry.
+    """
+    geometry_type, points = geometry
+    if geometry_type == "NONE":
+        return None
+    if geometry_type == "POINT":
+        dimensions = len(points)
+        return _HEADER.pack(1, _wkb_type(geometry_type, dimensions)) + _coordinate_bytes([points], dimensions, factors)
+    if geometry_type == "LINESTRING":
+        dimensions = _dimensions(points)
+        return b"".join((
+            _HEADER.pack(1, _wkb_type(geometry_type, dimensions)),
+            _COUNT.pack(len(points)),
+            _coordinate_bytes(points, dimensions, factors)
+        ))
+    if geometry_type == "POLYGON":
+        dimensions = _dimensions(points[0])
+        parts = [_HEADER.pack(1, _wkb_type(geometry_type, dimensions)), _COUNT.pack(len(points))]
+        for ring in points:
+            parts.append(_COUNT.pack(len(ring)))
+            parts.append(_coordinate_bytes(ring, dimensions, factors))
+        return b"".join(parts)
+    if geometry_type == "MULTIPOINT":
+        dimensions = _dimensions(points)
+        point_header = _HEADER.pack(1, _wkb_type("POINT", dimensions))
+        header = _HEADER.pack(1, _wkb_type(geometry_type, dimensions)) + _COUNT.pack(len(points))
+        if _is_array(points):
+            # Every member is a full point, so build them all as one record array
+            numpy = import_numpy()
+            records = numpy.empty(len(points), dtype=[("header", "V5"), ("coordinates", "<f8", (dimensions,))])
+            records["header"] = numpy.frombuffer(point_header, dtype="V5")[0]
+            records["coordinates"] = _scaled_array(points, dimensions, factors)
+            return header + records.tobytes()
+        return header + b"".join(point_header + _coordinate_bytes([point], dimensions, factors) for point in points)
+    raise ValueError("Unrecognized geometry type {}".format(geometry_type))
+
+
+def _wkt_coordinates(points, template, factors=None):
+    # One formatting call per ring instead of one per coordinate
+    if _is_array(points):
+        values = points[:, :2]
+        if factors is not None:
+            values = values / import_numpy().asarray(factors[:2], dtype="float64")
+        values = values.ravel().tolist()
+    elif factors is None:
+        values = [value for point in points for value in point[:2]]
+    else:
+        values = [point[i] / factors[i] for point in points for i in (0, 1)]
+    return (template * len(points) % tuple(values))[:-1]
+
+
+def geometry_to_wkt(geometry, factors=None):
+    """Encode a (type, points) feature geometry as 2D WKT, or None for features without a geometry."""
+    geometry_type, points = geometry
+    if geometry_type == "NONE":
+        return None
+    if geometry_type == "POINT":
+        return "POINT ({})".format(_wkt_coordinates([points], "%s %s,", factors))
+    if geometry_type == "MULTIPOINT":
+        return "MULTIPOINT ({})".format(_wkt_coordinates(points, "(%s %s),", factors))
+    if geometry_type == "LINESTRING":
+        return "LINESTRING ({})".format(_wkt_coordinates(points, "%s %s,", factors))
+    if geometry_type == "POLYGON":
+        return "POLYGON ({})".format(",".join(
+            "({})".format(_wkt_coordinates(ring, "%s %s,", factors)) for ring in points
+        ))
+    raise ValueError("Unrecognized geometry type {}".format(geometry_type))
+
+
+def write_features(features, target, geometry_format="wkb", factors=None, batch_size=1024):
+    """Write features as lines of identifier, layer and geometry separated by tabs.
+
+    The lines are in the PostgreSQL COPY text format, with the geometry as hex encoded WKB (which PostGIS reads
+    directly into a geometry column) or as WKT. Features without a geometry are skipped. target is a path or a
+    binary file-like object, which is left open. Returns the number of features written.
+    """
+    if geometry_format not in GEOMETRY_FORMATS:
+        raise ValueError("Unknown geometry format {}, expected one of {}".format(geometry_format, GEOMETRY_FORMATS))
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb", buffering=1024 * 1024) as handle:
+            return write_features(features, handle, geometry_format, factors, batch_size)
+    count = 0
+    lines = []
+    for feature in features:
+        if geometry_format == "wkb":
+            encoded = geometry_to_wkb(feature.geometry, factors)
+            encoded = encoded.hex() if encoded is not None else None
+        else:
+            encoded = geometry_to_wkt(feature.geometry, factors)
+        if encoded is None:
+            continue
+        lines.append("{}\t{}\t{}\n".format(feature.identifier, feature.layer, encoded))
+        count += 1
+        if len(lines) >= batch_size:
+            target.write("".join(lines).encode("utf-8"))
+            lines = []
+    if lines:
+        target.write("".join(lines).encode("utf-8"))
+    return count
+
+
+def _json_coordinates(points, factors=None):
+    if _is_array(points):
+        if factors is not None:
+            points = points / import_numpy().asarray(factors[:points.shape[-1]], dtype="float64")
+        return points.tolist()
+    if factors is None:
+        return [[float(value) for value in point] for point in points]
+    return [[float(value) / float(factors[i]) for i, value in enumerate(point)] for point in points]
+
+
+def geometry_to_geojson(geometry, factors=None):
+    """Convert a (type, points) feature geometry into a GeoJSON geometry dict, or None without a geometry."""
+    geometry_type, points = geometry
+    if geometry_type == "NONE":
+        return None
+    if geometry_type not in GEOJSON_TYPES:
+        raise ValueError("Unrecognized geometry type {}".format(geometry_type))
+    if geometry_type == "POINT":
+        coordinates = _json_coordinates([points], factors)[0]
+    elif geometry_type == "POLYGON":
+        coordinates = [_json_coordinates(ring, factors) for ring in points]
+    else:
+        coordinates = _json_coordinates(points, factors)
+    return {"type": GEOJSON_TYPES[geometry_type], "coordinates": coordinates}
+
+
+def feature_to_geojson(feature, factors=None):
+    properties = {"layer": feature.layer}
+    properties.update(feature.attributes)
+    return {
+        "type": "Feature",
+        "id": feature.identifier,
+        "geometry": geometry_to_geojson(feature.geometry, factors),
+        "properties": properties,
+    }
+
+
+def write_geojson(features, target, sequence=False, factors=None, batch_size=1024):
+    """Write features as newline-delimited GeoJSON, or as GeoJSON Text Sequences (RFC 8142) if sequence is True.
+
+    Features are encoded and written as they come, batch_size at a time. target is a path or a binary file-like
+    object, which is left open. Returns the number of features written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb", buffering=1024 * 1024) as handle:
+            return write_geojson(features, handle, sequence, factors, batch_size)
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    prefix = RECORD_SEPARATOR if sequence else ""
+    count = 0
+    texts = []
+    for feature in features:
+        texts.append(prefix + encoder.encode(feature_to_geojson(feature, factors)) + "\n")
+        count += 1
+        if len(texts) >= batch_size:
+            target.write("".join(texts).encode("utf-8"))
+            texts = []
+    if texts:
+        target.write("".join(texts).encode("utf-8"))
+    return count
+
@@ -0,0 +1,122 @@
+import os
+
+from .iso8211 import DataFile, bytes_to_int
+from .s57 import S57DataFile, S57Feature, NumericMode, feature_key, geometry_key, split_geometry_key
+from .spatial import geometry_bounds
+
+
+# DSSI counter for each vector record name (RCNM)
+VECTOR_COUNTS = {110: "NOIN", 120: "NOCN", 130: "NOED", 140: "NOFA"}
+
+
+def _feature_count_name(layer):
+    if layer.startswith("M_"):
+        return "NOMR"
+    if layer.startswith("C_"):
+        return "NOLR"
+    if layer.startswith("$"):
+        return "NOCR"
+    return "NOGR"
+
+
+def _lnam_key(lnam):
+    # LNAM is AGEN, FIDN, FIDS, stored reversed like the other bit fields
+    return feature_key(bytes_to_int(lnam[6:]), bytes_to_int(lnam[2:6]), bytes_to_int(lnam[0:2]))
+
+
+def _intersects(bounds, bbox):
+    return bounds is not None and not (
+        bounds[2] < bbox[0] or bounds[0] > bbox[2] or bounds[3] < bbox[1] or bounds[1] > bbox[3]
+    )
+
+
+def extract_cell(path, target, bbox=None, layers=None):
+    """Write a new cell with the features of a base cell file that are in layers and whose bounding box intersects
+    bbox (west, south, east, north), along with the vector records they use and the DSID and DSPM records.
+
+    Vector records are followed from the features through their VRPT pointers (edges to their nodes), feature to
+    feature pointers (FFPT) to features that are left out are dropped and the DSSI record counts are set to match.
+    Geometries are kept whole rather than clipped to bbox. The source is read once: vector records are held as
+    encoded bytes and only the features of the selected layers are kept until the end of the file. target is a path
+    or a binary file-like object, which is left open. Returns the number of features written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb", buffering=1024 * 1024) as handle:
+            return _extract(path, handle, bbox, layers, os.path.basename(target))
+    return _extract(path, target, bbox, layers, None)
+
+
+def _extract(path, target, bbox, layers, cell_name):
+    if isinstance(layers, str):
+        layers = [layers]
+    layers = set(layers) if layers is not None else None
+    # Vector records are parsed to resolve feature geometries, degrees are enough to test the bounding box
+    cell_data = S57DataFile(path, numeric_mode=NumericMode.FLOAT)
+    cell_data.reset()
+    metadata_records = []
+    vector_records = {}
+    candidates = []
+    file_metadata = None
+    for record in DataFile.stream(path, lazy=True):
+        file_metadata = record.file_metadata
+        if "FRID" in record:
+            if record["FRID"]["RUIN"] != 1:
+                continue
+            feature = S57Feature(cell_data.standard).from_iso8211(record)
+            if layers is not None and feature.layer not in layers:
+                continue
+            feature.set_reference_cell(cell_data)
+            # Records with feature pointers are kept decoded, the pointers are filtered once the selection is known
+            candidates.append((feature, record.load() if "FFPT" in record else record.to_iso8211()))
+        elif "VRID" in record:
+            cell_data._process_record(record)
+            vector_records[geometry_key(record["VRID"]["RCNM"], record["VRID"]["RCID"])] = record.to_iso8211()
+        elif "DSID" in record or "DSPM" in record:
+            cell_data._process_record(record)
+            metadata_records.append(record.load())
+    if file_metadata is None:
+        raise ValueError("{} has no records".format(path))
+
+    selected = []
+    for feature, record in candidates:
+        if bbox is None or _intersects(geometry_bounds(feature.geometry), bbox):
+            selected.append((feature, record))
+    selected_keys = set(feature.key for feature, _ in selected)
+
+    vector_keys = set()
+    pending = [ref.key for feature, _ in selected for ref in feature.spatial_references]
+    while pending:
+        key = pending.pop()
+        if key in vector_keys or key not in cell_data.geometries:
+            continue
+        vector_keys.add(key)
+        pending.extend(ref.key for ref in cell_data.geometries[key].spatial_references)
+
+    counts = dict.fromkeys(("NOMR", "NOCR", "NOGR", "NOLR", "NOIN", "NOCN", "NOED", "NOFA"), 0)
+    for feature, _ in selected:
+        counts[_feature_count_name(feature.layer)] += 1
+    for key in vector_keys:
+        counts[VECTOR_COUNTS[split_geometry_key(key)[0]]] += 1
+
+    target.write(file_metadata.to_iso8211())
+    for record in metadata_records:
+        if "DSID" in record:
+            if cell_name is not None:
+                record["DSID"].data = dict(record["DSID"].data, DSNM=cell_name)
+            if "DSSI" in record:
+                record["DSSI"].data = dict(record["DSSI"].data, **counts)
+        target.write(record.to_iso8211())
+    for key, encoded in vector_records.items():
+        if key in vector_keys:
+            target.write(encoded)
+    for feature, record in selected:
+        if isinstance(record, bytes):
+            target.write(record)
+            continue
+        pointers = [pointer for pointer in record["FFPT"].data if _lnam_key(pointer["LNAM"]) in selected_keys]
+        if pointers:
+            record["FFPT"].data = pointers
+        else:
+            del record["FFPT"]
+        target.write(record.to_iso8211())
+    return len(selected)
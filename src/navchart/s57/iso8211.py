@@ -1,6 +1,26 @@
+import abc
 import decimal
+import functools
+import itertools
 import logging
 import enum
+import mmap
+import os
+import struct
+
+
+@functools.lru_cache(None)
+def import_numpy():
+    """Return the numpy module, or None if it is not installed.
+
+    numpy is only needed by the NUMPY numeric mode and the array decoders, so it is imported on first use rather
+    than with the package.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 def bytes_to_int(byte_list):
@@ -64,24 +84,55 @@ class DataStream:
     FT_CHAR = "\x1e"
     UT_CHAR = "\x1f"
 
-    def __init__(self, data=[]):
-        self.data = data
-        self.index = 0
+    FT_CHAR_BYTES = b"\x1e"
+    UT_CHAR_BYTES = b"\x1f"
+
+    _DELIMITERS = {FT: b"\x1e", UT: b"\x1f"}
+
+    def __init__(self, data=None, start=0, end=None, real_type=decimal.Decimal):
+        # data is any sliceable byte buffer (bytes, bytearray, mmap); the stream only ever reads the
+        # window [start, end) so sub-streams can share the buffer of their parent without copying it.
+        self.data = data if data is not None else bytearray()
+        self.start = start
+        self.end = len(self.data) if end is None else end
+        self.index = start
+        # Type used for R (real) formatted values
+        self.real_type = real_type
 
     def __repr__(self):
-        return bytes(self.data).decode("utf-8", errors="replace")
+        return bytes(self.data[self.start:self.end]).decode("utf-8", errors="replace")
 
     def empty(self):
-        return self.index >= len(self.data)
+        return self.index >= self.end
+
+    def remaining(self):
+        return max(self.end - self.index, 0)
+
+    def remaining_data(self):
+        """Return the number of bytes left, leaving out the field terminator if the stream ends with one."""
+        remaining = self.remaining()
+        if remaining and self.data[self.end - 1] == DataStream.FT:
+            return remaining - 1
+        return remaining
 
     def peek(self):
         return self.data[self.index]
 
-    def seek(self, byte, start_at=0):
-        for i in range(start_at, len(self.data)):
-            if self.data[i] == byte:
-                return i
-        return None
+    def seek(self, byte, start_at=None, end_at=None):
+        if start_at is None:
+            start_at = self.index
+        if end_at is None or end_at > self.end:
+            end_at = self.end
+        if isinstance(byte, int):
+            byte = DataStream._DELIMITERS.get(byte) or bytes((byte,))
+        pos = self.data.find(byte, start_at, end_at)
+        return pos if pos >= 0 else None
+
+    def substream(self, length):
+        end = min(self.index + length, self.end)
+        sub = DataStream(self.data, self.index, end, self.real_type)
+        self.index = end
+        return sub
 
     def read(self, length):
         chunk = None
@@ -96,27 +147,35 @@ class DataStream:
                 chunk = self.data[self.index:pos]
                 self.index = pos + 1
         elif length == DataStream.TO_FTUT:
-            pos1 = self.seek(DataStream.UT, self.index)
-            pos2 = self.seek(DataStream.FT, self.index)
-            pos = None
-            if pos1 is None:
+            # Only look for a field terminator before the first unit terminator so neither search runs past
+            # the delimiter we actually stop at
+            pos = self.seek(DataStream.UT, self.index)
+            pos2 = self.seek(DataStream.FT, self.index, pos)
+            if pos2 is not None:
                 pos = pos2
-            elif pos2 is None:
-                pos = pos1
-            else:
-                pos = min(pos1, pos2)
             if pos is not None:
                 chunk = self.data[self.index:pos]
                 self.index = pos + 1
         elif length > 0:
-            chunk = self.data[self.index:self.index+length]
-            self.index += length
+            end = min(self.index + length, self.end)
+            chunk = self.data[self.index:end]
+            self.index = end
         return chunk
 
     def write(self, byte_list):
-        self.data.append(byte_list)
+        self.data += byte_list
+        self.end = len(self.data)
         return len(byte_list)
 
+    def read_wide(self):
+        """Read a UCS-2 value up to its two byte unit or field terminator (used at lexical level 2)."""
+        end = self.index
+        while end + 1 < self.end and not (self.data[end + 1] == 0 and self.data[end] in (DataStream.UT, DataStream.FT)):
+            end += 2
+        chunk = self.data[self.index:min(end, self.end)]
+        self.index = min(end + 2, self.end)
+        return bytes(chunk).decode("utf-16-le", errors="replace") if chunk else None
+
     def read_str(self, length, encoding='ascii'):
         chunk = self.read(length)
         return bytes(chunk).decode(encoding) if chunk else None
@@ -135,6 +194,10 @@ class DataStream:
         chunk = self.read_str(length)
         return decimal.Decimal(chunk) if chunk else None
 
+    def read_real(self, length):
+        chunk = self.read_str(length)
+        return self.real_type(chunk) if chunk else None
+
     def write_decimal(self, number, length=None):
         return self.write_str(self._fix_number(number, length))
 
@@ -147,28 +210,16 @@ class DataStream:
         return num
 
     def read_binary_int(self, length, signed=False):
-        byte_list = self.read(length)
-        bit_count = 8 * len(byte_list)
-        num = 0
-        for v in reversed(byte_list):
-            num = (num << 8) | v
-        if signed and len(bin(num)[2:]) == bit_count:
-            # Leading one means we have a negative number, convert according to ISO-8211 standard
-            num = int(bin(num)[3:], 2) + (-1 * (2 ** (bit_count - 1)))
-        return num
+        # ISO-8211 binary integers are little-endian, signed ones use two's complement
+        return int.from_bytes(self.read(length), byteorder='little', signed=signed)
 
-    def write_binary_int(self, number, length):
-        if number >= 0:
-            return self.write(number.to_bytes(length, byteorder='big'))
-        else:
-            data = number.to_bytes(length, byteorder='little')
-            data[0] += 128
-            return self.write(bytes(reversed(data)))
+    def write_binary_int(self, number, length, signed=False):
+        return self.write(number.to_bytes(length, byteorder='little', signed=signed))
 
     def read_bytes(self, length, le_transform=False):
         data = self.read(length)
         if le_transform:
-            return bytes(reversed(data))
+            return bytes(data[::-1])
         else:
             return bytes(data)
 
@@ -179,7 +230,7 @@ class DataStream:
             return self.write(bytes(data))
 
 
-class FieldDescriptor:
+class FieldDescriptor(abc.ABC):
 
     def __init__(self, tag_name, parent_tag=None):
         self.tag_name = tag_name
@@ -191,18 +242,22 @@ class FieldDescriptor:
         self.parent_tag = parent_tag
 
     def length(self):
-        return 11
+        return len(self.to_iso8211())
+
+    @property
+    def wide_text(self):
+        # Lexical level 2 (escape sequence %/A) text is UCS-2, with two byte unit and field terminators
+        return self.escape == "%/A"
+
+    def field_terminator(self):
+        return b"\x1e\x00" if self.wide_text else DataStream.FT_CHAR_BYTES
+
+    def _field_controls(self):
+        return "{}{}{}{}{}".format(self.structure, self.data_type, self.auxiliary, self.graphics, self.escape)
 
     def to_iso8211(self):
-        data = [
-            str(self.structure),
-            str(self.data_type),
-            self.auxiliary,
-            self.graphics,
-            self.escape,
-            DataStream.UT_CHAR
-        ]
-        return ''.join(data)
+        """Encode the field controls that start every descriptor, subclasses add what follows them."""
+        return self._field_controls().encode("latin-1")
 
     @staticmethod
     def from_stream_base(field, stream):
@@ -219,32 +274,82 @@ class DataFieldDescriptor(FieldDescriptor):
     def __init__(self, tag_name, long_name, parent_tag=None):
         super().__init__(tag_name, parent_tag)
         self.long_name = long_name
-
-    def length(self):
-        return super().length() + len(self.long_name) + 1
+        # Format controls as read from the file (e.g. "(A(2),I(10),3b11)"), written back as they were
+        self.format_controls = None
 
     def to_iso8211(self):
-        return super().to_iso8211() + self.long_name + DataStream.UT_CHAR
+        return super().to_iso8211() + "".join([
+            self.long_name or "",
+            DataStream.UT_CHAR,
+            self._descriptor_list(),
+            DataStream.UT_CHAR,
+            self.format_controls or "({})".format(self._format_list()),
+            DataStream.FT_CHAR
+        ]).encode("latin-1")
+
+    def _descriptor_list(self):
+        return ""
+
+    @abc.abstractmethod
+    def _format_list(self):
+        """Return the format controls built from the subfield formats, without the enclosing parentheses."""
 
     def data_from_stream(self, stream):
         pass
 
+    @abc.abstractmethod
+    def data_to_iso8211(self, data):
+        """Encode the value of a field, including its field terminator."""
+
     @staticmethod
     def value_from_stream(format_code, stream):
+        return DataFieldDescriptor.value_reader(format_code)(stream)
+
+    @staticmethod
+    def value_reader(format_code, wide=False):
         read_length = DataFieldDescriptor._interpret_field_length(format_code)
+        if format_code[0] == 'A' and wide and read_length == DataStream.TO_FTUT:
+            return lambda stream: stream.read_wide()
         if format_code[0] == 'A':
             # TODO: Check how we pull the encoding
-            return stream.read_str(read_length, 'latin-1')
+            return lambda stream: stream.read_str(read_length, 'latin-1')
         if format_code[0] == "I":
-            return stream.read_int(read_length)
+            return lambda stream: stream.read_int(read_length)
         if format_code[0] == "R":
-            return stream.read_decimal(read_length)
+            return lambda stream: stream.read_real(read_length)
         if format_code[0] == "b":
-            return stream.read_binary_int(read_length, signed=format_code[1] == "2")
+            signed = format_code[1] == "2"
+            return lambda stream: stream.read_binary_int(read_length, signed=signed)
         if format_code[0] == "B":
-            return stream.read_bytes(read_length, le_transform=True)
+            return lambda stream: stream.read_bytes(read_length, le_transform=True)
         raise ValueError("Unsupported field format for parsing: {}".format(format_code))
 
+    @staticmethod
+    def value_writer(format_code, wide=False):
+        """Return a function encoding one value of format_code into bytes, the reverse of value_reader()."""
+        write_length = DataFieldDescriptor._interpret_field_length(format_code)
+        if format_code[0] == "A" and wide and write_length == DataStream.TO_FTUT:
+            return lambda value: ("" if value is None else value).encode("utf-16-le") + b"\x1f\x00"
+        if format_code[0] in "AIR":
+            if write_length == DataStream.TO_FTUT:
+                return lambda value: ("" if value is None else str(value)).encode("latin-1") + DataStream.UT_CHAR_BYTES
+            pad = " " if format_code[0] == "A" else "0"
+            return lambda value: _fixed_text(value, write_length, pad)
+        if format_code[0] == "b":
+            signed = format_code[1] == "2"
+            return lambda value: int(value).to_bytes(write_length, byteorder="little", signed=signed)
+        if format_code[0] == "B":
+            return lambda value: bytes(value)[::-1]
+        raise ValueError("Unsupported field format for writing: {}".format(format_code))
+
+    @staticmethod
+    def has_more_values(stream, wide=False):
+        # The field terminator is part of the field data but never starts a new value
+        remaining = stream.remaining()
+        if wide:
+            return remaining > 2 or (remaining == 2 and stream.peek() != DataStream.FT)
+        return remaining > 1 or (remaining == 1 and stream.peek() != DataStream.FT)
+
     @staticmethod
     def _interpret_field_length(format_code):
         if len(format_code) == 1:
@@ -262,12 +367,13 @@ class DataFieldDescriptor(FieldDescriptor):
         header_info = DataStream(stream.read(9))
         long_name = stream.read_str(DataStream.TO_UT)
         descriptors = stream.read_str(DataStream.TO_UT)
-        formats = stream.read_str(DataStream.TO_FT)[1:-1]
+        format_controls = stream.read_str(DataStream.TO_FT)
+        formats = format_controls[1:-1]
         if not descriptors:
-            f = SingleValueDataFieldDescriptor.from_stream_components(tag_name, long_name, formats)
+            f = SingleValueDataFieldDescriptor.from_stream_components(tag_name, long_name, formats, header_info)
         else:
-            f = ArrayDataFieldDescriptor.from_stream_components(tag_name, long_name, descriptors, formats)
-        FieldDescriptor.from_stream_base(f, header_info)
+            f = ArrayDataFieldDescriptor.from_stream_components(tag_name, long_name, descriptors, formats, header_info)
+        f.format_controls = format_controls
         for parent in control_field.data_tree:
             if f.tag_name in control_field.data_tree[parent]:
                 f.parent_tag = parent
@@ -281,24 +387,29 @@ class SingleValueDataFieldDescriptor(DataFieldDescriptor):
         self.format_code = frmt
         self.structure = 0
         self.data_type = 1 if not frmt.startswith("b") else 2
+        self.compile()
 
-    def length(self):
-        return super().length() + 2 + len(self.format_code)
+    def compile(self):
+        """Build the reader and writer of the value, again after the escape sequence (and so wide_text) changes."""
+        self._reader = DataFieldDescriptor.value_reader(self.format_code, self.wide_text)
+        self._writer = DataFieldDescriptor.value_writer(self.format_code, self.wide_text)
 
-    def to_iso8211(self):
-        return ''.join([
-            super().to_iso8211(),
-            DataStream.UT_CHAR,
-            self.format_code,
-            DataStream.FT_CHAR
-        ])
+    def _format_list(self):
+        return self.format_code
 
     def data_from_stream(self, stream):
-        return DataFieldDescriptor.value_from_stream(self.format_code, stream)
+        return self._reader(stream)
+
+    def data_to_iso8211(self, data):
+        return self._writer(data) + self.field_terminator()
 
     @staticmethod
-    def from_stream_components(tag_name, long_name, formats):
-        return SingleValueDataFieldDescriptor(long_name, tag_name, formats)
+    def from_stream_components(tag_name, long_name, formats, header_info=None):
+        f = SingleValueDataFieldDescriptor(long_name, tag_name, formats)
+        if header_info is not None:
+            FieldDescriptor.from_stream_base(f, header_info)
+            f.compile()
+        return f
 
 
 class ArrayDataFieldDescriptor(DataFieldDescriptor):
@@ -309,32 +420,43 @@ class ArrayDataFieldDescriptor(DataFieldDescriptor):
         self.structure_order = []
         self.structure = 1 if not multi_valued else 2
         self.data_type = 6
+        self.compile()
 
     def add_sub_field(self, tag_name, field_format):
         self.structure_order.append(tag_name)
         self.internal_structure[tag_name] = field_format
+        self.format_controls = None
+        self.compile()
 
-    def length(self):
-        total = super().length()
-        # Descriptor fields
-        total += len(self._descriptor_list())
-        total += 1
-        # Format fields
-        total += len(self._format_list())
-        total += 1
-        return total
+    def compile(self):
+        """Build the DecoderPlan of the subfields, again after the escape sequence (and so wide_text) changes."""
+        self._decoder = DecoderPlan(
+            [(key, self.internal_structure[key]) for key in self.structure_order],
+            self.wide_text
+        )
+        return self._decoder
 
     def data_from_stream(self, stream):
-        values = []
-        while not stream.empty():
-            arr = {}
-            for idx, key in enumerate([x for x in self.structure_order]):
-                arr[key] = DataFieldDescriptor.value_from_stream(self.internal_structure[key], stream)
-            values.append(arr)
+        values = self._decoder.decode(stream, self.structure == 2)
         if self.structure == 2:
             return values
         else:
-            return values[0]
+            return values[0] if values else None
+
+    def data_to_iso8211(self, data):
+        if self.structure != 2:
+            data = [data] if data is not None else []
+        return self._decoder.encode(data) + self.field_terminator()
+
+    def array_from_stream(self, stream):
+        return self._decoder.decode_array(stream)
+
+    def array_from_values(self, values):
+        decoder = self._decoder
+        if isinstance(values, dict):
+            values = [values]
+        dtype = decoder.array_dtype()
+        return import_numpy().array([tuple(v[k] for k in decoder.keys) for v in values], dtype=dtype)
 
     def _descriptor_list(self):
         lst = '!'.join([x for x in self.structure_order])
@@ -361,20 +483,11 @@ class ArrayDataFieldDescriptor(DataFieldDescriptor):
         format_codes.append(buffered if count == 1 else "{}{}".format(count, buffered))
         return ','.join(format_codes)
 
-    def to_iso8211(self):
-        data = [
-            super().to_iso8211(),
-            '*' if self.structure == 2 else '',
-            self._descriptor_list(),
-            DataStream.UT_CHAR,
-            self._format_list(),
-            DataStream.FT_CHAR
-        ]
-        return ''.join(data)
-
     @staticmethod
-    def from_stream_components(tag_name, long_name, descriptors, formats):
+    def from_stream_components(tag_name, long_name, descriptors, formats, header_info=None):
         f = ArrayDataFieldDescriptor(long_name, tag_name)
+        if header_info is not None:
+            FieldDescriptor.from_stream_base(f, header_info)
         format_codes = []
         for code in formats.split(","):
             count_str = ""
@@ -390,24 +503,157 @@ class ArrayDataFieldDescriptor(DataFieldDescriptor):
             desc = descriptor_list[i]
             if desc.startswith("*"):
                 desc = desc[1:]
-            f.add_sub_field(desc, format_codes[i])
+            f.structure_order.append(desc)
+            f.internal_structure[desc] = format_codes[i]
+        f.compile()
         return f
 
 
+class DecoderPlan:
+    """Decoding steps for one repetition of an array field, compiled once from the subfield format codes.
+
+    Runs of fixed-width binary subfields are merged into a single struct.Struct. When the whole field is one such run
+    (e.g. SG2D or FSPT), every repetition is decoded with one iter_unpack() call.
+    """
+
+    STRUCT_CODES = {
+        "b11": "B", "b12": "H", "b14": "I", "b18": "Q",
+        "b21": "b", "b22": "h", "b24": "i", "b28": "q",
+    }
+
+    def __init__(self, format_codes, wide=False):
+        # Variable length text is UCS-2 when wide is set (lexical level 2)
+        self.wide = wide
+        self.keys = [x[0] for x in format_codes]
+        self.steps = []
+        # Subfield name to writer for the subfields that are not part of a struct step
+        self.writers = {}
+        self._dtype = None
+        self._struct_codes = []
+        pending = []
+        for key, format_code in format_codes:
+            struct_code = DecoderPlan.struct_code(format_code)
+            if struct_code is None:
+                self._add_struct_step(pending)
+                pending = []
+                self.steps.append((None, key, DataFieldDescriptor.value_reader(format_code, wide)))
+                self.writers[key] = DataFieldDescriptor.value_writer(format_code, wide)
+            else:
+                pending.append((key, format_code, struct_code))
+        self._add_struct_step(pending)
+        self.fixed = self.steps[0] if len(self.steps) == 1 and self.steps[0][0] is not None else None
+
+    @staticmethod
+    def struct_code(format_code):
+        if format_code in DecoderPlan.STRUCT_CODES:
+            return DecoderPlan.STRUCT_CODES[format_code]
+        if format_code.startswith("B(") and format_code.endswith(")") and int(format_code[2:-1]) % 8 == 0:
+            return "{}s".format(int(format_code[2:-1]) // 8)
+        return None
+
+    def _add_struct_step(self, pending):
+        if pending:
+            packer = struct.Struct("<" + "".join(x[2] for x in pending))
+            keys = [x[0] for x in pending]
+            # Bit fields are stored least significant byte first, like the other binary values
+            reverse = [i for i, x in enumerate(pending) if x[1][0] == "B"]
+            readers = [DataFieldDescriptor.value_reader(x[1]) for x in pending]
+            self.steps.append((packer, keys, (reverse, readers)))
+            self._struct_codes = [x[2] for x in pending]
+
+    @staticmethod
+    def _reverse_bytes(row, reverse):
+        row = list(row)
+        for i in reverse:
+            row[i] = row[i][::-1]
+        return row
+
+    def decode(self, stream, repeated=True):
+        if self.fixed is not None:
+            return self._decode_fixed(stream, repeated)
+        values = []
+        while DataFieldDescriptor.has_more_values(stream, self.wide):
+            arr = {}
+            for packer, keys, extra in self.steps:
+                if packer is None:
+                    arr[keys] = extra(stream)
+                elif stream.remaining() >= packer.size:
+                    row = packer.unpack_from(stream.data, stream.index)
+                    stream.index += packer.size
+                    arr.update(zip(keys, DecoderPlan._reverse_bytes(row, extra[0]) if extra[0] else row))
+                else:
+                    # Truncated field, read what is left value by value
+                    for key, reader in zip(keys, extra[1]):
+                        arr[key] = reader(stream)
+            values.append(arr)
+            if not repeated:
+                break
+        return values
+
+    def encode(self, values):
+        """Encode a list of repetitions (dicts of subfield values) into bytes, the reverse of decode()."""
+        if self.fixed is not None and not self.fixed[2][0]:
+            packer, keys, _ = self.fixed
+            return b"".join(packer.pack(*[value[key] for key in keys]) for value in values)
+        parts = []
+        for value in values:
+            for packer, keys, extra in self.steps:
+                if packer is None:
+                    parts.append(self.writers[keys](value.get(keys)))
+                else:
+                    row = [value[key] for key in keys]
+                    for i in extra[0]:
+                        row[i] = row[i][::-1]
+                    parts.append(packer.pack(*row))
+        return b"".join(parts)
+
+    def array_dtype(self):
+        if self.fixed is None:
+            raise ValueError("Only fields made up of fixed-width binary subfields can be decoded to an array")
+        numpy = import_numpy()
+        if numpy is None:
+            raise ImportError("numpy is required to decode fields into arrays")
+        if self._dtype is None:
+            # struct and numpy agree on these type codes, except byte strings which are S<n> in numpy
+            self._dtype = numpy.dtype([
+                (key, "<" + (code if not code.endswith("s") else "S" + code[:-1]))
+                for key, code in zip(self.keys, self._struct_codes)
+            ])
+        return self._dtype
+
+    def decode_array(self, stream):
+        """Decode every repetition of the field into a NumPy structured array with one row per repetition."""
+        dtype = self.array_dtype()
+        count = stream.remaining_data() // dtype.itemsize
+        # read() copies the bytes out of the file buffer so no view into it is left behind
+        return import_numpy().frombuffer(stream.read(count * dtype.itemsize) if count else b"", dtype=dtype)
+
+    def _decode_fixed(self, stream, repeated):
+        packer, keys, extra = self.fixed
+        count = stream.remaining_data() // packer.size
+        if not repeated:
+            count = min(count, 1)
+        if count == 0:
+            return []
+        rows = packer.iter_unpack(stream.read(count * packer.size))
+        if extra[0]:
+            rows = (DecoderPlan._reverse_bytes(row, extra[0]) for row in rows)
+        return [dict(zip(keys, row)) for row in rows]
+
+
 class ControlFieldDescriptor(FieldDescriptor):
 
     def __init__(self, tag_length):
         super().__init__('0' * tag_length)
         self.data_tree = {}
         self.root_node = None
+        # File title, usually empty
+        self.long_name = ""
 
     def set_data_tree(self, new_tree, root_node):
         self.data_tree = new_tree
         self.root_node = root_node
 
-    def length(self):
-        return super().length() + (2 * len(self.tag_name) * len(self.data_tree))
-
     def _tree_entries(self, parent=None):
         if parent is None:
             parent = self.root_node
@@ -418,18 +664,19 @@ class ControlFieldDescriptor(FieldDescriptor):
                     yield p, c
 
     def to_iso8211(self):
-        data = [super().to_iso8211()]
-        for parent, child in self._tree_entries():
-            data.append("{}{}".format(parent, child))
+        data = [self.long_name, DataStream.UT_CHAR]
+        if self.data_tree:
+            for parent, child in self._tree_entries():
+                data.append("{}{}".format(parent, child))
         data.append(DataStream.FT_CHAR)
-        return ''.join(data)
+        return super().to_iso8211() + ''.join(data).encode("latin-1")
 
     @staticmethod
     def from_stream(stream, tag_size):
         field = ControlFieldDescriptor(tag_size)
         FieldDescriptor.from_stream_base(field, stream)
-        stream.read(DataStream.TO_UT)
-        tags = stream.read_str(DataStream.TO_FT)
+        field.long_name = stream.read_str(DataStream.TO_UT) or ""
+        tags = stream.read_str(DataStream.TO_FT) or ""
         pair_size = tag_size * 2
         num_pairs = int(len(tags) / pair_size)
         for i in range(0, num_pairs):
@@ -480,6 +727,41 @@ class Header:
         obj.future_flag = stream.read_int(1)
         obj.tag_size = stream.read_int(1)
 
+    def _encode(self, tags, bodies):
+        """Return the whole record: the leader and directory built for the encoded fields, followed by the fields.
+
+        The directory entry sizes read from the file are kept unless a field no longer fits, so unchanged records
+        are written back exactly as they were read.
+        """
+        lengths = [len(body) for body in bodies]
+        positions = list(itertools.accumulate(lengths[:-1], initial=0)) if lengths else []
+        self.length_size = max(self.length_size or 0, len(str(max(lengths, default=0))))
+        self.position_size = max(self.position_size or 0, len(str(positions[-1] if positions else 0)))
+        entry_format = "{}{:0" + str(self.length_size) + "d}{:0" + str(self.position_size) + "d}"
+        directory = "".join(entry_format.format(*entry) for entry in zip(tags, lengths, positions))
+        self.base = 24 + len(directory) + 1
+        self.length = self.base + sum(lengths)
+        if self.length > 99999:
+            raise ValueError("Record of {} bytes is too long for ISO 8211".format(self.length))
+        leader = "".join([
+            "{:05d}".format(self.length),
+            self.interchange,
+            self.leader,
+            self.extension,
+            self.version,
+            self.app,
+            self.fc_length if isinstance(self.fc_length, str) else "{:02d}".format(self.fc_length),
+            "{:05d}".format(self.base),
+            self.charset,
+            str(self.length_size),
+            str(self.position_size),
+            str(self.future_flag),
+            str(self.tag_size),
+            directory,
+            DataStream.FT_CHAR
+        ])
+        return b"".join([leader.encode("ascii"), *bodies])
+
     @staticmethod
     def read_data_directory(metadata, stream: DataStream):
         field_list = {}
@@ -497,6 +779,13 @@ class Record(Header):
 
     def __init__(self, file_metadata, tag_size=4):
         super().__init__(tag_size)
+        # Data record leader, blank where the DDR leader has its interchange level, version, etc.
+        self.interchange = ' '
+        self.leader = 'D'
+        self.extension = ' '
+        self.version = ' '
+        self.fc_length = '  '
+        self.charset = '   '
         self.file_metadata = file_metadata
         self._fields = {}
 
@@ -509,21 +798,46 @@ class Record(Header):
     def __iter__(self):
         return iter(self._fields)
 
+    def __delitem__(self, item):
+        del self._fields[item]
+
     def __setitem__(self, item, value):
         if not isinstance(value, Field):
             self._fields[item] = Field(self.file_metadata, item).from_value(value)
         else:
             self._fields[item] = value
 
+    def load(self):
+        for tag in self._fields:
+            self._fields[tag].load()
+        return self
+
+    def to_iso8211(self):
+        """Encode the record as ISO 8211 bytes, with the fields in the order they were added."""
+        tags = list(self._fields)
+        return self._encode(tags, [self._fields[tag].to_iso8211() for tag in tags])
+
     @staticmethod
-    def from_stream(file_metadata, stream):
+    def from_stream(file_metadata, stream, lazy=False):
+        record_start = stream.index
         metadata = Record(file_metadata)
         Header.from_stream_base(metadata, stream)
         field_list = Header.read_data_directory(metadata, stream)
+        field_area = record_start + metadata.base
+        record_end = stream.index
         for tag in field_list:
+            length, position = field_list[tag]
+            record_end = max(record_end, field_area + position + length)
             if all(x == "0" for x in tag):
                 continue
-            metadata[tag] = Field(file_metadata, tag).from_stream(DataStream(stream.read(field_list[tag][0])))
+            field_stream = DataStream(
+                stream.data,
+                field_area + position,
+                field_area + position + length,
+                stream.real_type
+            )
+            metadata[tag] = Field(file_metadata, tag).from_stream(field_stream, lazy)
+        stream.index = record_end
         return metadata
 
 
@@ -532,8 +846,30 @@ class Field:
     def __init__(self, file_metadata, tag_name):
         self.tag_name = tag_name
         self.field_info = file_metadata.fields[tag_name]
-        self.data = None
         self.data_type = None
+        self._data = None
+        self._stream = None
+
+    @property
+    def data(self):
+        if self._stream is not None:
+            self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._stream = None
+        self._data = value
+
+    def is_loaded(self):
+        return self._stream is None
+
+    def load(self):
+        if self._stream is not None:
+            stream = self._stream
+            self._stream = None
+            self._data = self.field_info.data_from_stream(stream)
+        return self
 
     def __getitem__(self, item):
         return self.data[item]
@@ -550,12 +886,32 @@ class Field:
     def __iter__(self):
         return iter(self.data)
 
+    def to_array(self):
+        """Decode a field made of fixed-width binary subfields (e.g. SG2D) into a NumPy structured array.
+
+        Fields that have not been decoded yet are read straight from their bytes without building any dicts.
+        """
+        if self._stream is not None:
+            stream = self._stream
+            return self.field_info.array_from_stream(DataStream(stream.data, stream.index, stream.end, stream.real_type))
+        return self.field_info.array_from_values(self._data)
+
     def from_value(self, d):
         self.data = d
         return self
 
-    def from_stream(self, stream: DataStream):
-        self.data = self.field_info.data_from_stream(stream)
+    def to_iso8211(self):
+        """Encode the field with its field terminator. Fields that were never decoded are copied as they are."""
+        if self._stream is not None:
+            return bytes(self._stream.data[self._stream.start:self._stream.end])
+        return self.field_info.data_to_iso8211(self._data)
+
+    def from_stream(self, stream: DataStream, lazy=False):
+        if lazy:
+            # Keep only the window into the file buffer, the field is decoded on first access
+            self._stream = stream
+        else:
+            self.data = self.field_info.data_from_stream(stream)
         return self
 
 
@@ -573,60 +929,19 @@ class Metadata(Header):
         self.field_order = []
 
     def to_iso8211(self):
-        self._set_sizes()
-        data = [
-            "{:05d}".format(self.length),
-            self.interchange,
-            self.leader,
-            self.extension,
-            self.version,
-            self.app,
-            "{:02d}".format(self.fc_length),
-            "{:05d}".format(self.base),
-            self.charset,
-            str(self.length_size),
-            str(self.position_size),
-            str(self.future_flag),
-            str(self.tag_size)
-        ]
-        position = 0
-        pos_format = "{:0" + str(self.position_size) + "d}"
-        len_format = "{:0" + str(self.length_size) + "d}"
-        for f_name in self.field_order:
-            field = self.fields[f_name]
-            data.append(field.tag_name)
-            leng = field.length()
-            data.append(len_format.format(leng))
-            data.append(pos_format.format(position))
-            position += leng
-        data.append(DataStream.FT_CHAR)
-        for f_name in self.field_order:
-            data.append(self.fields[f_name].to_iso8211())
-        return ''.join(data)
+        """Encode the data descriptive record (the leader, the field descriptions and the field tree) as bytes."""
+        if self.control_field is not None and not self.control_field.data_tree:
+            self._build_data_tree()
+        return self._encode(self.field_order, [self.fields[tag].to_iso8211() for tag in self.field_order])
 
-    def _set_sizes(self):
-        self.length = 0
-        max_position = 0
-        max_length = 0
-        previous_length = 0
-        map = {}
-        for f_name in self.fields:
+    def _build_data_tree(self):
+        tree = {}
+        for f_name in self.field_order:
             field = self.fields[f_name]
             if field.parent_tag:
-                if field.parent_tag not in map:
-                    map[field.parent_tag] = []
-                map[field.parent_tag].append(field.tag_name)
-            max_position += previous_length
-            leng = field.length()
-            self.length += leng
-            if leng > max_length:
-                max_length = leng
-            previous_length = leng
-        self.length_size = len(str(max_length))
-        self.position_size = len(str(max_position))
-        self.base = ((self.length_size + self.position_size + self.tag_size) * len(self.fields)) + 24
-        self.length += self.base
-        self.control_field.set_data_tree(map, self.root_element)
+                tree.setdefault(field.parent_tag, []).append(field.tag_name)
+        if tree:
+            self.control_field.set_data_tree(tree, self.root_element)
 
     def add_field(self, field):
         if not len(field.tag_name) == self.tag_size:
@@ -671,6 +986,19 @@ class DataFile:
     def __init__(self, metadata=None):
         self.metadata = metadata
         self._records = []
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release the file buffer. Lazy fields that have not been decoded yet can no longer be read."""
+        if self._buffer is not None and hasattr(self._buffer, "close"):
+            self._buffer.close()
+        self._buffer = None
 
     def add_record(self, r: Record):
         self._records.append(r)
@@ -685,12 +1013,84 @@ class DataFile:
         return len(self._records)
 
     @staticmethod
-    def from_file(file):
-        f = DataFile()
+    def from_file(file, lazy=False, real_type=decimal.Decimal):
+        """Parse an ISO 8211 file.
+
+        When lazy is True, only the leader and directory of each record are parsed and field values are decoded the
+        first time they are accessed. The file stays mapped until close() is called (or the DataFile is used as a
+        context manager). R formatted values are converted with real_type.
+        """
         with open(file, "rb") as h:
-            stream = DataStream(list(h.read()))
-            f.metadata = Metadata.from_stream(stream)
+            buffer = map_file(h)
+        f = DataFile.from_buffer(buffer, lazy, real_type)
+        if lazy:
+            f._buffer = buffer
+        elif hasattr(buffer, "close"):
+            buffer.close()
+        return f
+
+    def to_file(self, file):
+        """Write the file as ISO 8211 to a path or a binary file-like object (which is left open).
 
-            while not stream.empty():
-                f.add_record(Record.from_stream(f.metadata, stream))
+        Records are encoded and written one at a time through a buffered stream. Lazy fields that were never
+        decoded are copied from the source file without decoding them.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb", buffering=1024 * 1024) as h:
+                return self.to_file(h)
+        file.write(self.metadata.to_iso8211())
+        for record in self._records:
+            file.write(record.to_iso8211())
+
+    @staticmethod
+    def stream(file, lazy=False, real_type=decimal.Decimal):
+        """Yield the records of an ISO 8211 file one at a time without keeping them. See iter_records()."""
+        return iter_records(file, lazy, real_type)
+
+    @staticmethod
+    def from_buffer(buffer, lazy=False, real_type=decimal.Decimal):
+        f = DataFile()
+        stream = DataStream(buffer, real_type=real_type)
+        f.metadata = Metadata.from_stream(stream)
+        while not stream.empty():
+            f.add_record(Record.from_stream(f.metadata, stream, lazy))
         return f
+
+
+def _fixed_text(value, length, pad):
+    text = "" if value is None else str(value)
+    if len(text) > length:
+        raise ValueError("Value {} is longer than its field width of {}".format(text, length))
+    if pad == " " or value is None:
+        return text.ljust(length).encode("latin-1")
+    return text.zfill(length).encode("latin-1")
+
+
+def iter_records(file, lazy=False, real_type=decimal.Decimal):
+    """Yield the records of an ISO 8211 file one at a time as they are parsed.
+
+    Only the record being yielded is held in memory. Lazy records can only be decoded until the generator is
+    exhausted or closed, since the file mapping is released at that point.
+    """
+    with open(file, "rb") as h:
+        buffer = map_file(h)
+    try:
+        stream = DataStream(buffer, real_type=real_type)
+        metadata = Metadata.from_stream(stream)
+        while not stream.empty():
+            yield Record.from_stream(metadata, stream, lazy)
+    finally:
+        if hasattr(buffer, "close"):
+            buffer.close()
+
+
+def map_file(handle):
+    """Map an open binary file into memory for read-only access.
+
+    Parsed values are always copied out of the buffer, so the mapping can be closed as soon as parsing is done. The
+    mapping stays valid after the file handle itself is closed.
+    """
+    if os.fstat(handle.fileno()).st_size == 0:
+        # mmap refuses to map empty files
+        return b""
+    return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
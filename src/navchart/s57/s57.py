@@ -1,14 +1,22 @@
+import abc
 import logging
+import array
 import copy
 import decimal
 import os
 import re
 import datetime
+import enum
+import itertools
+import concurrent.futures
 from pathlib import Path
 from autoinject import injector
-from .iso8211 import DataFile, Record, bytes_to_int
+from .iso8211 import DataFile, Record, Field, bytes_to_int, import_numpy
+from .cache import CellCache
+from .spatial import STRTree, geometry_bounds, geometry_distance
+from .export import geometry_to_wkt, write_features, write_geojson
+from . import arrow
 from functools import lru_cache
-import csv
 
 try:
     from functools import cached_property
@@ -18,79 +26,360 @@ except ImportError:
 
 @injector.injectable
 class S57Standard:
+    """Lookups in the S-57 catalogue: record names, agencies, object classes, attributes and enumerated values.
+
+    The tables come from the catalogue module (compiled from the CSV files by compile_catalogue.py), which is only
+    imported on the first lookup and used as it is. Each lookup is a single dict access: the name tables hold every
+    code both as an int and as a string, along with the names themselves. The enumerated values are in a module of
+    their own, imported the first time they are needed.
+    """
 
     def __init__(self):
-        self._record_name_map = {}
-        self._agency_map = {}
-        self._object_type_map = {}
-        self._attribute_name_map = {}
+        # Catalogue tables, None until init() binds them on the first lookup
+        self._record_names = None
+        self._record_name_codes = None
+        self._agencies = None
+        self._agency_codes = None
+        self._object_types = None
+        self._object_type_codes = None
+        self._attribute_names = None
+        self._attribute_codes = None
+        self._attribute_types = None
+        self._expected_input = None
         self._init_flag = False
 
     def init(self):
         if not self._init_flag:
             self._init_flag = True
-            base = Path(__file__).parent
-            with open(base / "s57recordnames.csv", "r") as h:
-                reader = csv.reader(h)
-                for line in reader:
-                    if line[0] == "Number":
-                        continue
-                    if len(line) < 2:
-                        continue
-                    self._record_name_map[int(line[0])] = line[1]
-            with open(base / "s57agencies.csv", "r") as h:
-                reader = csv.reader(h)
-                for line in reader:
-                    if line[0] == "Number":
-                        continue
-                    if len(line) < 2:
-                        continue
-                    self._agency_map[int(line[0])] = line[1]
-            with open(base / "s57objectclasses.csv", "r") as h:
-                reader = csv.reader(h)
-                for line in reader:
-                    if line[0] == "Code":
-                        continue
-                    if len(line) < 3:
-                        continue
-                    self._object_type_map[int(line[0])] = line[2]
-            with open(base / "s57attributes.csv", "r") as h:
-                reader = csv.reader(h)
-                for line in reader:
-                    if line[0] == "Code":
-                        continue
-                    if len(line) < 3:
-                        continue
-                    self._attribute_name_map[int(line[0])] = line[2]
+            from . import catalogue
+            self._record_names = catalogue.RECORD_NAMES
+            self._record_name_codes = catalogue.RECORD_NAME_CODES
+            self._agencies = catalogue.AGENCIES
+            self._agency_codes = catalogue.AGENCY_CODES
+            self._object_types = catalogue.OBJECT_CLASSES
+            self._object_type_codes = catalogue.OBJECT_CLASS_CODES
+            self._attribute_names = catalogue.ATTRIBUTES
+            self._attribute_codes = catalogue.ATTRIBUTE_CODES
+            self._attribute_types = catalogue.ATTRIBUTE_TYPES
 
     def attribute_name(self, name_or_num):
-        return self._to_str(name_or_num, self._attribute_name_map, "attribute")
+        return self._to_str(name_or_num, self._attribute_names, "_attribute_names", "attribute")
+
+    def attribute_type(self, name_or_num):
+        """Return the attribute type code from the catalogue (A, E, F, I, L or S), or None if it is not known."""
+        name = self.attribute_name(name_or_num)
+        return self._attribute_types.get(name)
+
+    def attribute_values(self, name_or_num):
+        """Return the dict of enumerated value to meaning of an E or L type attribute (empty for other types)."""
+        if self._expected_input is None:
+            from .catalogue_values import EXPECTED_INPUT
+            self._expected_input = EXPECTED_INPUT
+        return self._expected_input.get(self.attribute_name(name_or_num), {})
+
+    def decode_attribute(self, name_or_num, value):
+        """Return the meaning of an enumerated (E) attribute value or the list of meanings of a list (L) value.
+
+        Values of other attribute types, and values that are not in the catalogue, are returned unchanged.
+        """
+        meanings = self.attribute_values(name_or_num)
+        if not meanings or value is None or value == "":
+            return value
+        if self.attribute_type(name_or_num) == "L":
+            return [meanings.get(int(item), item) if item.isdigit() else item for item in str(value).split(",")]
+        value = str(value)
+        return meanings.get(int(value), value) if value.isdigit() else value
 
     def object_type(self, name_or_num):
-        return self._to_str(name_or_num, self._object_type_map, "object type")
+        return self._to_str(name_or_num, self._object_types, "_object_types", "object type")
 
     def agency(self, name_or_num):
-        return self._to_str(name_or_num, self._agency_map, "agency")
+        return self._to_str(name_or_num, self._agencies, "_agencies", "agency")
 
     def record_name(self, name_or_num):
-        return self._to_str(name_or_num, self._record_name_map, "record type")
-
-    def _to_str(self, name_or_num, mapping, kind_for_error):
-        if isinstance(name_or_num, str) and not name_or_num.isdigit():
-            return name_or_num
-        self.init()
-        num = int(name_or_num)
-        if num in mapping:
-            return mapping[num]
+        return self._to_str(name_or_num, self._record_names, "_record_names", "record type")
+
+    def object_type_code(self, name_or_num):
+        return self._to_num(name_or_num, self._object_type_codes, "_object_type_codes", "object type")
+
+    def attribute_code(self, name_or_num):
+        return self._to_num(name_or_num, self._attribute_codes, "_attribute_codes", "attribute")
+
+    def agency_code(self, name_or_num):
+        return self._to_num(name_or_num, self._agency_codes, "_agency_codes", "agency")
+
+    def record_name_code(self, name_or_num):
+        return self._to_num(name_or_num, self._record_name_codes, "_record_name_codes", "record type")
+
+    def _to_num(self, name_or_num, mapping, table, kind_for_error):
+        if mapping is None:
+            self.init()
+            mapping = getattr(self, table)
+        try:
+            return mapping[name_or_num]
+        except KeyError:
+            pass
+        if isinstance(name_or_num, int) or name_or_num.isdigit():
+            return int(name_or_num)
+        raise KeyError("Unrecognized {}: {}".format(kind_for_error, name_or_num))
+
+    def _to_str(self, name_or_num, mapping, table, kind_for_error):
+        if mapping is None:
+            self.init()
+            mapping = getattr(self, table)
+        try:
+            return mapping[name_or_num]
+        except KeyError:
+            pass
+        # Names that are not in the catalogue (e.g. national ones) are passed through, unknown codes are kept as text
+        if isinstance(name_or_num, str):
+            if not name_or_num.isdigit():
+                return name_or_num
+            if int(name_or_num) in mapping:
+                return mapping[int(name_or_num)]
         logging.getLogger(__name__).warning("Unrecognized {} ID: {}".format(kind_for_error, name_or_num))
         return str(name_or_num)
 
 
+class NumericMode(enum.Enum):
+    """How coordinates, soundings and real (R) values are represented once loaded.
+
+    DECIMAL keeps exact decimal.Decimal values. FLOAT divides by the multiplication factors with plain floats. INT
+    keeps the raw integers as stored in the file, divide them by S57Cell.multiplication_factors to get real values.
+    NUMPY stores each geometry as an (N, 2) or (N, 3) int32 array of the raw coordinates (x, y[, z]) and scales them
+    to float64 in one vectorized step when points are requested. Only DECIMAL reads R values as Decimal, the other
+    modes use float.
+    """
+
+    DECIMAL = "decimal"
+    FLOAT = "float"
+    INT = "int"
+    NUMPY = "numpy"
+
+    def real_type(self):
+        return decimal.Decimal if self is NumericMode.DECIMAL else float
+
+
+def _join_points(parts, numeric_mode):
+    if numeric_mode is NumericMode.NUMPY:
+        numpy = import_numpy()
+        return numpy.concatenate(parts) if parts else numpy.empty((0, 2))
+    return [point for part in parts for point in part]
+
+
+def geometry_key(rcnm, rcid):
+    """Pack a vector record name (RCNM, RCID) into the integer key geometries are stored under."""
+    return (rcnm << 32) | rcid
+
+
+def feature_key(agen, fidn, fids):
+    """Pack a feature object identifier (AGEN, FIDN, FIDS) into the integer key features are stored under."""
+    return (agen << 48) | (fidn << 16) | fids
+
+
+def split_geometry_key(key):
+    return key >> 32, key & 0xFFFFFFFF
+
+
+def split_feature_key(key):
+    return key >> 48, (key >> 16) & 0xFFFFFFFF, key & 0xFFFF
+
+
+def update_sequence(name, updates):
+    """Return the paths of a dict of update number to update file of a cell in order.
+
+    Updates can only be applied one after the other, so the sequence stops (with a warning) at the first missing one.
+    """
+    paths = []
+    for number in sorted(updates):
+        if number != len(paths) + 1:
+            logging.getLogger(__name__).warning("Update {} of {} is missing, ignoring updates {} to {}".format(
+                len(paths) + 1, name, number, max(updates)
+            ))
+            break
+        paths.append(updates[number])
+    return paths
+
+
+class FeatureIndex:
+    """Layer and attribute indexes over the features of a cell.
+
+    Features must be removed before and added back after any change to their layer or indexed attributes. Each
+    index maps a key to the feature keys in insertion order (dicts are used as ordered sets).
+    """
+
+    INDEXED_ATTRIBUTES = ("OBJNAM", "SCAMIN")
+
+    def __init__(self, attributes=INDEXED_ATTRIBUTES):
+        self.layers = {}
+        self.attributes = {name: {} for name in attributes}
+
+    def add(self, fid, feature):
+        self.layers.setdefault(feature.layer, {})[fid] = None
+        for name in self.attributes:
+            if name in feature.attributes:
+                self.attributes[name].setdefault(feature.attributes[name], {})[fid] = None
+
+    def remove(self, fid, feature):
+        FeatureIndex._discard(self.layers, feature.layer, fid)
+        for name in self.attributes:
+            if name in feature.attributes:
+                FeatureIndex._discard(self.attributes[name], feature.attributes[name], fid)
+
+    @staticmethod
+    def _discard(index, key, fid):
+        if key in index:
+            index[key].pop(fid, None)
+            if not index[key]:
+                del index[key]
+
+    def layer(self, layer):
+        return self.layers.get(layer, {}).keys()
+
+    def attribute(self, name, value):
+        if name not in self.attributes:
+            raise KeyError("Attribute {} is not indexed".format(name))
+        return self.attributes[name].get(value, {}).keys()
+
+    @staticmethod
+    def build(features, attributes=INDEXED_ATTRIBUTES):
+        index = FeatureIndex(attributes)
+        for fid in features:
+            index.add(fid, features[fid])
+        return index
+
+
+class TopologyResolver:
+    """Resolves vector records into point chains for one version of a cell.
+
+    The chain of a vector record is its own scaled coordinates with the points of its connected nodes added at the
+    start and end (edges only). Chains are resolved once and shared by every feature and edge that references them,
+    so a feature costs one pass over its pointers. A new resolver is needed whenever the geometries change.
+    """
+
+    # Record name codes (RCNM) of vector records
+    ISOLATED_NODE = 110
+    CONNECTED_NODE = 120
+    EDGE = 130
+
+    def __init__(self, geometries, numeric_mode):
+        self.geometries = geometries
+        self.numeric_mode = numeric_mode
+        self._chains = {}
+
+    def available(self, key):
+        """Check if the vector record and, for edges, its connected nodes have all been loaded."""
+        return self.missing(key) is None
+
+    def missing(self, key):
+        """Return the key of a vector record still needed to resolve the given one (itself or, for edges, one of its
+        connected nodes), or None if they have all been loaded."""
+        if key not in self.geometries:
+            return key
+        if key >> 32 == TopologyResolver.EDGE:
+            for node_rcnm, node_rcid, _, _, _, _ in self.geometries[key].spatial_references.rows():
+                if ((node_rcnm << 32) | node_rcid) not in self.geometries:
+                    return (node_rcnm << 32) | node_rcid
+        return None
+
+    def chain(self, key):
+        """Return the points of the vector record with the given key, including its connected nodes."""
+        if key in self._chains:
+            return self._chains[key]
+        geometry = self.geometries[key]
+        rcnm = key >> 32
+        if rcnm == TopologyResolver.ISOLATED_NODE or rcnm == TopologyResolver.CONNECTED_NODE:
+            if geometry.spatial_references:
+                raise ValueError("Independent/node types shouldn't have spatial references?")
+            points = geometry._scaled_geometry()
+        elif rcnm == TopologyResolver.EDGE:
+            start_points = []
+            end_points = []
+            for node_rcnm, node_rcid, _, _, _, topi in geometry.spatial_references.rows():
+                if not node_rcnm == TopologyResolver.CONNECTED_NODE:
+                    raise ValueError("Edge records should have a record name of VC")
+                if topi == 1:
+                    start_points.append(self.chain((node_rcnm << 32) | node_rcid))
+                elif topi == 2:
+                    end_points.append(self.chain((node_rcnm << 32) | node_rcid))
+                else:
+                    raise ValueError("Unknown value for TOPI: {}".format(topi))
+            points = _join_points([*start_points, geometry._scaled_geometry(), *end_points], self.numeric_mode)
+        else:
+            raise ValueError("Unknown record name {}".format(geometry.record_name))
+        self._chains[key] = points
+        return points
+
+    def end_nodes(self, key):
+        """Return the keys of the start and end connected nodes of an edge (None where it has none)."""
+        start_node = end_node = None
+        for node_rcnm, node_rcid, _, _, _, topi in self.geometries[key].spatial_references.rows():
+            if topi == 1:
+                start_node = (node_rcnm << 32) | node_rcid
+            elif topi == 2:
+                end_node = (node_rcnm << 32) | node_rcid
+        return start_node, end_node
+
+    def feature_geometry(self, primitive, spatial_references):
+        """Build the (type, points) geometry of a feature from its FSPT pointers."""
+        if primitive == 255:
+            return "NONE", []
+        geometry_type = None
+        outer_parts = []
+        inner_rings = []
+        inner_parts = []
+        ring_start = None
+        for rcnm, rcid, ornt, usag, _ in spatial_references.rows():
+            key = (rcnm << 32) | rcid
+            points = self.chain(key)
+            # Reverse if required
+            if ornt == 2:
+                points = points[::-1]
+            # Check if we are dealing with an independent point set
+            if rcnm == TopologyResolver.ISOLATED_NODE or rcnm == TopologyResolver.CONNECTED_NODE:
+                geometry_type = "MULTIPOINT"
+            elif geometry_type == "MULTIPOINT":
+                raise ValueError("Discovered non-point record after point record")
+            # Check if it is an inner edge, each interior ring is closed once it gets back to the node it started from
+            if rcnm == TopologyResolver.EDGE and usag == 2:
+                start_node, end_node = self.end_nodes(key)
+                if ornt == 2:
+                    start_node, end_node = end_node, start_node
+                if not inner_parts:
+                    ring_start = start_node
+                inner_parts.append(points)
+                if end_node is not None and end_node == ring_start:
+                    inner_rings.append(_join_points(inner_parts, self.numeric_mode))
+                    inner_parts = []
+            # Outer edge
+            else:
+                outer_parts.append(points)
+        points = _join_points(outer_parts, self.numeric_mode)
+        if inner_parts:
+            inner_rings.append(_join_points(inner_parts, self.numeric_mode))
+        if len(points) == 0:
+            return "NONE", []
+        elif primitive == 1:
+            return ("POINT", points[0]) if len(points) == 1 else ("MULTIPOINT", points)
+        elif primitive == 2:
+            return "LINESTRING", points
+        elif primitive == 3:
+            return "POLYGON", [points, *inner_rings]
+        raise ValueError("Unknown PRIM {}".format(primitive))
+
+
 class S57Cell:
 
-    def __init__(self, cell_file):
+    standard: S57Standard = None
+
+    @injector.construct
+    def __init__(self, cell_file, numeric_mode=NumericMode.DECIMAL, cache=None, update_paths=None,
+                 support_paths=None):
         if not cell_file.name.endswith(".000"):
             raise ValueError("Invalid cell file")
+        self.numeric_mode = NumericMode(numeric_mode)
+        if self.numeric_mode is NumericMode.NUMPY and import_numpy() is None:
+            raise ImportError("numpy is required for the {} numeric mode".format(self.numeric_mode.value))
         self.path = Path(cell_file)
         self.multiplication_factors = None
         self.base_loaded_flag = False
@@ -99,17 +388,25 @@ class S57Cell:
         self._geometries = None
         self.metadata = None
         self.update_file_count = None
+        # Optional CellCache (or a directory for one) holding fully updated cells from previous runs
+        self.cache = CellCache(cache) if isinstance(cache, (str, os.PathLike)) else cache
+        self._spatial_index = None
+        self._feature_index = None
+        self._topology = None
+        # Update files and support files (upper case name to path) resolved by an ExchangeSet, if any
+        self._update_paths = [Path(path) for path in update_paths] if update_paths is not None else None
+        self._support_paths = support_paths
+        # Feature RCID to feature key, for update records (built when the first update is applied)
+        self._feature_records = None
+        # Update number to the records and metadata of the cell at that update, see apply_new_updates()
+        self._snapshots = {}
 
     @staticmethod
-    def find_all_cells(search_path):
-        search_dirs = [search_path]
-        while search_dirs:
-            dir = search_dirs.pop()
-            for file in os.scandir(dir):
-                if file.is_dir():
-                    search_dirs.append(file.path)
-                elif file.name.endswith(".000"):
-                    return S57Cell(file.path)
+    def find_all_cells(search_path, **kwargs):
+        """Yield every cell under search_path with its updates and support files, see ExchangeSet."""
+        # The discovery module builds cells, so it can only be imported once this one is loaded
+        from .discovery import ExchangeSet
+        yield from ExchangeSet.scan(search_path).cells(**kwargs)
 
     @cached_property
     def support_files(self):
@@ -123,6 +420,9 @@ class S57Cell:
 
     @lru_cache(None)
     def support_file_real_path(self, filename):
+        if self._support_paths is not None:
+            path = self._support_paths.get(filename.upper())
+            return str(path) if path is not None else None
         search_dirs = [self.path.parent]
         while search_dirs:
             dir = search_dirs.pop()
@@ -169,67 +469,405 @@ class S57Cell:
         return datetime.datetime.strptime(self.metadata["UPDT"], "%Y%m%d")
 
     def features(self, object_types=None):
+        """Yield all features, or only those of the given layers (grouped by layer, in the order given)."""
         self._load_updates()
-        if object_types and not isinstance(object_types, list):
-            object_types = list(object_types)
-        for fid in self._features:
-            if object_types is None or self._features[fid].layer in object_types:
+        if object_types is None:
+            yield from self._features.values()
+            return
+        if isinstance(object_types, str):
+            object_types = [object_types]
+        for layer in dict.fromkeys(object_types):
+            for fid in list(self._feature_index.layer(layer)):
                 yield self._features[fid]
 
+    def stream_features(self, object_types=None):
+        """Yield features (or only those of the given layers) while the cell file is being parsed.
+
+        A cell without update files is read record by record and each feature is yielded once its vector records
+        have been read, without keeping the features in memory. Cells with updates, or that are already loaded, are
+        loaded fully and their features are yielded in file order.
+        """
+        if isinstance(object_types, str):
+            object_types = [object_types]
+        if self.updates_loaded_flag or self.update_file_paths():
+            for feature in self.features():
+                if object_types is None or feature.layer in object_types:
+                    yield feature
+            return
+        cell_data = S57DataFile(self.path, numeric_mode=self.numeric_mode)
+        for feature in cell_data.iter_features():
+            if self.multiplication_factors is None:
+                self.multiplication_factors = (cell_data.coordinate_factor, cell_data.sounding_factor)
+            if object_types is None or feature.layer in object_types:
+                yield feature
+
+    def features_by_attribute(self, name, value):
+        """Yield the features whose indexed attribute (see FeatureIndex.INDEXED_ATTRIBUTES) equals value."""
+        self._load_updates()
+        for fid in list(self._feature_index.attribute(name, value)):
+            yield self._features[fid]
+
+    def layers(self):
+        self._load_updates()
+        return list(self._feature_index.layers)
+
+    def features_in_bbox(self, west, south, east, north):
+        """Yield the features whose bounding box intersects the given box."""
+        index = self.spatial_index()
+        for fid in index.query(west, south, east, north):
+            yield self._features[fid]
+
+    def features_near(self, lon, lat, radius):
+        """Yield the features within radius (in degrees) of a point, nearest first."""
+        index = self.spatial_index()
+        scale = self._coordinate_scale()
+        matches = []
+        for fid in index.query(lon - radius, lat - radius, lon + radius, lat + radius):
+            distance = geometry_distance(self._features[fid].geometry, lon * scale, lat * scale)
+            if distance is not None and distance <= radius * scale:
+                matches.append((distance, fid))
+        matches.sort(key=lambda x: x[0])
+        for _, fid in matches:
+            yield self._features[fid]
+
+    def spatial_index(self):
+        """Return the R-tree over feature bounding boxes, building it on first use."""
+        if self._spatial_index is None:
+            self._load_updates()
+            scale = self._coordinate_scale()
+            entries = []
+            for fid in self._features:
+                bounds = geometry_bounds(self._features[fid].geometry)
+                if bounds is not None:
+                    if scale != 1:
+                        bounds = tuple(b / scale for b in bounds)
+                    entries.append((bounds, fid))
+            self._spatial_index = STRTree(entries)
+        return self._spatial_index
+
+    def export(self, target, geometry_format="wkb", object_types=None):
+        """Write the features (or only those of the given layers) to a path or binary file, see write_features().
+
+        Coordinates are written in degrees in every numeric mode. Returns the number of features written.
+        """
+        return write_features(self.features(object_types), target, geometry_format, self._export_factors())
+
+    def export_geojson(self, target, sequence=False, object_types=None):
+        """Stream the features to a path or binary file as GeoJSON Text Sequences (RFC 8142) or NDJSON.
+
+        Features come from stream_features(), so a cell without updates is never held in memory. Returns the number
+        of features written.
+        """
+        features = self.stream_features(object_types)
+        # Reading up to the first feature also reads the DSPM record with the multiplication factors
+        first = next(features, None)
+        if first is None:
+            return write_geojson([], target, sequence)
+        return write_geojson(itertools.chain([first], features), target, sequence, self._export_factors())
+
+    def to_arrow(self, batch_size=arrow.DEFAULT_BATCH_SIZE, object_types=None):
+        """Return a dict of layer name to pyarrow.Table with the identifier, typed attributes and WKB geometry."""
+        return arrow.to_arrow(self, self._export_factors(), batch_size, object_types)
+
+    def to_geoparquet(self, directory, batch_size=arrow.DEFAULT_BATCH_SIZE, object_types=None):
+        """Write one GeoParquet file per layer into directory, see arrow.write_geoparquet()."""
+        return arrow.write_geoparquet(self, directory, self._export_factors(), batch_size, object_types=object_types)
+
+    def extract(self, target, bbox=None, layers=None):
+        """Write the features of the base cell in the given layers whose bounding box intersects bbox (west, south,
+        east, north) to a new cell file, with the vector records they use. See extract.extract_cell().
+
+        The extract is taken from the base cell file, update files are not applied to it. Returns the number of
+        features written.
+        """
+        # The extract module reads cell files with this one, so it can only be imported once this one is loaded
+        from .extract import extract_cell
+        if self.update_file_paths():
+            logging.getLogger(__name__).warning("Extract of {} leaves out its {} update files".format(
+                self.path.name, len(self.update_file_paths())
+            ))
+        return extract_cell(self.path, target, bbox, layers)
+
+    def _export_factors(self):
+        # Exports are in degrees, so the raw integers of the INT mode are scaled on the way out
+        if self.numeric_mode is NumericMode.INT:
+            if self.multiplication_factors is None:
+                self._load_updates()
+            comf, somf = self.multiplication_factors
+            return comf, comf, somf
+        return None
+
+    def topology(self):
+        """Return the resolver for the point chains of the current geometries."""
+        if self._topology is None:
+            self._load_updates()
+            self._topology = TopologyResolver(self._geometries, self.numeric_mode)
+        return self._topology
+
+    def _reset_derived(self):
+        # Resolved geometries and the indexes built from them are stale once an update changes the records
+        self._spatial_index = None
+        if self._topology is not None:
+            self._topology = None
+            for feature in self._features.values():
+                feature._geometry = None
+                feature._wkt = None
+
+    def _coordinate_scale(self):
+        # Geometries hold raw integers in the INT mode, everything else is already in degrees
+        if self.numeric_mode is NumericMode.INT:
+            self._load_updates()
+            return float(self.multiplication_factors[0])
+        return 1
+
     def feature(self, long_name):
+        """Return a feature by its long name (e.g. "US_5678_1") or its integer key."""
         self._load_updates()
-        return self._features[long_name]
+        return self._features[self.feature_key(long_name)]
 
     def geometry(self, name):
+        """Return a vector record by its name (e.g. "VE_1234") or its integer key."""
         self._load_updates()
-        return self._geometries[name]
+        return self._geometries[self.geometry_key(name)]
+
+    def feature_key(self, long_name):
+        if isinstance(long_name, int):
+            return long_name
+        agency, fidn, fids = long_name.rsplit("_", 2)
+        return feature_key(self.standard.agency_code(agency), int(fidn), int(fids))
+
+    def geometry_key(self, name):
+        if isinstance(name, int):
+            return name
+        record_name, rcid = name.rsplit("_", 1)
+        return geometry_key(self.standard.record_name_code(record_name), int(rcid))
 
     def _load_base_cell(self):
         if not self.base_loaded_flag:
-            cell_data = S57DataFile(self.path)
+            cell_data = S57DataFile(self.path, numeric_mode=self.numeric_mode)
             self.multiplication_factors = cell_data.get_multiplication_factors()
             self._features = cell_data.features
+            self._feature_index = FeatureIndex.build(self._features)
             self._geometries = cell_data.geometries
             self.metadata = cell_data.metadata
             self.base_loaded_flag = True
 
     def _set_update_file_count(self):
         if self.update_file_count is None:
-            self.update_file_count = 0
-            for i in range(1, 1000):
-                path = Path("{}.{:03d}".format(self.path.name[:-3], i))
-                if not path.exists():
-                    break
-                self.update_file_count += 1
+            self.update_file_count = len(self.update_file_paths())
+
+    def update_file_paths(self):
+        """Return the update files of the cell in order, found next to the base cell unless they were given."""
+        if self._update_paths is None:
+            self._update_paths = self._find_update_paths()
+        return list(self._update_paths)
+
+    def _find_update_paths(self):
+        # One listing of the cell directory rather than an exists() call per update number
+        stem = self.path.stem
+        updates = {}
+        with os.scandir(self.path.parent) as entries:
+            for entry in entries:
+                name, _, extension = entry.name.rpartition(".")
+                if name == stem and len(extension) == 3 and extension.isdigit() and extension != "000":
+                    updates[int(extension)] = Path(entry.path)
+        return update_sequence(stem, updates)
 
     def _load_updates(self):
         if not self.updates_loaded_flag:
+            # The key reads every input file for its CRC, so it is worked out once for the load and the store
+            cache_key = None
+            if self.cache is not None and not self.base_loaded_flag:
+                cache_key = self.cache.key(self)
+                state = self.cache.load(self, cache_key)
+                if state is not None:
+                    self._apply_state(state)
+                    return
             self._load_base_cell()
-            self._set_update_file_count()
-            for i in range(1, self.update_file_count + 1):
+            for update_path in self.update_file_paths():
                 self._apply_update_file(S57DataFile(
-                    Path("{}.{:03d}".format(self.path.name[:-4], i)),
-                    *self.multiplication_factors
-                ))
+                    update_path,
+                    *self.multiplication_factors,
+                    numeric_mode=self.numeric_mode
+                ).load())
             self.updates_loaded_flag = True
-            for f_name in self._features:
-                self._features[f_name].set_reference_cell(self)
-            for g_name in self._geometries:
-                self._geometries[g_name].set_reference_cell(self)
+            self._bind_objects()
+            if self.cache is not None:
+                self.cache.store(self, self.to_state(), cache_key)
+
+    def apply_new_updates(self, update_paths=None, keep_snapshot=False):
+        """Apply the update files newer than the cell's current update (DSID UPDN) and return their paths.
+
+        The update files are looked up next to the base cell again unless update_paths is given. Only the new files
+        are parsed. With keep_snapshot, the cell as it was before is kept and can be retrieved with snapshot(). A
+        snapshot shares every record that the new updates do not change, records are copied before being changed.
+        """
+        self._load_updates()
+        current = int(self.metadata["DSID"]["UPDN"])
+        if update_paths is None:
+            update_paths = self._find_update_paths()
+        new_paths = []
+        for path in sorted((Path(path) for path in update_paths), key=lambda p: int(p.suffix[1:])):
+            number = int(path.suffix[1:])
+            if number <= current:
+                continue
+            if number != current + len(new_paths) + 1:
+                logging.getLogger(__name__).warning("Update {} of {} is missing, ignoring update {} and later".format(
+                    current + len(new_paths) + 1, self.path.stem, number
+                ))
+                break
+            new_paths.append(path)
+        if not new_paths:
+            return []
+        if keep_snapshot:
+            self._snapshots[current] = {
+                "metadata": dict(self.metadata),
+                "features": dict(self._features),
+                "geometries": dict(self._geometries),
+            }
+        for path in new_paths:
+            self._apply_update_file(S57DataFile(
+                path,
+                *self.multiplication_factors,
+                numeric_mode=self.numeric_mode
+            ).load())
+        self._update_paths = self.update_file_paths()[:current] + new_paths
+        self.update_file_count = len(self._update_paths)
+        self.__dict__.pop("update_no", None)
+        if self.cache is not None:
+            self.cache.store(self, self.to_state())
+        return new_paths
+
+    def snapshots(self):
+        """Return the update numbers that snapshots were kept for, see apply_new_updates()."""
+        return sorted(self._snapshots)
+
+    def snapshot(self, update_no):
+        """Return a new cell holding this cell as it was at update_no.
+
+        Only the record objects are copied, their coordinates, pointers and attribute values are still shared.
+        """
+        state = self._snapshots[int(update_no)]
+        cell = S57Cell(self.path, self.numeric_mode, update_paths=self.update_file_paths()[:int(update_no)])
+        return cell._apply_state({
+            "multiplication_factors": self.multiplication_factors,
+            "update_file_count": int(update_no),
+            "metadata": dict(state["metadata"]),
+            "features": {key: feature.copy() for key, feature in state["features"].items()},
+            "geometries": {key: geometry.copy() for key, geometry in state["geometries"].items()},
+        })
+
+    def discard_snapshots(self):
+        self._snapshots = {}
+
+    def _bind_objects(self):
+        for f_name in self._features:
+            self._features[f_name].set_reference_cell(self)
+        for g_name in self._geometries:
+            self._geometries[g_name].set_reference_cell(self)
+
+    def to_state(self):
+        """Return the fully updated cell as a compact picklable dict, see from_state()."""
+        self._load_updates()
+        return {
+            "path": str(self.path),
+            "numeric_mode": self.numeric_mode.value,
+            "multiplication_factors": self.multiplication_factors,
+            "update_file_count": self.update_file_count,
+            "metadata": self.metadata,
+            "features": self._features,
+            "geometries": self._geometries,
+        }
+
+    @staticmethod
+    def from_state(state):
+        """Rebuild a loaded cell from to_state() without parsing any file."""
+        return S57Cell(Path(state["path"]), state["numeric_mode"])._apply_state(state)
+
+    def _apply_state(self, state):
+        self.multiplication_factors = state["multiplication_factors"]
+        self.update_file_count = state["update_file_count"]
+        self.metadata = state["metadata"]
+        self._features = state["features"]
+        self._feature_index = FeatureIndex.build(self._features)
+        self._geometries = state["geometries"]
+        self.base_loaded_flag = True
+        self.updates_loaded_flag = True
+        self._bind_objects()
+        return self
 
     def _apply_update_file(self, update):
-        self._features.update(update.features)
-        self._geometries.update(update.geometries)
-        for feature_id in update.feature_deletes:
+        """Apply the records of an update file. Features are matched by record (RCID), vector records by key."""
+        self._reset_derived()
+        if self._feature_records is None:
+            self._feature_records = {self._features[key].record_id: key for key in self._features}
+        for feature_id in update.features:
+            if feature_id in self._features:
+                self._feature_index.remove(feature_id, self._features[feature_id])
+            self._features[feature_id] = update.features[feature_id]
+            self._features[feature_id].set_reference_cell(self)
+            self._feature_records[self._features[feature_id].record_id] = feature_id
+            self._feature_index.add(feature_id, update.features[feature_id])
+        for geometry_id in update.geometries:
+            self._geometries[geometry_id] = update.geometries[geometry_id]
+            self._geometries[geometry_id].set_reference_cell(self)
+        for record_id in update.feature_deletes:
+            if record_id not in self._feature_records:
+                logging.getLogger(__name__).warning("Update {} deletes missing feature record {}".format(
+                    update.path, record_id
+                ))
+                continue
+            feature_id = self._feature_records.pop(record_id)
+            self._feature_index.remove(feature_id, self._features[feature_id])
             del self._features[feature_id]
         for geometry_id in update.geometry_deletes:
+            if geometry_id not in self._geometries:
+                logging.getLogger(__name__).warning("Update {} deletes missing vector record {}".format(
+                    update.path, geometry_id
+                ))
+                continue
             del self._geometries[geometry_id]
         self.metadata.update(update.metadata)
         for object_update in update.updates:
             if isinstance(object_update, S57GeometryUpdate):
-                object_update.apply(self._geometries[object_update.identifier])
+                geometry = self._geometries[object_update.key]
+                if self._snapshots:
+                    # Copy on write, the snapshots still hold the original
+                    geometry = self._geometries[object_update.key] = geometry.copy()
+                    geometry.set_reference_cell(self)
+                object_update.apply(geometry)
             else:
-                object_update.apply(self._features[object_update.identifier])
+                feature_id = self._feature_records[object_update.record_id]
+                feature = self._features[feature_id]
+                self._feature_index.remove(feature_id, feature)
+                if self._snapshots:
+                    feature = self._features[feature_id] = feature.copy()
+                    feature.set_reference_cell(self)
+                object_update.apply(feature)
+                self._feature_index.add(feature_id, feature)
+
+
+def _load_cell_state(path, numeric_mode):
+    return S57Cell(Path(path), numeric_mode).to_state()
+
+
+def load_cells(paths, workers=None, numeric_mode=NumericMode.DECIMAL):
+    """Load many cells, each with all of its update files applied, using a pool of worker processes.
+
+    Cells are parsed in the workers and sent back through S57Cell.to_state(). Loaded cells are yielded in the order
+    of paths. workers defaults to the number of CPUs, with workers=1 everything is loaded in this process.
+    """
+    paths = [Path(p) for p in paths]
+    numeric_mode = NumericMode(numeric_mode).value
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            cell = S57Cell(path, numeric_mode)
+            cell._load_updates()
+            yield cell
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for state in executor.map(_load_cell_state, paths, [numeric_mode] * len(paths)):
+            yield S57Cell.from_state(state)
 
 
 class S57DataFile:
@@ -237,8 +875,7 @@ class S57DataFile:
     standard: S57Standard = None
 
     @injector.construct
-    def __init__(self, path, coordinate_factor=None, sounding_factor=None):
-        self._raw = DataFile.from_file(path)
+    def __init__(self, path, coordinate_factor=None, sounding_factor=None, numeric_mode=NumericMode.DECIMAL):
         self.coordinate_factor = None
         self.sounding_factor = None
         self.path = path
@@ -249,52 +886,127 @@ class S57DataFile:
         self.loaded_flag = False
         self.coordinate_factor = coordinate_factor
         self.sounding_factor = sounding_factor
+        self.numeric_mode = NumericMode(numeric_mode)
         self.updates = []
+        self._topology = None
+
+    def load(self):
+        self._build_structure()
+        return self
 
     def get_multiplication_factors(self):
         self._build_structure()
         return self.coordinate_factor, self.sounding_factor
 
+    def reset(self):
+        """Clear the records read so far, ready to process the records of the file again."""
+        self.geometries = {}
+        self.features = {}
+        self.metadata = {}
+        self.feature_deletes = []
+        self.geometry_deletes = []
+        self.updates = []
+        self._topology = None
+
     def _build_structure(self):
         if not self.loaded_flag:
-            self.geometries = {}
-            self.features = {}
-            self.metadata = {}
-            self.feature_deletes = []
-            self.geometry_deletes = []
-            for record in self._raw:
-                if "VRID" in record:
-                    if record["VRID"]["RUIN"] == 2:
-                        self.updates.append(
-                            S57GeometryUpdate(
-                                self.standard,
-                                self.coordinate_factor,
-                                self.sounding_factor
-                            ).from_iso8211(record)
-                        )
-                    elif record["VRID"]["RUIN"] == 1:
-                        geometry = S57Geometry(
-                            self.standard,
-                            self.coordinate_factor,
-                            self.sounding_factor
-                        ).from_iso8211(record)
-                        self.geometries[geometry.identifier] = geometry
-                    elif record["VRID"]["RUIN"] == 3:
-                        self.geometry_deletes.append(BaseS57Geometry.geometry_identifier(record, self.standard))
-                    else:
-                        raise ValueError("Unrecognized update instruction {}".format(record["VRID"][0]["RUIN"]))
-                elif "FRID" in record:
-                    if record["FRID"]["RUIN"] == 2:
-                        self.updates.append(S57FeatureUpdate(self.standard).from_iso8211(record))
-                    elif record["FRID"]["RUIN"] == 1:
-                        feature = S57Feature(self.standard).from_iso8211(record)
-                        self.features[feature.identifier] = feature
-                    elif record["FRID"]["RUIN"] == 3:
-                        self.feature_deletes.append(BaseS57Feature.feature_identifier(record, self.standard))
-                elif "DSID" in record or "DSPM" in record or "DSSI" in record:
-                    self._process_metadata_dataset(record)
+            self.reset()
+            # Records are streamed from the file and dropped once processed. Fields are only decoded when used, which
+            # lets coordinate fields go straight to arrays in the NUMPY mode.
+            for record in DataFile.stream(self.path, lazy=True, real_type=self.numeric_mode.real_type()):
+                self._process_record(record)
             self.loaded_flag = True
 
+    def iter_features(self):
+        """Parse the file and yield its new features as soon as their vector records have been read.
+
+        Only the vector records are kept. Features are bound to this file, so their geometry resolves against the
+        vector records read so far, and any feature read before its vector records is held back until they arrive or
+        the file ends. Updates and deletes are skipped.
+        """
+        self.reset()
+        # Features held back, by the key of a vector record they are still missing, along with their position in
+        # the file. Each one is looked at again only when that record arrives.
+        waiting = {}
+        position = 0
+        for record in DataFile.stream(self.path, lazy=True, real_type=self.numeric_mode.real_type()):
+            if "FRID" in record:
+                if record["FRID"]["RUIN"] != 1:
+                    continue
+                feature = S57Feature(self.standard).from_iso8211(record)
+                feature.set_reference_cell(self)
+                missing = self._missing_geometry(feature)
+                if missing is None:
+                    yield feature
+                else:
+                    waiting.setdefault(missing, []).append((position, feature))
+                    position += 1
+                continue
+            self._process_record(record)
+            if "VRID" in record and waiting:
+                held = waiting.pop(geometry_key(record["VRID"]["RCNM"], record["VRID"]["RCID"]), None)
+                if held is None:
+                    continue
+                ready = []
+                for entry in held:
+                    missing = self._missing_geometry(entry[1])
+                    if missing is None:
+                        ready.append(entry)
+                    else:
+                        waiting.setdefault(missing, []).append(entry)
+                for _, feature in sorted(ready, key=lambda entry: entry[0]):
+                    yield feature
+        for _, feature in sorted((entry for held in waiting.values() for entry in held), key=lambda entry: entry[0]):
+            yield feature
+
+    def _missing_geometry(self, feature):
+        topology = self.topology()
+        for rcnm, rcid, _, _, _ in feature.spatial_references.rows():
+            missing = topology.missing((rcnm << 32) | rcid)
+            if missing is not None:
+                return missing
+        return None
+
+    def topology(self):
+        if self._topology is None:
+            self._topology = TopologyResolver(self.geometries, self.numeric_mode)
+        return self._topology
+
+    def _process_record(self, record: Record):
+        # Record update instructions (RUIN): 1 inserts, 2 deletes and 3 modifies a record
+        if "VRID" in record:
+            if record["VRID"]["RUIN"] == 3:
+                self.updates.append(
+                    S57GeometryUpdate(
+                        self.standard,
+                        self.coordinate_factor,
+                        self.sounding_factor,
+                        self.numeric_mode
+                    ).from_iso8211(record)
+                )
+            elif record["VRID"]["RUIN"] == 1:
+                geometry = S57Geometry(
+                    self.standard,
+                    self.coordinate_factor,
+                    self.sounding_factor,
+                    self.numeric_mode
+                ).from_iso8211(record)
+                self.geometries[geometry.key] = geometry
+            elif record["VRID"]["RUIN"] == 2:
+                self.geometry_deletes.append(BaseS57Geometry.geometry_key(record))
+            else:
+                raise ValueError("Unrecognized update instruction {}".format(record["VRID"]["RUIN"]))
+        elif "FRID" in record:
+            if record["FRID"]["RUIN"] == 3:
+                self.updates.append(S57FeatureUpdate(self.standard).from_iso8211(record))
+            elif record["FRID"]["RUIN"] == 1:
+                feature = S57Feature(self.standard).from_iso8211(record)
+                self.features[feature.key] = feature
+            elif record["FRID"]["RUIN"] == 2:
+                self.feature_deletes.append(record["FRID"]["RCID"])
+        elif "DSID" in record or "DSPM" in record or "DSSI" in record:
+            self._process_metadata_dataset(record)
+
     def _process_metadata_dataset(self, data: Record):
         if "DSID" in data:
             self.metadata["DSID"] = data["DSID"].data
@@ -308,64 +1020,348 @@ class S57DataFile:
             self.metadata["DSSI"] = data["DSSI"].data
 
 
-class S57Object:
+class PointerRow:
+    """Read-only view of one row of a PointerTable, indexed like the pointer field dict it came from."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.table.value(self.index, key)
+
+    @property
+    def key(self):
+        """Integer key of the referenced record, as used by S57Cell.geometry() and S57Cell.feature()."""
+        return self.table.key(self.index)
+
+    def __contains__(self, key):
+        return key in self.table.KEYS
+
+    def keys(self):
+        return self.table.KEYS
+
+    def to_dict(self):
+        return {key: self[key] for key in self.table.KEYS}
+
+
+class PointerTable(abc.ABC):
+    """Pointer fields of a record (FSPT, VRPT, FFPT) stored as fixed-width rows of one typed array.
+
+    Iterating or indexing gives PointerRow views, slicing and join() give new tables, so the update instructions can
+    treat a table like the list of dicts it replaces.
+    """
+
+    __slots__ = ("values", "standard")
+
+    # Most records have no pointers of a given kind, so empty tables share one tuple until something is appended
+    EMPTY = ()
+
+    # Integer columns of each row in the array. Rows are interleaved in one array rather than kept as a narrower typed
+    # array per column, since most tables hold one or two rows and the header of each extra array outweighs the bytes
+    # saved (about 3.5 times the memory on the test cells)
+    FIELDS = ()
+    # Keys readable from a row, including the ones rendered from several columns
+    KEYS = ()
+
+    def __init__(self, standard=None, values=None):
+        self.values = values if values is not None else PointerTable.EMPTY
+        self.standard = standard
+
+    def __getstate__(self):
+        # A tuple, so the state of an empty table is not falsy and __setstate__() runs under every pickle protocol
+        return (self.values,)
+
+    def __setstate__(self, state):
+        self.values, = state
+        self.standard = None
+
+    def __len__(self):
+        return len(self.values) // len(self.FIELDS)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield PointerRow(self, i)
+
+    def __getitem__(self, item):
+        width = len(self.FIELDS)
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                raise ValueError("Pointer tables only support contiguous slices")
+            return type(self)(self.standard, self.values[start * width:max(start, stop) * width])
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("Pointer index out of range")
+        return PointerRow(self, item)
+
+    def __eq__(self, other):
+        return isinstance(other, PointerTable) and type(self) is type(other) and list(self.values) == list(other.values)
+
+    def rows(self):
+        """Iterate over the raw integer columns of each row as tuples, in the order of FIELDS."""
+        return zip(*[iter(self.values)] * len(self.FIELDS))
+
+    def column(self, key, index):
+        return self.values[(index * len(self.FIELDS)) + self.FIELDS.index(key)]
+
+    @abc.abstractmethod
+    def key(self, index):
+        """Return the integer key of the record the pointer in row index points to."""
+
+    def value(self, index, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return self.column(key, index)
+
+    def append_raw(self, *row):
+        if self.values is PointerTable.EMPTY:
+            self.values = array.array("I")
+        self.values.extend(row)
+
+    def join(self, parts):
+        joined = type(self)(self.standard, array.array("I"))
+        for part in parts:
+            joined.values.extend(part.values)
+        return joined
+
+
+class SpatialPointerTable(PointerTable):
+    """FSPT pointers from features to vector records."""
+
+    __slots__ = ()
+
+    FIELDS = ("RCNM", "RCID", "ORNT", "USAG", "MASK")
+    KEYS = ("NAME", "ORNT", "USAG", "MASK")
+
+    def key(self, index):
+        return geometry_key(self.column("RCNM", index), self.column("RCID", index))
+
+    def value(self, index, key):
+        if key == "NAME":
+            return "{}_{}".format(self.standard.record_name(self.column("RCNM", index)), self.column("RCID", index))
+        return super().value(index, key)
+
+    def append(self, record_set):
+        self.append_raw(
+            record_set["NAME"][-1],
+            bytes_to_int(record_set["NAME"][:-1]),
+            *(record_set[key] for key in self.FIELDS[2:])
+        )
+
+
+class VectorPointerTable(SpatialPointerTable):
+    """VRPT pointers between vector records, which also carry the topology indicator."""
+
+    __slots__ = ()
+
+    FIELDS = ("RCNM", "RCID", "ORNT", "USAG", "MASK", "TOPI")
+    KEYS = ("NAME", "ORNT", "USAG", "MASK", "TOPI")
+
+
+class FeaturePointerTable(PointerTable):
+    """FFPT pointers between feature records. Comments are kept in a list next to the integer columns."""
+
+    __slots__ = ("comments",)
+
+    FIELDS = ("AGEN", "FIDN", "FIDS", "RIND")
+    KEYS = ("LNAM", "RIND", "COMT")
+
+    def __init__(self, standard=None, values=None, comments=None):
+        super().__init__(standard, values)
+        self.comments = comments if comments is not None else PointerTable.EMPTY
+
+    def __getstate__(self):
+        return self.values, self.comments
+
+    def __setstate__(self, state):
+        self.values, self.comments = state
+        self.standard = None
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            table = super().__getitem__(item)
+            table.comments = self.comments[item]
+            return table
+        return super().__getitem__(item)
+
+    def __eq__(self, other):
+        return super().__eq__(other) and self.comments == other.comments
+
+    def key(self, index):
+        return feature_key(self.column("AGEN", index), self.column("FIDN", index), self.column("FIDS", index))
+
+    def value(self, index, key):
+        if key == "LNAM":
+            return "{}_{}_{}".format(
+                self.standard.agency(self.column("AGEN", index)),
+                self.column("FIDN", index),
+                self.column("FIDS", index)
+            )
+        if key == "COMT":
+            return self.comments[index]
+        return super().value(index, key)
+
+    def append(self, record_set):
+        self.append_raw(
+            bytes_to_int(record_set["LNAM"][6:]),
+            bytes_to_int(record_set["LNAM"][2:6]),
+            bytes_to_int(record_set["LNAM"][0:2]),
+            record_set["RIND"]
+        )
+        if self.comments is PointerTable.EMPTY:
+            self.comments = []
+        self.comments.append(record_set["COMT"])
+
+    def join(self, parts):
+        joined = super().join(parts)
+        joined.comments = [comment for part in parts for comment in part.comments]
+        return joined
+
+
+@lru_cache(None)
+def _multiplication_factor(real_type, factor):
+    # Shared by every geometry of a cell instead of one converted copy each
+    return real_type(factor)
+
+
+class S57Object(abc.ABC):
+
+    __slots__ = ("key", "_metadata", "spatial_references", "cell", "standard")
+
+    # Integer values kept from the record identifier fields, in the order metadata returns them
+    METADATA_FIELDS = ()
+    SPATIAL_POINTER_TABLE = SpatialPointerTable
+
+    # Attributes that are rebuilt rather than pickled: links back to the cell and standard, and cached values
+    _transient_attributes = ("cell", "standard")
 
     def __init__(self, standard):
-        self.identifier = None
-        self.metadata = None
-        self.spatial_references = []
+        self.key = None
+        self._metadata = None
+        self.spatial_references = self.SPATIAL_POINTER_TABLE(standard)
         self.cell = None
         self.standard = standard
 
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in self._transient_attributes:
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name in self._transient_attributes:
+            setattr(self, name, None)
+        for name in state:
+            setattr(self, name, state[name])
+
+    def set_version(self, version):
+        self._metadata[self.METADATA_FIELDS.index("RVER")] = version
+
+    def copy(self):
+        """Return an unbound copy that an update can change without changing this object.
+
+        Updates replace the pointer tables and coordinates rather than changing them, so those are shared.
+        """
+        duplicate = copy.copy(self)
+        duplicate._metadata = self._metadata[:]
+        return duplicate
+
+    @property
+    @abc.abstractmethod
+    def identifier(self):
+        """Name of the record (e.g. "VE_1234" or "US_5678_1"), rendered from the integer key."""
+
+    @property
+    def metadata(self):
+        """Record identifier values (e.g. FRID and FOID) as a new dict."""
+        if self._metadata is None:
+            return None
+        return dict(zip(self.METADATA_FIELDS, self._metadata))
+
+    @metadata.setter
+    def metadata(self, values):
+        self._metadata = None if values is None else array.array("I", (values[key] for key in self.METADATA_FIELDS))
+
     def set_reference_cell(self, cell: S57Cell):
-        self.cell = None
+        self.cell = cell
+        self.standard = cell.standard
+        self.spatial_references.standard = cell.standard
 
-    def _build_spatial_reference(self, record_set):
-        sref = {
-            "NAME": "{}_{}".format(
-                self.standard.record_name(record_set["NAME"][-1]),
-                bytes_to_int(record_set["NAME"][:-1])
-            ),
-            "ORNT": record_set["ORNT"],
-            "USAG": record_set["USAG"],
-            "MASK": record_set["MASK"]
-        }
-        if "TOPI" in record_set:
-            sref["TOPI"] = record_set["TOPI"]
-        return sref
+    def _build_spatial_references(self, record_sets):
+        table = self.SPATIAL_POINTER_TABLE(self.standard)
+        for record_set in record_sets:
+            table.append(record_set)
+        return table
 
     @staticmethod
     def apply_update(mode: int, index: int, length: int, target_list: list, new_data: list = None):
+        # Indexes are 1-based, the new data goes in at (or replaces length items from) the index
         if mode == 1:
-            return target_list[0:index-1] + new_data + target_list[index-1:]
+            parts = (target_list[0:index-1], new_data, target_list[index-1:])
         elif mode == 2:
-            return target_list[0:index] + target_list[index+length:]
+            parts = (target_list[0:index-1], target_list[index-1+length:])
         elif mode == 3:
-            return target_list[0:index] + new_data + target_list[index+length:]
+            parts = (target_list[0:index-1], new_data, target_list[index-1+length:])
         else:
             raise ValueError("Invalid mode: {}".format(mode))
+        if isinstance(target_list, list):
+            return [item for part in parts for item in part]
+        if isinstance(target_list, PointerTable):
+            return target_list.join(parts)
+        # Coordinate arrays in the NUMPY mode
+        return import_numpy().concatenate(parts)
 
 
 class BaseS57Feature(S57Object):
 
+    __slots__ = ("layer", "attributes")
+
+    METADATA_FIELDS = ("AGEN", "FIDN", "FIDS", "RCNM", "RCID", "PRIM", "GRUP", "OBJL", "RVER", "RUIN")
+
     def __init__(self, standard):
         super().__init__(standard)
         self.layer = None
         self.attributes = {}
 
     @staticmethod
-    def feature_identifier(data, standard: S57Standard):
-        return "{}_{}_{}".format(
-            standard.agency(data["FOID"]["AGEN"]),
-            data["FOID"]["FIDN"],
-            data["FOID"]["FIDS"],
-        )
+    def feature_key(data):
+        return feature_key(data["FOID"]["AGEN"], data["FOID"]["FIDN"], data["FOID"]["FIDS"])
+
+    @property
+    def identifier(self):
+        agen, fidn, fids = split_feature_key(self.key)
+        return "{}_{}_{}".format(self.standard.agency(agen), fidn, fids)
+
+    def copy(self):
+        duplicate = super().copy()
+        # Attribute updates change the dict in place
+        duplicate.attributes = dict(self.attributes)
+        return duplicate
+
+    @property
+    def primitive(self):
+        return self._metadata[5]
+
+    @property
+    def record_id(self):
+        """RCID of the feature record, which update records use to refer to it."""
+        return self._metadata[4]
 
     def from_iso8211(self, data: Record):
-        self.identifier = BaseS57Feature.feature_identifier(data, self.standard)
-        self.metadata = copy.deepcopy(data["FOID"].data)
-        self.metadata.update(data["FRID"].data)
-        self.layer = self.standard.object_type(self.metadata["OBJL"])
+        # Update records that modify or delete a feature may leave out the FOID field
+        foid = data["FOID"].data if "FOID" in data else {}
+        frid = data["FRID"].data
+        self.key = BaseS57Feature.feature_key(data) if foid else None
+        self._metadata = array.array("I", (
+            foid[key] if key in foid else frid.get(key, 0) for key in self.METADATA_FIELDS
+        ))
+        self.layer = self.standard.object_type(frid["OBJL"])
         if "ATTF" in data:
             for attribute in data["ATTF"]:
                 self.attributes[self.standard.attribute_name(attribute["ATTL"])] = attribute["ATVL"]
@@ -374,23 +1370,24 @@ class BaseS57Feature(S57Object):
                 self.attributes[self.standard.attribute_name(attribute["ATTL"])] = attribute["ATVL"]
         return self
 
-    def _build_feature_reference(self, record_set):
-        return {
-            "LNAM": "{}_{}_{}".format(
-                self.standard.agency(bytes_to_int(record_set["LNAM"][6:])),
-                bytes_to_int(record_set["LNAM"][2:6]),
-                bytes_to_int(record_set["LNAM"][0:2])
-            ),
-            "RIND": record_set["RIND"],
-            "COMT": record_set["COMT"]
-        }
+    def _build_feature_references(self, record_sets):
+        table = FeaturePointerTable(self.standard)
+        for record_set in record_sets:
+            table.append(record_set)
+        return table
 
 
 class S57Feature(BaseS57Feature):
 
+    __slots__ = ("feature_references", "_geometry", "_wkt")
+
+    _transient_attributes = ("cell", "standard", "_geometry", "_wkt")
+
     def __init__(self, standard):
         super().__init__(standard)
-        self.feature_references = []
+        self.feature_references = FeaturePointerTable(standard)
+        self._geometry = None
+        self._wkt = None
 
     def __contains__(self, item):
         return item in self.attributes
@@ -398,129 +1395,129 @@ class S57Feature(BaseS57Feature):
     def __getitem__(self, item):
         return self.attributes[item]
 
+    def set_reference_cell(self, cell: S57Cell):
+        super().set_reference_cell(cell)
+        self.feature_references.standard = cell.standard
+
     def from_iso8211(self, data: Record):
         super().from_iso8211(data)
         if "FFPT" in data:
-            for feature_pointer in data["FFPT"]:
-                self.feature_references.append(self._build_feature_reference(feature_pointer))
+            self.feature_references = self._build_feature_references(data["FFPT"])
         if "FSPT" in data:
-            for spatial_pointer in data["FSPT"]:
-                self.spatial_references.append(self._build_spatial_reference(spatial_pointer))
+            self.spatial_references = self._build_spatial_references(data["FSPT"])
         return self
 
-    @cached_property
+    @property
     def geometry(self):
-        if self.metadata["PRIM"] == 255:
-            return "NONE", []
-        geometry_type = None
-        points = []
-        inner_cut = [[]]
-        for ref in self.spatial_references:
-            geom = self.cell.geometry(ref["NAME"])
-            geom_points = geom.points()
-            # Reverse if required
-            if ref["ORNT"] == 2:
-                geom_points.reverse()
-            # Check if we are dealing with an independent point set
-            if geom.record_name in ("VC", "VI"):
-                geometry_type = "MULTIPOINT"
-            elif geometry_type == "MULTIPOINT":
-                raise ValueError("Discovered non-point record after point record")
-            # Check if it is an inner edge
-            if geom.record_name == "VE" and ref["USAG"] == 2:
-                inner_cut[-1].extend(geom_points)
-            # Outer edge
-            else:
-                points.extend(geom_points)
-        if len(points) == 0:
-            return "NONE", []
-        elif self.metadata["PRIM"] == 1:
-            return ("POINT", points[0]) if len(points) == 1 else ("MULTIPOINT", points)
-        elif self.metadata["PRIM"] == 2:
-            return "LINESTRING", points
-        elif self.metadata["PRIM"] == 3:
-            return "POLYGON", [points, *inner_cut]
-        raise ValueError("Unknown PRIM {}".format(self.metadata["PRIM"]))
+        if self._geometry is None:
+            self._geometry = self.cell.topology().feature_geometry(self.primitive, self.spatial_references)
+        return self._geometry
 
-    @cached_property
+    @property
     def wkt(self):
-        datatype, point_list = self.geometry
-        if datatype == "NONE":
-            return None
-        if datatype == "POINT":
-            return "POINT ({} {})".format(*point_list)
-        if datatype == "MULTIPOINT":
-            return "MULTIPOINT ({})".format(",".join("({} {})".format(*point) for point in point_list))
-        if datatype == "LINESTRING":
-            return "LINESTRING ({})".format(",".join("{} {}".format(*point) for point in point_list))
-        if datatype == "POLYGON":
-            return "POLYGON ({})".format(",".join("({})".format(",".join("{} {}".format(*point) for point in section)) for section in point_list))
-        raise ValueError("Unrecognized geometry type {}".format(datatype))
+        if self._wkt is None:
+            self._wkt = self._build_wkt()
+        return self._wkt
+
+    def _build_wkt(self):
+        return geometry_to_wkt(self.geometry)
 
 
 class S57FeatureUpdate(BaseS57Feature):
 
+    __slots__ = ("spatial_ref_update", "feature_ref_update")
+
     def __init__(self, standard):
         super().__init__(standard)
         self.spatial_ref_update = None
         self.feature_ref_update = None
 
     def from_iso8211(self, data: Record):
-        super().from_iso8211()
+        super().from_iso8211(data)
         if "FFPC" in data:
-            self.feature_ref_update = (data["FFPC"][0], data["FFPT"])
+            self.feature_ref_update = (data["FFPC"].data, data["FFPT"].data if "FFPT" in data else [])
         if "FSPC" in data:
-            self.spatial_ref_update = (data["FSPC"][0], data["FSPT"])
+            self.spatial_ref_update = (data["FSPC"].data, data["FSPT"].data if "FSPT" in data else [])
         return self
 
     def apply(self, feature: S57Feature):
+        feature.set_version(self._metadata[self.METADATA_FIELDS.index("RVER")])
         if self.spatial_ref_update:
             feature.spatial_references = S57Object.apply_update(
                 self.spatial_ref_update[0]["FSUI"],
                 self.spatial_ref_update[0]["FSIX"],
                 self.spatial_ref_update[0]["NSPT"],
                 feature.spatial_references,
-                [self._build_spatial_reference(fspt) for fspt in self.spatial_ref_update[1]]
+                self._build_spatial_references(self.spatial_ref_update[1])
             )
         if self.feature_ref_update:
-            feature.spatial_references = S57Object.apply_update(
+            feature.feature_references = S57Object.apply_update(
                 self.feature_ref_update[0]["FFUI"],
                 self.feature_ref_update[0]["FFIX"],
                 self.feature_ref_update[0]["NFPT"],
                 feature.feature_references,
-                [self._build_feature_reference(ffpt) for ffpt in self.feature_ref_update[1]]
+                self._build_feature_references(self.feature_ref_update[1])
             )
         if self.attributes:
             for attr_name in self.attributes:
-                if self.attributes[attr_name] == '⌂':
+                # The delete marker is the DEL character (shown as ⌂ in code page 437)
+                if self.attributes[attr_name] in ('\x7f', '⌂'):
                     if attr_name in feature.attributes:
                         del feature.attributes[attr_name]
                 else:
-                    feature.attributes[attr_name] = attr_name
+                    feature.attributes[attr_name] = self.attributes[attr_name]
 
 
 class BaseS57Geometry(S57Object):
 
-    def __init__(self, standard, comf, somf):
+    __slots__ = ("numeric_mode", "coordinate_factor", "sounding_factor", "record_name")
+
+    METADATA_FIELDS = ("RCNM", "RCID", "RVER", "RUIN")
+    SPATIAL_POINTER_TABLE = VectorPointerTable
+
+    def __init__(self, standard, comf, somf, numeric_mode=NumericMode.DECIMAL):
         super().__init__(standard)
-        self.coordinate_factor = decimal.Decimal(comf)
-        self.sounding_factor = decimal.Decimal(somf)
+        self.numeric_mode = numeric_mode
+        self.coordinate_factor = _multiplication_factor(numeric_mode.real_type(), comf)
+        self.sounding_factor = _multiplication_factor(numeric_mode.real_type(), somf)
         self.record_name = None
 
     @staticmethod
-    def geometry_identifier(data, standard: S57Standard):
-        return "{}_{}".format(
-            standard.record_name(data["VRID"]["RCNM"]),
-            data["VRID"]["RCID"]
-        )
+    def geometry_key(data):
+        return geometry_key(data["VRID"]["RCNM"], data["VRID"]["RCID"])
+
+    @property
+    def identifier(self):
+        rcnm, rcid = split_geometry_key(self.key)
+        return "{}_{}".format(self.standard.record_name(rcnm), rcid)
 
     def from_iso8211(self, data: Record):
-        self.identifier = BaseS57Geometry.geometry_identifier(data, self.standard)
+        self.key = BaseS57Geometry.geometry_key(data)
         self.record_name = self.standard.record_name(data["VRID"]["RCNM"])
         self.metadata = data["VRID"].data
         return self
 
     def _build_geometry(self, points, dimensions):
+        if self.numeric_mode is NumericMode.NUMPY:
+            # Raw integers, reordered from the YCOO, XCOO, VE3D order of the record to x, y, z
+            keys = ("XCOO", "YCOO", "VE3D")[:dimensions]
+            numpy = import_numpy()
+            if isinstance(points, Field):
+                raw = points.to_array()
+                return numpy.column_stack([raw[key] for key in keys]).astype(numpy.int32, copy=False)
+            return numpy.array([[point[key] for key in keys] for point in points], dtype=numpy.int32).reshape(
+                -1, dimensions
+            )
+        if self.numeric_mode is NumericMode.INT:
+            if dimensions > 2:
+                return [[point["XCOO"], point["YCOO"], point["VE3D"]] for point in points]
+            return [[point["XCOO"], point["YCOO"]] for point in points]
+        if self.numeric_mode is NumericMode.FLOAT:
+            comf = self.coordinate_factor
+            if dimensions > 2:
+                somf = self.sounding_factor
+                return [[point["XCOO"] / comf, point["YCOO"] / comf, point["VE3D"] / somf] for point in points]
+            return [[point["XCOO"] / comf, point["YCOO"] / comf] for point in points]
         real_points = []
         for point in points:
             coordinates = [
@@ -532,12 +1529,24 @@ class BaseS57Geometry(S57Object):
             real_points.append(coordinates)
         return real_points
 
+    def _scaled_geometry(self):
+        if self.numeric_mode is NumericMode.NUMPY:
+            numpy = import_numpy()
+            factors = numpy.array(
+                [self.coordinate_factor, self.coordinate_factor, self.sounding_factor][:self.geometry.shape[1]],
+                dtype=numpy.float64
+            )
+            return self.geometry / factors
+        return list(self.geometry)
+
 
 class S57Geometry(BaseS57Geometry):
 
-    def __init__(self, standard, comf, somf):
-        super().__init__(standard, comf, somf)
-        self.geometry = []
+    __slots__ = ("geometry",)
+
+    def __init__(self, standard, comf, somf, numeric_mode=NumericMode.DECIMAL):
+        super().__init__(standard, comf, somf, numeric_mode)
+        self.geometry = [] if numeric_mode is not NumericMode.NUMPY else import_numpy().empty((0, 2), dtype="int32")
 
     def from_iso8211(self, data: Record):
         super().from_iso8211(data)
@@ -546,37 +1555,20 @@ class S57Geometry(BaseS57Geometry):
         elif "SG2D" in data:
             self.geometry = self._build_geometry(data["SG2D"], 2)
         if "VRPT" in data:
-            for spatial_pointer in data["VRPT"]:
-                self.spatial_references.append(self._build_spatial_reference(spatial_pointer))
+            self.spatial_references = self._build_spatial_references(data["VRPT"])
         return self
 
-    @cached_property
+    @property
     def points(self):
-        full_point_list = copy.deepcopy(self.geometry)
-        if self.record_name == "VI" or self.record_name == "VC":
-            if self.spatial_references:
-                raise ValueError("Independent/node types shouldn't have spatial references?")
-        elif self.record_name == "VE":
-            # Check for start and end nodes
-            for ref in self.spatial_references:
-                referenced_geometry = self.cell.geometry(ref["NAME"])
-                if not referenced_geometry.record_name == 'VC':
-                    raise ValueError("Edge records should have a record name of VC")
-                if referenced_geometry["TOPI"] == 1:
-                    full_point_list = referenced_geometry.points() + full_point_list
-                elif referenced_geometry["TOPI"] == 2:
-                    full_point_list += referenced_geometry.points()
-                else:
-                    raise ValueError("Unknown value for TOPI: {}".format(referenced_geometry["TOPI"]))
-        else:
-            raise ValueError("Unknown record name {}".format(self.record_name))
-        return full_point_list
+        return self.cell.topology().chain(self.key)
 
 
 class S57GeometryUpdate(S57Geometry):
 
-    def __init__(self, standard, comf, somf):
-        super().__init__(standard, comf, somf)
+    __slots__ = ("spatial_ref_update", "geometry_update")
+
+    def __init__(self, standard, comf, somf, numeric_mode=NumericMode.DECIMAL):
+        super().__init__(standard, comf, somf, numeric_mode)
         self.spatial_ref_update = None
         self.geometry_update = None
 
@@ -584,21 +1576,22 @@ class S57GeometryUpdate(S57Geometry):
         super().from_iso8211(data)
         if "SGCC" in data:
             if "SG3D" in data:
-                self.geometry_update = (data["SGCC"], data["SG3D"], 3)
+                self.geometry_update = (data["SGCC"].data, data["SG3D"].data, 3)
             else:
-                self.geometry_update = (data["SGCC"], data["SG2D"], 2)
+                self.geometry_update = (data["SGCC"].data, data["SG2D"].data if "SG2D" in data else [], 2)
         if "VRPC" in data:
-            self.spatial_ref_update = (data["VRPC"], data["VRPT"])
+            self.spatial_ref_update = (data["VRPC"].data, data["VRPT"].data if "VRPT" in data else [])
         return self
 
     def apply(self, geometry: S57Geometry):
+        geometry.set_version(self._metadata[self.METADATA_FIELDS.index("RVER")])
         if self.spatial_ref_update:
             geometry.spatial_references = S57Object.apply_update(
-                self.spatial_ref_update[0]["FSUI"],
-                self.spatial_ref_update[0]["FSIX"],
-                self.spatial_ref_update[0]["NSPT"],
+                self.spatial_ref_update[0]["VPUI"],
+                self.spatial_ref_update[0]["VPIX"],
+                self.spatial_ref_update[0]["NVPT"],
                 geometry.spatial_references,
-                [self._build_spatial_reference(fspt) for fspt in self.spatial_ref_update[1]]
+                self._build_spatial_references(self.spatial_ref_update[1])
             )
         if self.geometry_update:
             geometry.geometry = S57Object.apply_update(
@@ -0,0 +1,142 @@
+import math
+
+
+class STRTree:
+    """Static R-tree bulk loaded with the Sort-Tile-Recursive algorithm.
+
+    Built once from (bounds, value) pairs, where bounds is (min_x, min_y, max_x, max_y), and queried for every value
+    whose bounds intersect a box.
+    """
+
+    def __init__(self, entries, node_capacity=16):
+        self.node_capacity = node_capacity
+        self.size = 0
+        level = []
+        for bounds, value in entries:
+            level.append((bounds[0], bounds[1], bounds[2], bounds[3], value))
+            self.size += 1
+        self.root = None
+        if not level:
+            return
+        leaf = True
+        while True:
+            level = self._pack(level, leaf)
+            leaf = False
+            if len(level) == 1:
+                break
+        self.root = level[0]
+
+    def __len__(self):
+        return self.size
+
+    def _pack(self, entries, leaf):
+        capacity = self.node_capacity
+        node_count = math.ceil(len(entries) / capacity)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * capacity
+        entries.sort(key=lambda e: e[0] + e[2])
+        nodes = []
+        for i in range(0, len(entries), slice_size):
+            vertical_slice = entries[i:i + slice_size]
+            vertical_slice.sort(key=lambda e: e[1] + e[3])
+            for j in range(0, len(vertical_slice), capacity):
+                children = vertical_slice[j:j + capacity]
+                nodes.append((
+                    min(c[0] for c in children),
+                    min(c[1] for c in children),
+                    max(c[2] for c in children),
+                    max(c[3] for c in children),
+                    children,
+                    leaf
+                ))
+        return nodes
+
+    def query(self, min_x, min_y, max_x, max_y):
+        """Yield the value of every entry whose bounds intersect the box."""
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[0] > max_x or node[2] < min_x or node[1] > max_y or node[3] < min_y:
+                continue
+            if node[5]:
+                for c in node[4]:
+                    if not (c[0] > max_x or c[2] < min_x or c[1] > max_y or c[3] < min_y):
+                        yield c[4]
+            else:
+                stack.extend(node[4])
+
+
+def _point_lists(geometry):
+    geometry_type, points = geometry
+    if geometry_type == "NONE":
+        return []
+    if geometry_type == "POINT":
+        return [[points]]
+    if geometry_type == "POLYGON":
+        return points
+    return [points]
+
+
+def geometry_bounds(geometry):
+    """Return (min_x, min_y, max_x, max_y) of a feature geometry tuple, or None for empty geometries."""
+    bounds = None
+    for point_list in _point_lists(geometry):
+        if len(point_list) == 0:
+            continue
+        if hasattr(point_list, "shape"):
+            # NumPy coordinate array
+            part = (
+                float(point_list[:, 0].min()), float(point_list[:, 1].min()),
+                float(point_list[:, 0].max()), float(point_list[:, 1].max())
+            )
+        else:
+            xs = [float(p[0]) for p in point_list]
+            ys = [float(p[1]) for p in point_list]
+            part = (min(xs), min(ys), max(xs), max(ys))
+        if bounds is None:
+            bounds = part
+        else:
+            bounds = (min(bounds[0], part[0]), min(bounds[1], part[1]), max(bounds[2], part[2]), max(bounds[3], part[3]))
+    return bounds
+
+
+def _segment_distance(x, y, x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    length = dx * dx + dy * dy
+    if length == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length))
+    return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+def _ring_contains(ring, x, y):
+    inside = False
+    for i in range(len(ring)):
+        x1, y1 = ring[i - 1]
+        x2, y2 = ring[i]
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def geometry_distance(geometry, x, y):
+    """Planar distance from (x, y) to a feature geometry tuple, zero inside polygons. None for empty geometries."""
+    geometry_type = geometry[0]
+    best = None
+    point_lists = [[(float(p[0]), float(p[1])) for p in point_list] for point_list in _point_lists(geometry)]
+    if geometry_type == "POLYGON" and point_lists and point_lists[0]:
+        if _ring_contains(point_lists[0], x, y) and not any(_ring_contains(r, x, y) for r in point_lists[1:] if r):
+            return 0.0
+    for point_list in point_lists:
+        if geometry_type in ("POINT", "MULTIPOINT") or len(point_list) == 1:
+            for px, py in point_list:
+                d = math.hypot(x - px, y - py)
+                best = d if best is None else min(best, d)
+        else:
+            for i in range(1, len(point_list)):
+                d = _segment_distance(x, y, *point_list[i - 1], *point_list[i])
+                best = d if best is None else min(best, d)
+    return best
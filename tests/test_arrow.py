@@ -0,0 +1,50 @@
+import json
+import tempfile
+import unittest
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57.export import geometry_to_wkb
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrowExport(unittest.TestCase):
+
+    def get_cell(self):
+        return S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+
+    def test_layer_tables(self):
+        cell = self.get_cell()
+        tables = cell.to_arrow(batch_size=50)
+        self.assertEqual(set(tables), set(cell.layers()))
+        depare = tables["DEPARE"]
+        self.assertEqual(depare.schema.field("DRVAL1").type, pyarrow.float64())
+        self.assertEqual(depare.schema.field("geometry").type, pyarrow.binary())
+        features = list(cell.features("DEPARE"))
+        self.assertEqual(depare.column("identifier").to_pylist(), [f.identifier for f in features])
+        self.assertEqual(depare.column("geometry").to_pylist(), [geometry_to_wkb(f.geometry) for f in features])
+        self.assertEqual(depare.column("DRVAL1").to_pylist(), [
+            float(f["DRVAL1"]) if f["DRVAL1"] else None for f in features
+        ])
+        for table in tables.values():
+            for name in table.schema.names[1:-1]:
+                if cell.standard.attribute_type(name) == "L":
+                    self.assertEqual(table.schema.field(name).type, pyarrow.list_(pyarrow.int32()))
+
+    def test_geoparquet_row_groups(self):
+        cell = self.get_cell()
+        with tempfile.TemporaryDirectory() as directory:
+            paths = cell.to_geoparquet(directory, batch_size=20)
+            soundings = pathlib.Path(directory) / "SOUNDG.parquet"
+            self.assertIn(soundings, paths)
+            parquet = pyarrow.parquet.ParquetFile(soundings)
+            count = len(list(cell.features("SOUNDG")))
+            self.assertEqual(parquet.metadata.num_rows, count)
+            self.assertEqual(parquet.metadata.num_row_groups, -(-count // 20))
+            geo = json.loads(parquet.schema_arrow.metadata[b"geo"])
+            self.assertEqual(geo["primary_column"], "geometry")
+            self.assertEqual(geo["columns"]["geometry"]["encoding"], "WKB")
@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57 import cache as cache_module
+from navchart.s57.cache import CellCache
+
+
+class TestCellCache(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = pathlib.Path(tempfile.mkdtemp())
+        self.cell_path = self.work_dir / "US4AK3SB.000"
+        shutil.copy(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000", self.cell_path)
+        self.cache_dir = self.work_dir / "cache"
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def test_warm_load_matches_parse(self):
+        cold = S57Cell(self.cell_path, cache=self.cache_dir)
+        cold_wkt = {f.identifier: f.wkt for f in cold.features()}
+        self.assertEqual(len(list(self.cache_dir.glob("*.cellcache"))), 1)
+        cache = CellCache(self.cache_dir)
+        warm = S57Cell(self.cell_path, cache=cache)
+        self.assertIsNotNone(cache.load(warm))
+        self.assertEqual(cold_wkt, {f.identifier: f.wkt for f in warm.features()})
+        self.assertEqual(cold.metadata, warm.metadata)
+
+    def test_changed_input_misses(self):
+        cache = CellCache(self.cache_dir)
+        S57Cell(self.cell_path, cache=cache)._load_updates()
+        stat = os.stat(self.cell_path)
+        os.utime(self.cell_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        changed = S57Cell(self.cell_path, cache=cache)
+        self.assertIsNone(cache.load(changed))
+        changed._load_updates()
+        # The stale entry is replaced rather than kept alongside
+        self.assertEqual(len(list(self.cache_dir.glob("*.cellcache"))), 1)
+
+    def test_lru_eviction(self):
+        cache = CellCache(self.cache_dir, max_bytes=1)
+        S57Cell(self.cell_path, cache=cache)._load_updates()
+        self.assertEqual(list(self.cache_dir.glob("*.cellcache")), [])
+
+    def test_same_name_in_two_folders(self):
+        other_path = self.work_dir / "other" / "US4AK3SB.000"
+        other_path.parent.mkdir()
+        shutil.copy(self.cell_path, other_path)
+        cache = CellCache(self.cache_dir)
+        S57Cell(self.cell_path, cache=cache)._load_updates()
+        S57Cell(other_path, cache=cache)._load_updates()
+        self.assertEqual(len(list(self.cache_dir.glob("*.cellcache"))), 2)
+        self.assertIsNotNone(cache.load(S57Cell(self.cell_path, cache=cache)))
+        self.assertIsNotNone(cache.load(S57Cell(other_path, cache=cache)))
+
+    def test_cold_load_reads_files_once(self):
+        with unittest.mock.patch.object(cache_module, "file_crc32", wraps=cache_module.file_crc32) as crc:
+            S57Cell(self.cell_path, cache=self.cache_dir)._load_updates()
+        self.assertEqual(crc.call_count, 1)
@@ -0,0 +1,38 @@
+import unittest
+import pathlib
+import zlib
+from navchart.s57.catalog import S57Catalog, Entry, format_crc
+
+
+class TestCatalogVerify(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def build_catalog(self):
+        catalog = S57Catalog().from_scratch(self.root)
+        for name in ("US1AK90M", "US2AK5FM", "US3DE01M", "US4AK3SB", "US5AK3MM", "MISSING0"):
+            path = self.root / name / "{}.000".format(name)
+            entry = Entry().from_path(self.root, path, "", 0, 0, 0, 0)
+            if path.exists():
+                with open(path, "rb") as h:
+                    entry.metadata["CRCS"] = format_crc(zlib.crc32(h.read()))
+            else:
+                entry.metadata["CRCS"] = "00000000"
+            catalog.append(entry)
+        catalog.files["US2AK5FM.000"].metadata["CRCS"] = "DEADBEEF"
+        catalog.files["US4AK3SB.000"].metadata["CRCS"] = ""
+        return catalog
+
+    def test_verify(self):
+        for workers in (1, 4):
+            result = self.build_catalog().verify(workers=workers, chunk_size=4096)
+            self.assertEqual(result.checked, 4)
+            self.assertEqual([entry.name for entry, _, _ in result.mismatches], ["US2AK5FM.000"])
+            self.assertEqual([entry.name for entry in result.missing], ["MISSING0.000"])
+            self.assertEqual([entry.name for entry in result.unchecked], ["US4AK3SB.000"])
+            self.assertFalse(result.ok)
+
+    def test_entry_crc(self):
+        entry = self.build_catalog().files["US3DE01M.000"]
+        self.assertTrue(entry.check_crc())
+        self.assertEqual(len(entry.real_crc), 8)
@@ -0,0 +1,59 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+import pathlib
+from navchart.cli import main, find_cells
+
+
+class TestCommandLine(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def run_main(self, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = main([str(arg) for arg in args])
+        return code, output.getvalue()
+
+    def test_find_cells(self):
+        cells = dict(find_cells([self.root, self.root / "US5AK3MM/US5AK3MM.000"]))
+        self.assertEqual(len(cells), 6)
+        self.assertTrue(all(path.suffix == ".000" for path in cells))
+        self.assertEqual([path.name for path in cells[self.root / "US3DE01M/US3DE01M.000"]], [
+            "US3DE01M.{:03d}".format(i) for i in range(1, 8)
+        ])
+
+    def test_info(self):
+        code, output = self.run_main("info", self.root / "US5AK3MM/US5AK3MM.000", self.root / "US4AK3SB")
+        self.assertEqual(code, 0)
+        self.assertIn("US5AK3MM.000", output)
+        self.assertIn("Edition: ", output)
+        self.assertEqual(output.count("Extent: "), 2)
+
+    def test_dump(self):
+        code, output = self.run_main("dump", self.root / "US4AK3SB/US4AK3SB.001", "--limit", 2)
+        self.assertEqual(code, 0)
+        self.assertIn("DSID: ", output)
+        self.assertNotIn("Record 2", output)
+
+    def test_export_with_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            code, output = self.run_main(
+                "export", self.root / "US5AK3MM", self.root / "US4AK3SB",
+                "--format", "ndjson", "--output", directory, "--workers", 2, "--layers", "SOUNDG"
+            )
+            self.assertEqual(code, 0)
+            exported = pathlib.Path(directory) / "US5AK3MM.ndjson"
+            lines = exported.read_text("utf-8").splitlines()
+            self.assertTrue(lines)
+            self.assertIn("US5AK3MM.ndjson: {} features".format(len(lines)), output)
+            self.assertEqual(json.loads(lines[0])["properties"]["layer"], "SOUNDG")
+
+    def test_validate(self):
+        with tempfile.TemporaryDirectory() as cache:
+            code, output = self.run_main("validate", self.root / "US5AK3MM", "--cache", cache)
+            self.assertEqual(code, 0)
+            self.assertIn("US5AK3MM.000: OK", output)
+            self.assertTrue(list(pathlib.Path(cache).glob("*.cellcache")))
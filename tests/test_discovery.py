@@ -0,0 +1,78 @@
+import shutil
+import tempfile
+import unittest
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57.discovery import ExchangeSet
+from navchart.s57.iso8211 import DataFile
+
+
+class TestExchangeSet(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def test_scan(self):
+        exchange_set = ExchangeSet.scan(self.root)
+        self.assertEqual(len(exchange_set), 6)
+        self.assertEqual(exchange_set.cell_names()[0], "US1AK90M")
+        self.assertEqual(exchange_set.update_paths("US3DE01M"), [
+            self.root / "US3DE01M" / "US3DE01M.{:03d}".format(i) for i in range(1, 8)
+        ])
+        self.assertEqual(exchange_set.update_paths("US1AK90M"), [])
+        self.assertEqual(exchange_set.support_path("us3de01a.txt"), self.root / "US3DE01M" / "US3DE01A.TXT")
+
+    def test_nested_layout(self):
+        # ENC_ROOT/CELL/EDITION/UPDATE, with the updates in a different folder than the base cell
+        with tempfile.TemporaryDirectory() as directory:
+            root = pathlib.Path(directory)
+            source = self.root / "US4AK3SB"
+            shutil.copy(source / "US4AK3SB.000", root / "US4AK3SB.000")
+            (root / "US4AK3SB" / "1" / "1").mkdir(parents=True)
+            shutil.copy(source / "US4AK3SB.001", root / "US4AK3SB" / "1" / "1" / "US4AK3SB.001")
+            exchange_set = ExchangeSet.scan(root)
+            self.assertEqual(exchange_set.cell_names(), ["US4AK3SB"])
+            self.assertEqual(exchange_set.update_paths("US4AK3SB"), [root / "US4AK3SB" / "1" / "1" / "US4AK3SB.001"])
+
+    def copy_edition(self, source, target, edition):
+        with DataFile.from_file(source) as data_file:
+            data_file[0]["DSID"].data = dict(data_file[0]["DSID"].data, EDTN=str(edition))
+            data_file.to_file(target)
+
+    def test_editions(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = pathlib.Path(directory)
+            source = self.root / "US4AK3SB"
+            for folder in ("1/0", "1/1", "2/0"):
+                (root / "US4AK3SB" / folder).mkdir(parents=True)
+            shutil.copy(source / "US4AK3SB.000", root / "US4AK3SB" / "1" / "0" / "US4AK3SB.000")
+            shutil.copy(source / "US4AK3SB.001", root / "US4AK3SB" / "1" / "1" / "US4AK3SB.001")
+            self.copy_edition(source / "US4AK3SB.000", root / "US4AK3SB" / "2" / "0" / "US4AK3SB.000", 2)
+            with self.assertLogs("navchart.s57.discovery", "WARNING"):
+                exchange_set = ExchangeSet.scan(root)
+            self.assertEqual(exchange_set.base_cells["US4AK3SB"], root / "US4AK3SB" / "2" / "0" / "US4AK3SB.000")
+            self.assertEqual(exchange_set.update_paths("US4AK3SB"), [])
+
+            # An update of edition 1 left in another folder is not applied to edition 2 either
+            shutil.rmtree(root / "US4AK3SB" / "1" / "0")
+            exchange_set = ExchangeSet.scan(root)
+            self.assertEqual(exchange_set.base_cells["US4AK3SB"], root / "US4AK3SB" / "2" / "0" / "US4AK3SB.000")
+            self.assertEqual(exchange_set.update_paths("US4AK3SB"), [])
+
+    def test_missing_update(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = pathlib.Path(directory)
+            source = self.root / "US3DE01M"
+            for name in ("US3DE01M.000", "US3DE01M.001", "US3DE01M.003"):
+                shutil.copy(source / name, root / name)
+            exchange_set = ExchangeSet.scan(root)
+            with self.assertLogs("navchart.s57.s57", "WARNING"):
+                self.assertEqual(exchange_set.update_paths("US3DE01M"), [root / "US3DE01M.001"])
+
+    def test_find_all_cells(self):
+        cells = {cell.path.stem: cell for cell in S57Cell.find_all_cells(self.root)}
+        self.assertEqual(len(cells), 6)
+        cell = cells["US3DE01M"]
+        self.assertEqual(len(cell.update_file_paths()), 7)
+        self.assertGreater(len(list(cell.features())), 0)
+        self.assertEqual(cell.metadata["DSID"]["UPDN"], "7")
+        self.assertEqual(cell.support_file_real_path("US3DE01A.TXT"), str(self.root / "US3DE01M" / "US3DE01A.TXT"))
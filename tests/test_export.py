@@ -0,0 +1,132 @@
+import io
+import json
+import struct
+import tempfile
+import unittest
+import pathlib
+from navchart.s57 import S57Cell, NumericMode
+from navchart.s57.iso8211 import DataFile
+from navchart.s57.s57 import S57DataFile
+from navchart.s57.export import geometry_to_wkb, geometry_to_wkt, geometry_to_geojson
+
+
+class TestGeometryEncoding(unittest.TestCase):
+
+    def test_wkb_layout(self):
+        self.assertEqual(geometry_to_wkb(("POINT", [1.5, -2.0])), struct.pack("<BIdd", 1, 1, 1.5, -2.0))
+        self.assertEqual(
+            geometry_to_wkb(("LINESTRING", [[0, 0], [10, 20]]), factors=(10, 10)),
+            struct.pack("<BII4d", 1, 2, 2, 0.0, 0.0, 1.0, 2.0)
+        )
+        self.assertEqual(
+            geometry_to_wkb(("POLYGON", [[[0, 0], [1, 0], [0, 0]]])),
+            struct.pack("<BIII6d", 1, 3, 1, 3, 0, 0, 1, 0, 0, 0)
+        )
+        self.assertEqual(
+            geometry_to_wkb(("MULTIPOINT", [[1, 2, 3], [4, 5, 6]])),
+            struct.pack("<BII", 1, 1004, 2) + struct.pack("<BI3d", 1, 1001, 1, 2, 3) + struct.pack("<BI3d", 1, 1001, 4, 5, 6)
+        )
+        self.assertIsNone(geometry_to_wkb(("NONE", [])))
+
+    def test_geojson_layout(self):
+        self.assertEqual(
+            geometry_to_geojson(("POINT", [10, 20, 3]), factors=(10, 10, 1)),
+            {"type": "Point", "coordinates": [1.0, 2.0, 3.0]}
+        )
+        self.assertEqual(
+            geometry_to_geojson(("POLYGON", [[[0, 0], [1, 0], [0, 0]]])),
+            {"type": "Polygon", "coordinates": [[[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]]]}
+        )
+        self.assertIsNone(geometry_to_geojson(("NONE", [])))
+
+    def test_wkt_layout(self):
+        self.assertEqual(geometry_to_wkt(("POINT", [1.5, -2.0, 7])), "POINT (1.5 -2.0)")
+        self.assertEqual(geometry_to_wkt(("MULTIPOINT", [[1, 2, 3], [4, 5, 6]])), "MULTIPOINT ((1 2),(4 5))")
+        self.assertEqual(
+            geometry_to_wkt(("POLYGON", [[[0, 0], [1, 0], [0, 0]], [[0, 0]]])),
+            "POLYGON ((0 0,1 0,0 0),(0 0))"
+        )
+
+
+class TestCellExport(unittest.TestCase):
+
+    def test_modes_agree(self):
+        path = pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000"
+        exports = {}
+        for mode in (NumericMode.DECIMAL, NumericMode.NUMPY, NumericMode.INT):
+            buffer = io.BytesIO()
+            count = S57Cell(path, numeric_mode=mode).export(buffer, "wkb")
+            lines = buffer.getvalue().decode("utf-8").splitlines()
+            self.assertEqual(len(lines), count)
+            exports[mode] = {line.split("\t")[0]: bytes.fromhex(line.split("\t")[2]) for line in lines}
+        self.assertEqual(exports[NumericMode.NUMPY], exports[NumericMode.INT])
+        self.assertEqual(exports[NumericMode.DECIMAL].keys(), exports[NumericMode.NUMPY].keys())
+        for fid, wkb in exports[NumericMode.DECIMAL].items():
+            self.assertEqual(len(wkb), len(exports[NumericMode.NUMPY][fid]))
+
+    def test_wkt_export_matches_features(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        buffer = io.BytesIO()
+        cell.export(buffer, "wkt", ["DEPARE", "SOUNDG"])
+        expected = [
+            "{}\t{}\t{}".format(f.identifier, f.layer, f.wkt) for f in cell.features(["DEPARE", "SOUNDG"]) if f.wkt
+        ]
+        self.assertEqual(buffer.getvalue().decode("utf-8").splitlines(), expected)
+        with self.assertRaises(ValueError):
+            cell.export(buffer, "geojson")
+
+
+class TestStreamingExport(unittest.TestCase):
+
+    # A cell without update files, so it is streamed rather than loaded
+    path = pathlib.Path(__file__).parent / "s57s/US5AK3MM/US5AK3MM.000"
+
+    def test_streamed_features_match_loaded(self):
+        streaming = S57Cell(self.path)
+        streamed = {f.identifier: (f.layer, f.attributes, f.wkt) for f in streaming.stream_features()}
+        self.assertFalse(streaming.updates_loaded_flag)
+        loaded = {f.identifier: (f.layer, f.attributes, f.wkt) for f in S57Cell(self.path).features()}
+        self.assertEqual(streamed, loaded)
+
+    def test_features_before_vector_records(self):
+        loaded = {f.identifier: f.wkt for f in S57Cell(self.path).features()}
+        with tempfile.TemporaryDirectory() as directory:
+            # The same cell with every feature record ahead of the vector records they point to
+            path = pathlib.Path(directory) / self.path.name
+            with DataFile.from_file(self.path) as data_file:
+                reordered = DataFile()
+                reordered.metadata = data_file.metadata
+                for record in sorted(data_file, key=lambda r: "VRID" in r):
+                    reordered.add_record(record)
+                reordered.to_file(path)
+            cell_data = S57DataFile(path)
+            streamed = {f.identifier: f.wkt for f in cell_data.iter_features()}
+            self.assertEqual(streamed, loaded)
+            # Streaming leaves the file able to load in full afterwards
+            self.assertEqual(len(cell_data.load().features), len(loaded))
+
+    def test_geojson_sequence(self):
+        buffer = io.BytesIO()
+        count = S57Cell(self.path, numeric_mode=NumericMode.INT).export_geojson(buffer, sequence=True)
+        texts = buffer.getvalue().decode("utf-8").split("\x1e")
+        self.assertEqual(texts[0], "")
+        self.assertEqual(len(texts) - 1, count)
+        features = [json.loads(text) for text in texts[1:]]
+        self.assertTrue(all(text.endswith("\n") for text in texts[1:]))
+        loaded = {f.identifier: f for f in S57Cell(self.path, numeric_mode=NumericMode.FLOAT).features()}
+        for feature in features:
+            self.assertEqual(feature["type"], "Feature")
+            expected = geometry_to_geojson(loaded[feature["id"]].geometry)
+            self.assertEqual(feature["geometry"] is None, expected is None)
+            if expected is not None:
+                self.assertEqual(feature["geometry"]["type"], expected["type"])
+            self.assertEqual(feature["properties"]["layer"], loaded[feature["id"]].layer)
+
+    def test_ndjson_layers(self):
+        buffer = io.BytesIO()
+        count = S57Cell(self.path).export_geojson(buffer, object_types="SOUNDG")
+        lines = buffer.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(len(lines), count)
+        self.assertTrue(lines)
+        self.assertEqual({json.loads(line)["properties"]["layer"] for line in lines}, {"SOUNDG"})
+
@@ -0,0 +1,58 @@
+import io
+import shutil
+import tempfile
+import unittest
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57.extract import extract_cell
+from navchart.s57.iso8211 import DataFile
+
+
+class TestExtract(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def setUp(self):
+        self.work_dir = pathlib.Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+    def test_everything_matches_source(self):
+        path = self.root / "US5AK3MM/US5AK3MM.000"
+        output = io.BytesIO()
+        self.assertEqual(extract_cell(path, output), sum(1 for record in DataFile.stream(path) if "FRID" in record))
+        with open(path, "rb") as h:
+            self.assertEqual(output.getvalue(), h.read())
+
+    def test_bbox(self):
+        cell = S57Cell(self.root / "US4AK3SB/US4AK3SB.000", update_paths=[])
+        west, south, east, north = cell.spatial_index().root[0:4]
+        bbox = (west, south, (west + east) / 2, (south + north) / 2)
+        target = self.work_dir / "US4AK3SX.000"
+        count = cell.extract(target, bbox=bbox)
+        expected = {feature.identifier: feature.wkt for feature in cell.features_in_bbox(*bbox)}
+        extract = S57Cell(target)
+        self.assertEqual(count, len(expected))
+        self.assertEqual({feature.identifier: feature.wkt for feature in extract.features()}, expected)
+        self.assertLess(target.stat().st_size, cell.path.stat().st_size)
+        records = list(DataFile.from_file(target))
+        self.assertEqual(records[0]["DSID"]["DSNM"], "US4AK3SX.000")
+        dssi = records[0]["DSSI"].data
+        self.assertEqual(dssi["NOMR"] + dssi["NOGR"], count)
+        self.assertEqual(dssi["NOIN"] + dssi["NOCN"] + dssi["NOED"], sum(1 for r in records if "VRID" in r))
+
+    def test_layers_and_feature_pointers(self):
+        cell = S57Cell(self.root / "US5AK3MM/US5AK3MM.000")
+        association = next(cell.features("C_ASSO"))
+        self.assertEqual(len(association.feature_references), 3)
+        member_layer = cell.feature(association.feature_references.key(0)).layer
+        target = self.work_dir / "US5AK3MM.000"
+        cell.extract(target, layers=["C_ASSO", member_layer])
+        extract = S57Cell(target)
+        self.assertEqual(sorted(extract.layers()), sorted({"C_ASSO", member_layer}))
+        kept = next(extract.features("C_ASSO")).feature_references
+        self.assertGreater(len(kept), 0)
+        self.assertTrue(all(kept.key(i) in extract._features for i in range(0, len(kept))))
+        cell.extract(target, layers=["C_ASSO"])
+        self.assertEqual(len(next(S57Cell(target).features("C_ASSO")).feature_references), 0)
@@ -0,0 +1,162 @@
+import decimal
+import io
+import unittest
+import pathlib
+from navchart.s57.iso8211 import DataStream, DataFile, DecoderPlan, Metadata, Record, iter_records
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestDataStream(unittest.TestCase):
+
+    def test_substream_shares_buffer(self):
+        buffer = b"abc\x1fdef\x1eghi"
+        stream = DataStream(buffer)
+        self.assertEqual(stream.read_str(1), "a")
+        sub = stream.substream(7)
+        self.assertIs(sub.data, buffer)
+        self.assertEqual(stream.read_str(3), "ghi")
+        self.assertTrue(stream.empty())
+        self.assertEqual(sub.read_str(DataStream.TO_UT), "bc")
+        self.assertEqual(sub.read_str(DataStream.TO_FT), "def")
+        self.assertTrue(sub.empty())
+
+    def test_read_does_not_pass_window(self):
+        stream = DataStream(b"0123456789", 2, 5)
+        self.assertEqual(stream.read(10), b"234")
+        self.assertTrue(stream.empty())
+        self.assertIsNone(DataStream(b"abc\x1f", 0, 3).read(DataStream.TO_UT))
+
+    def test_binary_int(self):
+        stream = DataStream(b"\x01\x02\xff\xff\xff\xff\xfe\xff")
+        self.assertEqual(stream.read_binary_int(2), 0x0201)
+        self.assertEqual(stream.read_binary_int(4, signed=True), -1)
+        self.assertEqual(stream.read_binary_int(2, signed=False), 0xfffe)
+
+
+class TestDataFile(unittest.TestCase):
+
+    def get_test_file(self, test_file_path):
+        p = pathlib.Path(__file__)
+        return p.parent / test_file_path
+
+    def test_mapped_file_matches_buffer(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        mapped = DataFile.from_file(path)
+        with open(path, "rb") as h:
+            buffered = DataFile.from_buffer(h.read())
+        self.assertEqual(len(mapped), len(buffered))
+        for a, b in zip(mapped, buffered):
+            self.assertEqual(list(a), list(b))
+            for tag in a:
+                self.assertEqual(a[tag].data, b[tag].data)
+
+    def test_lazy_fields_match_eager(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        eager = DataFile.from_file(path)
+        with DataFile.from_file(path, lazy=True) as lazy:
+            self.assertEqual(len(eager), len(lazy))
+            self.assertFalse(lazy[0]["DSID"].is_loaded())
+            self.assertEqual(lazy[0]["DSID"]["DSNM"], "US4AK3SB.000")
+            self.assertTrue(lazy[0]["DSID"].is_loaded())
+            self.assertFalse(lazy[-1]["FRID"].is_loaded())
+            for a, b in zip(eager, lazy):
+                self.assertEqual(list(a), list(b))
+                for tag in a:
+                    self.assertEqual(a[tag].data, b[tag].data)
+
+    def test_streamed_records_match_file(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        loaded = DataFile.from_file(path)
+        count = 0
+        for a, b in zip(loaded, iter_records(path)):
+            self.assertEqual(list(a), list(b))
+            self.assertEqual(a["0001"].data, b["0001"].data)
+            count += 1
+        self.assertEqual(count, len(loaded))
+        self.assertEqual(sum(1 for _ in DataFile.stream(path, lazy=True)), len(loaded))
+
+
+class TestWriter(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def write(self, data_file):
+        output = io.BytesIO()
+        data_file.to_file(output)
+        return output.getvalue()
+
+    def test_round_trip(self):
+        for path in sorted(self.root.glob("*/*.00[0-7]")):
+            with open(path, "rb") as h:
+                original = h.read()
+            for lazy in (False, True):
+                with self.subTest(path=path.name, lazy=lazy), DataFile.from_file(path, lazy=lazy) as data_file:
+                    self.assertEqual(self.write(data_file), original)
+
+    def test_wide_text(self):
+        # NATF values are UCS-2, with two byte terminators
+        data_file = DataFile.from_file(self.root / "US1AK90M/US1AK90M.000")
+        values = [record["NATF"].data for record in data_file if "NATF" in record]
+        self.assertIn([{"ATTL": 301, "ATVL": "Utqia\u0121vik"}], values)
+
+    def test_new_file(self):
+        metadata = Metadata()
+        metadata.add_control()
+        metadata.add_basic_field("DDF RECORD IDENTIFIER", "0001", "b12")
+        subfields = {"RCID": "b14", "NAME": "A", "VALU": "R", "CODE": "A(3)"}
+        metadata.add_array_field("Test", "TEST", subfields, False, "0001")
+        metadata.add_array_field("Coordinates", "SG2D", {"YCOO": "b24", "XCOO": "b24"}, True, "TEST")
+        data_file = DataFile(metadata)
+        for i in range(0, 3):
+            record = Record(metadata)
+            record["0001"] = i + 1
+            record["TEST"] = {"RCID": i, "NAME": "name {}".format(i), "VALU": decimal.Decimal("-1.25"), "CODE": "AB "}
+            record["SG2D"] = [{"YCOO": i, "XCOO": -i}, {"YCOO": 2, "XCOO": 3}]
+            data_file.add_record(record)
+        written = self.write(data_file)
+        read = DataFile.from_buffer(written)
+        self.assertEqual(len(read), 3)
+        self.assertEqual(read[2]["0001"].data, 3)
+        self.assertEqual(read[2]["TEST"].data, {
+            "RCID": 2, "NAME": "name 2", "VALU": decimal.Decimal("-1.25"), "CODE": "AB "
+        })
+        self.assertEqual(read[2]["SG2D"].data, [{"YCOO": 2, "XCOO": -2}, {"YCOO": 2, "XCOO": 3}])
+        self.assertEqual(read.metadata.control_field.data_tree, {"0001": ["TEST"], "TEST": ["SG2D"]})
+        self.assertEqual(self.write(read), written)
+
+
+class TestDecoderPlan(unittest.TestCase):
+
+    def test_fixed_binary_field(self):
+        plan = DecoderPlan([("YCOO", "b24"), ("XCOO", "b24")])
+        self.assertIsNotNone(plan.fixed)
+        stream = DataStream(b"\x01\x00\x00\x00\xff\xff\xff\xff\x02\x00\x00\x00\x03\x00\x00\x00\x1e")
+        self.assertEqual(plan.decode(stream), [{"YCOO": 1, "XCOO": -1}, {"YCOO": 2, "XCOO": 3}])
+
+    def test_fixed_field_terminator(self):
+        plan = DecoderPlan([("X", "b11")])
+        self.assertEqual(plan.decode(DataStream(b"\x01\x02\x1e")), [{"X": 1}, {"X": 2}])
+        self.assertEqual(plan.encode(plan.decode(DataStream(b"\x01\x02\x1e"))), b"\x01\x02")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_fixed_field_array_terminator(self):
+        array = DecoderPlan([("X", "b11")]).decode_array(DataStream(b"\x01\x02\x1e"))
+        self.assertEqual(array["X"].tolist(), [1, 2])
+
+    def test_mixed_field(self):
+        plan = DecoderPlan([("NAME", "B(40)"), ("RIND", "b11"), ("COMT", "A")])
+        self.assertIsNone(plan.fixed)
+        stream = DataStream(b"\x01\x02\x03\x04\x05\x07abc\x1f\x06\x07\x08\x09\x0a\x08\x1f\x1e")
+        self.assertEqual(plan.decode(stream), [
+            {"NAME": b"\x05\x04\x03\x02\x01", "RIND": 7, "COMT": "abc"},
+            {"NAME": b"\x0a\x09\x08\x07\x06", "RIND": 8, "COMT": None},
+        ])
+
+    def test_encode_reverses_decode(self):
+        plan = DecoderPlan([("NAME", "B(40)"), ("RIND", "b11"), ("COMT", "A")])
+        data = b"\x01\x02\x03\x04\x05\x07abc\x1f\x06\x07\x08\x09\x0a\x08\x1f"
+        self.assertEqual(plan.encode(plan.decode(DataStream(data + b"\x1e"))), data)
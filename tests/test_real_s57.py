@@ -1,6 +1,11 @@
 import unittest
 import pathlib
-from navchart.s57 import S57Cell
+from navchart.s57 import S57Cell, NumericMode, load_cells
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestRealS57s(unittest.TestCase):
@@ -38,3 +43,76 @@ class TestRealS57s(unittest.TestCase):
         path = self.get_test_file("s57s/US6LGBDE/US6LGBDE.000")
         cell = S57Cell(path)
         cell._load_updates()
+
+
+class TestNumericModes(unittest.TestCase):
+
+    def get_test_file(self, test_file_path):
+        p = pathlib.Path(__file__)
+        return p.parent / test_file_path
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_matches_decimal(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        exact = {f.identifier: f for f in S57Cell(path).features()}
+        arrays = {f.identifier: f for f in S57Cell(path, numeric_mode=NumericMode.NUMPY).features()}
+        self.assertEqual(exact.keys(), arrays.keys())
+        for fid in exact:
+            exact_type, exact_points = exact[fid].geometry
+            array_type, array_points = arrays[fid].geometry
+            self.assertEqual(exact_type, array_type)
+            if exact_type == "POLYGON":
+                self.assertEqual(len(exact_points), len(array_points))
+                for exact_ring, array_ring in zip(exact_points, array_points):
+                    numpy.testing.assert_allclose(numpy.array(exact_ring, dtype=float), array_ring)
+            elif exact_type != "NONE":
+                numpy.testing.assert_allclose(numpy.array(exact_points, dtype=float), array_points)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_geometry_is_raw_int32(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        cell = S57Cell(path, numeric_mode="numpy")
+        for feature in cell.features(["SOUNDG"]):
+            geometry = cell.geometry(feature.spatial_references[0]["NAME"])
+            self.assertEqual(geometry.geometry.dtype, numpy.int32)
+            self.assertEqual(geometry.geometry.shape[1], 3)
+            self.assertEqual(geometry.points.dtype, numpy.float64)
+
+    def test_float_and_int_modes(self):
+        path = self.get_test_file("s57s/US4AK3SB/US4AK3SB.000")
+        exact = S57Cell(path)
+        floats = S57Cell(path, numeric_mode=NumericMode.FLOAT)
+        ints = S57Cell(path, numeric_mode="int")
+        exact._load_updates()
+        floats._load_updates()
+        comf, somf = exact.multiplication_factors
+        self.assertIsInstance(floats.metadata["DSID"]["STED"], float)
+        for feature in exact.features(["SOUNDG"]):
+            name = feature.spatial_references[0]["NAME"]
+            for e, f, i in zip(exact.geometry(name).points, floats.geometry(name).points, ints.geometry(name).points):
+                self.assertAlmostEqual(float(e[0]), f[0])
+                self.assertAlmostEqual(float(e[2]), f[2])
+                self.assertIsInstance(i[0], int)
+                self.assertEqual(e[0] * comf, i[0])
+                self.assertEqual(e[2] * somf, i[2])
+
+
+class TestLoadCells(unittest.TestCase):
+
+    def get_test_file(self, test_file_path):
+        p = pathlib.Path(__file__)
+        return p.parent / test_file_path
+
+    def test_pool_matches_serial(self):
+        paths = [
+            self.get_test_file("s57s/US4AK3SB/US4AK3SB.000"),
+            self.get_test_file("s57s/US5AK3MM/US5AK3MM.000"),
+        ]
+        serial = list(load_cells(paths, workers=1))
+        pooled = list(load_cells(paths, workers=2))
+        self.assertEqual([c.path for c in serial], [c.path for c in pooled])
+        for a, b in zip(serial, pooled):
+            self.assertEqual(a.metadata["DSID"], b.metadata["DSID"])
+            wkt_a = {f.identifier: f.wkt for f in a.features()}
+            wkt_b = {f.identifier: f.wkt for f in b.features()}
+            self.assertEqual(wkt_a, wkt_b)
@@ -0,0 +1,324 @@
+import copy
+import os
+import pickle
+import shutil
+import tempfile
+import types
+import unittest
+import unittest.mock
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57 import catalogue, catalogue_values, compile_catalogue
+from navchart.s57.iso8211 import DataFile
+from navchart.s57.s57 import S57DataFile, S57FeatureUpdate, S57Object, S57Standard, SpatialPointerTable
+from navchart.s57.s57 import feature_key, geometry_key, split_feature_key, split_geometry_key
+
+
+class TestFeatureIndex(unittest.TestCase):
+
+    def get_cell(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        cell._load_updates()
+        return cell
+
+    def empty_update(self):
+        return types.SimpleNamespace(
+            features={},
+            geometries={},
+            feature_deletes=[],
+            geometry_deletes=[],
+            metadata={},
+            updates=[]
+        )
+
+    def test_layer_filter_matches_scan(self):
+        cell = self.get_cell()
+        for layers in (["SOUNDG"], ["DEPARE", "LNDARE"], "M_COVR"):
+            wanted = [layers] if isinstance(layers, str) else layers
+            expected = {f.identifier for f in cell.features() if f.layer in wanted}
+            self.assertTrue(expected)
+            self.assertEqual({f.identifier for f in cell.features(layers)}, expected)
+        self.assertIn("SOUNDG", cell.layers())
+
+    def test_index_follows_updates(self):
+        cell = self.get_cell()
+        named = [f for f in cell.features() if "OBJNAM" in f]
+        self.assertTrue(named)
+        target = named[0]
+        old_name = target["OBJNAM"]
+
+        # Rename through a feature update record
+        update = self.empty_update()
+        change = S57FeatureUpdate(cell.standard)
+        change.metadata = target.metadata
+        change.attributes = {"OBJNAM": "Renamed"}
+        update.updates.append(change)
+        cell._apply_update_file(update)
+        self.assertEqual([f.identifier for f in cell.features_by_attribute("OBJNAM", "Renamed")], [target.identifier])
+        self.assertNotIn(target.identifier, [f.identifier for f in cell.features_by_attribute("OBJNAM", old_name)])
+
+        # Delete the feature entirely
+        update = self.empty_update()
+        update.feature_deletes.append(target.record_id)
+        cell._apply_update_file(update)
+        self.assertEqual(list(cell.features_by_attribute("OBJNAM", "Renamed")), [])
+        self.assertNotIn(target.identifier, [f.identifier for f in cell.features([target.layer])])
+
+        # And insert it again
+        update = self.empty_update()
+        update.features[target.key] = target
+        cell._apply_update_file(update)
+        self.assertIn(target.identifier, [f.identifier for f in cell.features([target.layer])])
+
+
+class TestUpdateDiscovery(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s"
+
+    def test_updates_found_next_to_cell(self):
+        cell = S57Cell(self.root / "US3DE01M/US3DE01M.000")
+        cwd = os.getcwd()
+        try:
+            os.chdir(tempfile.gettempdir())
+            paths = cell.update_file_paths()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(paths, [self.root / "US3DE01M/US3DE01M.{:03d}".format(i) for i in range(1, 8)])
+        self.assertEqual(cell.update_no, 7)
+
+    def test_listing_is_cached(self):
+        cell = S57Cell(self.root / "US3DE01M/US3DE01M.000")
+        with unittest.mock.patch("os.scandir", wraps=os.scandir) as scandir:
+            cell.update_file_paths()
+            cell.update_file_paths()
+            self.assertEqual(scandir.call_count, 1)
+
+    def test_gap_stops_updates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = pathlib.Path(directory)
+            for extension in ("000", "001", "002", "004"):
+                shutil.copy(self.root / "US3DE01M/US3DE01M.{}".format(extension), directory)
+            cell = S57Cell(directory / "US3DE01M.000")
+            with self.assertLogs("navchart.s57.s57", "WARNING"):
+                paths = cell.update_file_paths()
+            self.assertEqual([path.name for path in paths], ["US3DE01M.001", "US3DE01M.002"])
+
+
+class TestIncrementalUpdates(unittest.TestCase):
+
+    root = pathlib.Path(__file__).parent / "s57s/US3DE01M"
+
+    def copy_files(self, directory, *extensions):
+        for extension in extensions:
+            shutil.copy(self.root / "US3DE01M.{}".format(extension), directory)
+
+    def contents(self, cell):
+        return {
+            feature.identifier: (feature.wkt, dict(feature.attributes))
+            for feature in cell.features()
+        }
+
+    def test_apply_new_updates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = pathlib.Path(directory)
+            self.copy_files(directory, "000", "001", "002", "003", "004", "005")
+            cell = S57Cell(directory / "US3DE01M.000")
+            before = self.contents(cell)
+            self.assertEqual(cell.update_no, "5")
+            self.assertEqual(cell.apply_new_updates(), [])
+            self.copy_files(directory, "006", "007")
+            applied = cell.apply_new_updates(keep_snapshot=True)
+            self.assertEqual([path.name for path in applied], ["US3DE01M.006", "US3DE01M.007"])
+            self.assertEqual(cell.update_no, "7")
+            self.assertEqual(len(cell.update_file_paths()), 7)
+            self.assertEqual(self.contents(cell), self.contents(S57Cell(self.root / "US3DE01M.000")))
+            self.assertEqual(cell.snapshots(), [5])
+            snapshot = cell.snapshot(5)
+            self.assertEqual(snapshot.update_no, "5")
+            self.assertEqual(self.contents(snapshot), before)
+            # Records the updates did not touch are shared with the snapshot
+            shared = [key for key in cell._features if cell._snapshots[5]["features"].get(key) is cell._features[key]]
+            self.assertGreater(len(shared), len(cell._features) // 2)
+            cell.discard_snapshots()
+            self.assertEqual(cell.snapshots(), [])
+
+
+class TestStandard(unittest.TestCase):
+
+    def test_catalogue_is_current(self):
+        with open(catalogue.__file__, "r", newline="") as h:
+            self.assertEqual(h.read(), compile_catalogue.compile_catalogue())
+        with open(catalogue_values.__file__, "r", newline="") as h:
+            self.assertEqual(h.read(), compile_catalogue.compile_catalogue_values())
+
+    def test_lookups_both_ways(self):
+        standard = S57Standard()
+        self.assertEqual(standard.attribute_name(2), "BCNSHP")
+        self.assertEqual(standard.attribute_name("2"), "BCNSHP")
+        self.assertEqual(standard.attribute_name("BCNSHP"), "BCNSHP")
+        self.assertEqual(standard.attribute_code("BCNSHP"), 2)
+        self.assertEqual(standard.attribute_code("2"), 2)
+        self.assertEqual(standard.object_type_code(standard.object_type(42)), 42)
+        self.assertEqual(standard.attribute_type("COLOUR"), "L")
+        self.assertEqual(standard.attribute_name("ZZZZZZ"), "ZZZZZZ")
+        with self.assertLogs("navchart.s57.s57", "WARNING"):
+            self.assertEqual(standard.attribute_name(65000), "65000")
+        with self.assertRaises(KeyError):
+            standard.attribute_code("ZZZZZZ")
+
+    def test_decode_attribute(self):
+        standard = S57Standard()
+        self.assertEqual(standard.attribute_values("BCNSHP")[1], "stake, pole, perch, post")
+        self.assertEqual(standard.decode_attribute(2, "1"), "stake, pole, perch, post")
+        self.assertEqual(standard.decode_attribute("COLOUR", "1,3"), ["white", "red"])
+        self.assertEqual(standard.decode_attribute("OBJNAM", "Harbour"), "Harbour")
+        self.assertEqual(standard.decode_attribute("BCNSHP", ""), "")
+
+
+class TestRecordKeys(unittest.TestCase):
+
+    def test_names_and_keys_agree(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        for feature in list(cell.features())[:50]:
+            self.assertIs(cell.feature(feature.identifier), feature)
+            self.assertIs(cell.feature(feature.key), feature)
+            for ref in feature.spatial_references:
+                geometry = cell.geometry(ref["NAME"])
+                self.assertEqual(geometry.identifier, ref["NAME"])
+                self.assertEqual(geometry.key, ref.key)
+        self.assertEqual(split_feature_key(feature_key(550, 123456789, 65535)), (550, 123456789, 65535))
+        self.assertEqual(split_geometry_key(geometry_key(130, 4294967295)), (130, 4294967295))
+
+
+class TestPointerTable(unittest.TestCase):
+
+    def get_table(self, standard, count):
+        table = SpatialPointerTable(standard)
+        for rcid in range(1, count + 1):
+            table.append_raw(130, rcid, 1, 1, 255)
+        return table
+
+    def test_rows_render_names(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        table = self.get_table(cell.standard, 3)
+        self.assertEqual(len(table), 3)
+        self.assertEqual([row["NAME"] for row in table], ["VE_1", "VE_2", "VE_3"])
+        self.assertEqual(table[-1]["ORNT"], 1)
+        self.assertEqual(table[1].to_dict(), {"NAME": "VE_2", "ORNT": 1, "USAG": 1, "MASK": 255})
+        self.assertEqual(len(SpatialPointerTable(cell.standard)), 0)
+
+    def test_updates_on_tables(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        table = self.get_table(cell.standard, 4)
+        inserted = S57Object.apply_update(1, 2, 1, table, self.get_table(cell.standard, 1))
+        self.assertEqual([row["NAME"] for row in inserted], ["VE_1", "VE_1", "VE_2", "VE_3", "VE_4"])
+        deleted = S57Object.apply_update(2, 2, 2, table)
+        self.assertEqual([row["NAME"] for row in deleted], ["VE_1", "VE_4"])
+        modified = S57Object.apply_update(3, 1, 1, table, self.get_table(cell.standard, 2)[1:])
+        self.assertEqual([row["NAME"] for row in modified], ["VE_2", "VE_2", "VE_3", "VE_4"])
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertIsNone(restored.standard)
+        self.assertEqual(restored, table)
+
+    def test_pickle_empty_tables(self):
+        for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                restored = pickle.loads(pickle.dumps(SpatialPointerTable(S57Standard()), protocol))
+                self.assertIsNone(restored.standard)
+                self.assertEqual(len(restored), 0)
+                self.assertEqual(restored, SpatialPointerTable())
+
+
+class TestTopologyResolver(unittest.TestCase):
+
+    def test_shared_edges_resolve_once(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        polygons = [f for f in cell.features() if f.primitive == 3 and f.geometry[0] == "POLYGON"]
+        self.assertTrue(polygons)
+        topology = cell.topology()
+        for ref in polygons[0].spatial_references:
+            self.assertIs(cell.geometry(ref.key).points, topology.chain(ref.key))
+
+    def test_interior_rings_are_closed(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US5AK3MM/US5AK3MM.000", numeric_mode="float")
+        holes = 0
+        for feature in cell.features():
+            if feature.primitive != 3 or feature.geometry[0] != "POLYGON":
+                continue
+            for ring in feature.geometry[1]:
+                points = [tuple(point[:2]) for point in ring]
+                self.assertEqual(points[0], points[-1])
+                # A ring closes only once, at its end
+                self.assertNotIn(points[0], points[1:-2])
+            holes += len(feature.geometry[1]) - 1
+        self.assertGreater(holes, 34)
+
+    def test_updates_refresh_geometry(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        point = next(f for f in cell.features("SOUNDG") if f.geometry[0] in ("POINT", "MULTIPOINT"))
+        old_wkt = point.wkt
+        node = copy.copy(cell.geometry(point.spatial_references[0].key))
+        node.geometry = [[x + 1, y + 1, *rest] for x, y, *rest in node.geometry]
+        update = types.SimpleNamespace(
+            features={},
+            geometries={node.key: node},
+            feature_deletes=[],
+            geometry_deletes=[],
+            metadata={},
+            updates=[]
+        )
+        cell._apply_update_file(update)
+        self.assertNotEqual(point.wkt, old_wkt)
+        self.assertIs(cell.geometry(node.key).points, cell.topology().chain(node.key))
+
+
+
+class TestUpdateApplication(unittest.TestCase):
+
+    directory = pathlib.Path(__file__).parent / "s57s/US3DE01M"
+    update_paths = [pathlib.Path(__file__).parent / "s57s/US3DE01M/US3DE01M.{:03d}".format(i) for i in range(1, 8)]
+
+    def get_updated_cell(self):
+        # The base cell is copied on its own so that only the updates applied here are loaded
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copy(self.directory / "US3DE01M.000", directory)
+            cell = S57Cell(pathlib.Path(directory) / "US3DE01M.000")
+            list(cell.features())
+        for path in self.update_paths:
+            cell._apply_update_file(
+                S57DataFile(path, *cell.multiplication_factors, numeric_mode=cell.numeric_mode).load()
+            )
+        return cell
+
+    def test_records_follow_update_instructions(self):
+        cell = self.get_updated_cell()
+        feature_records = {}
+        vector_records = {}
+        # Record update instructions (RUIN): 1 inserts, 2 deletes and 3 modifies a record
+        for path in self.update_paths:
+            with DataFile.from_file(path) as data_file:
+                for record in data_file:
+                    if "FRID" in record:
+                        feature_records[record["FRID"]["RCID"]] = record
+                    elif "VRID" in record:
+                        vector_records[geometry_key(record["VRID"]["RCNM"], record["VRID"]["RCID"])] = record
+        features = {feature.record_id: feature for feature in cell.features()}
+        for rcid, record in feature_records.items():
+            if record["FRID"]["RUIN"] == 2:
+                self.assertNotIn(rcid, features)
+            else:
+                self.assertEqual(features[rcid].metadata["RVER"], record["FRID"]["RVER"])
+        for key, record in vector_records.items():
+            if record["VRID"]["RUIN"] == 2:
+                self.assertNotIn(key, cell._geometries)
+            else:
+                self.assertEqual(cell.geometry(key).metadata["RVER"], record["VRID"]["RVER"])
+        self.assertEqual(cell.metadata["DSID"]["UPDN"], "7")
+
+    def test_modified_attributes(self):
+        cell = self.get_updated_cell()
+        with DataFile.from_file(self.directory / "US3DE01M.004") as data_file:
+            record = next(record for record in data_file if "ATTF" in record)
+        feature = next(feature for feature in cell.features() if feature.record_id == record["FRID"]["RCID"])
+        for attribute in record["ATTF"].data:
+            self.assertEqual(feature.attributes[cell.standard.attribute_name(attribute["ATTL"])], attribute["ATVL"])
@@ -0,0 +1,56 @@
+import random
+import unittest
+import pathlib
+from navchart.s57 import S57Cell
+from navchart.s57.spatial import STRTree, geometry_bounds, geometry_distance
+
+
+class TestSTRTree(unittest.TestCase):
+
+    def test_query_matches_scan(self):
+        rng = random.Random(42)
+        entries = []
+        for i in range(1000):
+            x = rng.uniform(-180, 180)
+            y = rng.uniform(-90, 90)
+            entries.append(((x, y, x + rng.uniform(0, 5), y + rng.uniform(0, 5)), i))
+        tree = STRTree(entries)
+        self.assertEqual(len(tree), 1000)
+        for _ in range(50):
+            x = rng.uniform(-180, 180)
+            y = rng.uniform(-90, 90)
+            box = (x, y, x + 10, y + 10)
+            expected = {
+                v for b, v in entries
+                if not (b[0] > box[2] or b[2] < box[0] or b[1] > box[3] or b[3] < box[1])
+            }
+            self.assertEqual(set(tree.query(*box)), expected)
+
+    def test_empty_tree(self):
+        self.assertEqual(list(STRTree([]).query(0, 0, 1, 1)), [])
+
+    def test_geometry_distance(self):
+        square = ("POLYGON", [[(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)]])
+        self.assertEqual(geometry_distance(square, 1, 1), 0)
+        self.assertAlmostEqual(geometry_distance(square, 3, 1), 1)
+        self.assertAlmostEqual(geometry_distance(("LINESTRING", [(0, 0), (0, 2)]), 1, 1), 1)
+        self.assertAlmostEqual(geometry_distance(("POINT", (3, 4)), 0, 0), 5)
+        self.assertEqual(geometry_bounds(square), (0, 0, 2, 2))
+
+
+class TestCellSpatialQueries(unittest.TestCase):
+
+    def test_bbox_and_near(self):
+        cell = S57Cell(pathlib.Path(__file__).parent / "s57s/US4AK3SB/US4AK3SB.000")
+        box = (-170.8, 57.1, -170.6, 57.2)
+        expected = set()
+        for feature in cell.features():
+            b = geometry_bounds(feature.geometry)
+            if b and not (b[0] > box[2] or b[2] < box[0] or b[1] > box[3] or b[3] < box[1]):
+                expected.add(feature.identifier)
+        self.assertTrue(expected)
+        self.assertEqual({f.identifier for f in cell.features_in_bbox(*box)}, expected)
+        near = list(cell.features_near(-170.7, 57.15, 0.05))
+        distances = [geometry_distance(f.geometry, -170.7, 57.15) for f in near]
+        self.assertEqual(distances, sorted(distances))
+        self.assertTrue(all(d <= 0.05 for d in distances))